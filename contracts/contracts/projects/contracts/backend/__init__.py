@@ -0,0 +1 @@
+# Backend helpers package
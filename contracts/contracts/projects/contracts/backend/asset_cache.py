@@ -0,0 +1,88 @@
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Iterable
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class AssetParamsCache:
+    """
+    Two-tier cache of credential ASA params keyed by asset ID.
+
+    Certificate params never change after minting except through an asset
+    config (acfg) transaction, so entries never expire by age; call
+    `invalidate(asset_id)` whenever an acfg for that asset is seen. The first
+    tier is an in-process LRU bounded to `max_entries`; if `path` is given, a
+    SQLite file behind it survives restarts and is refilled into memory on hit.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, path: str | None = None):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[int, dict] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS asset_params ("
+                "asset_id INTEGER PRIMARY KEY, params TEXT NOT NULL)"
+            )
+            self._db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def _remember(self, asset_id: int, params: dict) -> None:
+        self._memory[asset_id] = params
+        self._memory.move_to_end(asset_id)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, asset_id: int) -> dict | None:
+        with self._lock:
+            params = self._memory.get(asset_id)
+            if params is not None:
+                self._memory.move_to_end(asset_id)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT params FROM asset_params WHERE asset_id = ?", (asset_id,)
+                ).fetchone()
+                if row is not None:
+                    params = json.loads(row[0])
+                    self._remember(asset_id, params)
+            if params is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(params)
+
+    def put(self, asset_id: int, params: dict) -> None:
+        with self._lock:
+            self._remember(asset_id, dict(params))
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO asset_params (asset_id, params) VALUES (?, ?)",
+                    (asset_id, json.dumps(params)),
+                )
+                self._db.commit()
+
+    def invalidate(self, asset_id: int) -> None:
+        """Forget an asset, e.g. after an acfg changed its manager or reserve"""
+        self.invalidate_many([asset_id])
+
+    def invalidate_many(self, asset_ids: Iterable[int]) -> None:
+        asset_ids = list(asset_ids)
+        with self._lock:
+            for asset_id in asset_ids:
+                self._memory.pop(asset_id, None)
+            if self._db is not None:
+                self._db.executemany(
+                    "DELETE FROM asset_params WHERE asset_id = ?",
+                    [(asset_id,) for asset_id in asset_ids],
+                )
+                self._db.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._memory)}
@@ -0,0 +1,167 @@
+import logging
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Iterable
+
+from algosdk.logic import get_application_address
+from algosdk.v2client import algod
+
+from backend.credential_index import CredentialIndex
+from backend.follower import DEFAULT_CHECKPOINT_NAME, BlockChanges, CredentialSink, IndexSink, extract_changes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARTITION_ROUNDS = 10_000
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class BackfillReport:
+    """Throughput of one backfill run"""
+    rounds: int = 0
+    credentials: int = 0
+    partitions: int = 0
+    skipped_partitions: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rounds_per_second(self) -> float:
+        return self.rounds / self.seconds if self.seconds else 0.0
+
+    @property
+    def credentials_per_second(self) -> float:
+        return self.credentials / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Backfilled {self.rounds} rounds in {self.partitions} partitions "
+            f"({self.skipped_partitions} already done) in {self.seconds:.2f}s: "
+            f"{self.rounds_per_second:.1f} rounds/sec, "
+            f"{self.credentials_per_second:.1f} credentials/sec"
+        )
+
+
+def plan_partitions(first_round: int, last_round: int, partition_rounds: int) -> list[tuple[int, int]]:
+    """Split the inclusive range [first_round, last_round] into consecutive partitions"""
+    return [
+        (start, min(start + partition_rounds - 1, last_round))
+        for start in range(first_round, last_round + 1, partition_rounds)
+    ]
+
+
+def partition_checkpoint_name(start: int, end: int) -> str:
+    return f"backfill:{start}-{end}"
+
+
+def scan_partition(
+    algod_address: str,
+    algod_token: str,
+    app_id: int,
+    creators: list[str],
+    start: int,
+    end: int,
+) -> list[BlockChanges]:
+    """Read rounds [start, end] from algod and return the non-empty changes, in order"""
+    client = algod.AlgodClient(algod_token, algod_address)
+    found = []
+    for round_num in range(start, end + 1):
+        block = client.block_info(round_num=round_num)["block"]
+        changes = extract_changes(block, round_num, app_id, creators)
+        if changes:
+            found.append(changes)
+    return found
+
+
+def backfill(
+    sink: CredentialSink,
+    algod_address: str,
+    algod_token: str,
+    app_id: int,
+    first_round: int,
+    last_round: int,
+    creators: Iterable[str] = (),
+    partition_rounds: int = DEFAULT_PARTITION_ROUNDS,
+    workers: int = DEFAULT_WORKERS,
+) -> BackfillReport:
+    """
+    Scan [first_round, last_round] in parallel and merge it into `sink`.
+
+    Partitions are scanned by a process pool but applied to the sink strictly
+    in round order, because transfers and reconfigurations must land after the
+    issuance they refer to. Each applied partition gets its own checkpoint, so
+    rerunning an interrupted backfill only rescans unfinished partitions. Once
+    everything is applied, a live follower without a checkpoint is pointed at
+    `last_round` so it continues from there.
+    """
+    creators = sorted(set(creators) | {get_application_address(app_id)})
+    report = BackfillReport()
+    started = time.monotonic()
+
+    partitions = plan_partitions(first_round, last_round, partition_rounds)
+    todo = []
+    for start, end in partitions:
+        if sink.get_checkpoint(partition_checkpoint_name(start, end)) == end:
+            report.skipped_partitions += 1
+        else:
+            todo.append((start, end))
+    report.partitions = len(todo)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(scan_partition, algod_address, algod_token, app_id, creators, start, end): (start, end)
+            for start, end in todo
+        }
+        completed: dict[tuple[int, int], list[BlockChanges]] = {}
+        next_index = 0
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                completed[futures[future]] = future.result()
+            # Apply every partition whose predecessors are already applied
+            while next_index < len(todo) and todo[next_index] in completed:
+                start, end = todo[next_index]
+                for changes in completed.pop((start, end)):
+                    sink.apply_changes(changes)
+                    report.credentials += len(changes.issued)
+                sink.set_checkpoint(partition_checkpoint_name(start, end), end)
+                report.rounds += end - start + 1
+                next_index += 1
+                logger.info(f"Applied partition {start}-{end}")
+
+    if sink.get_checkpoint(DEFAULT_CHECKPOINT_NAME) is None:
+        sink.set_checkpoint(DEFAULT_CHECKPOINT_NAME, last_round)
+    report.seconds = time.monotonic() - started
+    return report
+
+
+def app_creation_round(idx_client, app_id: int) -> int:
+    """Look up the round the app was created in from the indexer"""
+    return idx_client.applications(app_id)["application"]["created-at-round"]
+
+
+if __name__ == "__main__":
+    from backend.blockchain import (
+        ALGOD_URL,
+        CREDENTIAL_APP_ID,
+        INSTITUTION_ADDRESS,
+        client,
+        idx_client,
+    )
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "credentials.db"
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_WORKERS
+    report = backfill(
+        IndexSink(CredentialIndex(db_path)),
+        ALGOD_URL,
+        client.algod_token,
+        CREDENTIAL_APP_ID,
+        first_round=app_creation_round(idx_client, CREDENTIAL_APP_ID),
+        last_round=client.status()["last-round"],
+        creators=[INSTITUTION_ADDRESS] if INSTITUTION_ADDRESS else [],
+        workers=workers,
+    )
+    print(report)
@@ -0,0 +1,96 @@
+import base64
+from dataclasses import dataclass
+from typing import Iterable
+
+from algosdk import abi
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, EmptySigner
+from algosdk.encoding import encode_address
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from backend.credential_index import CredentialIndex
+from backend.follower import ABI_RETURN_PREFIX
+from backend.revocation import RevocationBitmap
+
+VERIFY_CREDENTIALS = abi.Method.from_signature("verify_credentials(uint64[])(uint64,bool,address)[]")
+ZERO_ADDRESS = encode_address(bytes(32))
+
+# A known credential takes two resource slots (its registry box and its
+# asset) and an app call has 8, shared across the group, so one simulated
+# group of 16 calls covers 64 credentials
+IDS_PER_CALL = 4
+MAX_GROUP_SIZE = 16
+IDS_PER_GROUP = IDS_PER_CALL * MAX_GROUP_SIZE
+
+
+@dataclass
+class CredentialCheck:
+    """On-chain verdict for one credential"""
+    asset_id: int
+    valid: bool
+    holder: str | None
+
+
+def _chunks(items: list, size: int) -> Iterable[list]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _simulate_group(client, app_id: int, sender: str, params, asset_ids: list[int]) -> list[CredentialCheck]:
+    atc = AtomicTransactionComposer()
+    for chunk in _chunks(asset_ids, IDS_PER_CALL):
+        atc.add_method_call(app_id, VERIFY_CREDENTIALS, sender, params, EmptySigner(), method_args=[chunk])
+    request = SimulateRequest(
+        txn_groups=[SimulateRequestTransactionGroup(txns=atc.gather_signatures())],
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True,
+    )
+    group = client.simulate_transactions(request)["txn-groups"][0]
+    if group.get("failure-message"):
+        raise RuntimeError(group["failure-message"])
+
+    checks = []
+    for result in group["txn-results"]:
+        raw = base64.b64decode(result["txn-result"]["logs"][-1])
+        if not raw.startswith(ABI_RETURN_PREFIX):
+            raise ValueError("verify_credentials returned no result")
+        for asset_id, valid, holder in VERIFY_CREDENTIALS.returns.type.decode(raw[len(ABI_RETURN_PREFIX):]):
+            checks.append(CredentialCheck(asset_id, valid, holder if holder != ZERO_ADDRESS else None))
+    return checks
+
+
+def simulate_verify_credentials(
+    client,
+    app_id: int,
+    asset_ids: Iterable[int],
+    sender: str,
+    params_provider=None,
+    index: CredentialIndex | None = None,
+    revocations: RevocationBitmap | None = None,
+) -> list[CredentialCheck]:
+    """
+    Verify any number of credentials with `verify_credentials`, run through
+    simulate only: nothing is signed or submitted and no fee is paid. IDs are
+    packed into groups of up to IDS_PER_GROUP, one algod round trip each.
+    `sender` only has to be a funded account, as simulate still checks the
+    fee it would pay. Results come back in the order of `asset_ids`.
+
+    With an `index` giving each credential's serial and a downloaded
+    `revocations` bitmap, credentials already known to be revoked are
+    answered locally and never simulated. Their `holder` is None: the index
+    tracks the current holder, not the one the registry records.
+    """
+    asset_ids = list(asset_ids)
+    known = {}
+    if index is not None and revocations is not None:
+        for asset_id in asset_ids:
+            record = index.get_record(asset_id)
+            if record is not None and record.serial is not None and revocations.is_revoked(record.serial):
+                known[asset_id] = CredentialCheck(asset_id, False, None)
+
+    pending = [asset_id for asset_id in dict.fromkeys(asset_ids) if asset_id not in known]
+    if pending:
+        params = params_provider.get() if params_provider else client.suggested_params()
+        for group_ids in _chunks(pending, IDS_PER_GROUP):
+            for check in _simulate_group(client, app_id, sender, params, group_ids):
+                known[check.asset_id] = check
+    return [known[asset_id] for asset_id in asset_ids]
@@ -1,34 +1,127 @@
-from algosdk.v2client import algod, indexer
-from algosdk.transaction import AssetCreateTxn, AssetTransferTxn, wait_for_confirmation
+from algosdk.transaction import (
+    AssetCreateTxn,
+    AssetTransferTxn,
+    assign_group_id,
+)
 from algosdk.account import address_from_private_key
+from algosdk.constants import TX_GROUP_LIMIT
+from algosdk.error import AlgodHTTPError, IndexerHTTPError
+from backend.asset_cache import AssetParamsCache
+from backend.clients import (
+    DEFAULT_ALGOD_URL,
+    DEFAULT_INDEXER_URL,
+    endpoints_from_env,
+    make_algod_client,
+    make_indexer_client,
+)
+from backend.confirmation import ConfirmationTracker
+from backend.credential_index import CredentialIndex
+from backend.follower import DEFAULT_CHECKPOINT_NAME
+from backend.freshness import IndexerRoundTracker
+from backend.pagination import iter_pages
+from backend.params import SuggestedParamsProvider
+from backend.registry import ARC19_TEMPLATE_URL
+from backend.scheduler import RequestScheduler, ScheduledClient
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+import threading
+from typing import Iterable, Iterator
 import os
 
-ALGOD_URL = "https://testnet-api.algonode.cloud"
-INDEXER_URL = "https://testnet-idx.algonode.cloud"
+# Several comma-separated endpoints per service are rotated, failed over and hedged
+ALGOD_URLS = endpoints_from_env("ALGOD_URLS", DEFAULT_ALGOD_URL)
+INDEXER_URLS = endpoints_from_env("INDEXER_URLS", DEFAULT_INDEXER_URL)
+ALGOD_URL = ALGOD_URLS[0]
+INDEXER_URL = INDEXER_URLS[0]
+# Deployed CredentialVerifier app and the institution account that issues through it
+CREDENTIAL_APP_ID = int(os.getenv("CREDENTIAL_APP_ID", "755789606"))
+INSTITUTION_ADDRESS = os.getenv("INSTITUTION_ADDRESS")
 
-client = algod.AlgodClient("", ALGOD_URL)
-idx_client = indexer.IndexerClient("", INDEXER_URL)
+client = make_algod_client(ALGOD_URLS)
+# Public indexers throttle hard, so every indexer call goes through an AIMD scheduler
+idx_client = ScheduledClient(make_indexer_client(INDEXER_URLS), RequestScheduler())
+# Shared across every helper (and thread) so bulk runs don't refetch params per txn
+params_provider = SuggestedParamsProvider(client)
+# One block follower resolves confirmations for every in-flight transaction
+confirmation_tracker = ConfirmationTracker(client, params_provider)
+# Credential ASA params rarely change, so verification reads are served from here
+credential_cache = AssetParamsCache(path=os.getenv("CREDENTIAL_CACHE_PATH"))
+# Local mirror kept current by backend.follower; when configured it answers
+# credential listings without any network call
+credential_index = CredentialIndex(os.environ["CREDENTIAL_INDEX_PATH"]) if os.getenv("CREDENTIAL_INDEX_PATH") else None
+# Reads given a `min_round` the indexer hasn't reached yet are served by algod
+indexer_round = IndexerRoundTracker(lambda: idx_client.health())
 
-def mint_credential_nft(
-    institution_private_key: str,
-    student_address: str,
-    certificate_name: str,
-    metadata_url: str
-) -> int:
+# Number of atomic groups submitted concurrently by mint_credentials_batch
+DEFAULT_GROUPS_IN_FLIGHT = 8
+# Unit name every credential NFT is minted with
+CREDENTIAL_UNIT_NAME = "CERT"
+# Holdings requested per indexer page when listing an account's assets
+ACCOUNT_ASSETS_PAGE_SIZE = 1000
+# Concurrent indexer lookups made by get_credentials_details on cache misses
+DETAILS_FETCH_CONCURRENCY = 8
+# Without a `min_round`, the local index only answers within this many rounds of algod
+LOCAL_INDEX_MAX_LAG = 5
+
+
+@dataclass
+class MintResult:
+    """Outcome of minting one record in a batch"""
+    student_address: str
+    certificate_name: str
+    asset_id: int | None = None
+    txid: str | None = None
+    error: str | None = None
+    confirmed_round: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.asset_id is not None
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of delivering one credential to a custodial student wallet"""
+    student_address: str
+    asset_id: int
+    txid: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.txid is not None
+
+
+_write_round_lock = threading.Lock()
+_last_write_round = 0
+
+def _record_write(confirmed_round: int) -> int:
+    global _last_write_round
+    with _write_round_lock:
+        _last_write_round = max(_last_write_round, confirmed_round)
+    return confirmed_round
+
+def last_write_round() -> int:
     """
-    Function 1: Mint credential NFT and return its Asset ID.
-    The student must opt-in BEFORE the transfer (which happens after minting).
+    Highest round any write from this process was confirmed in. Pass it as
+    `min_round` to the read helpers to read your own writes.
     """
-    institution_address = address_from_private_key(institution_private_key)
-    params = client.suggested_params()
-    
-    # Create asset (NFT) with exactly 1 supply
-    txn = AssetCreateTxn(
+    return _last_write_round
+
+def _credential_create_txn(
+    institution_address: str,
+    certificate_name: str,
+    metadata_url: str,
+    params
+) -> AssetCreateTxn:
+    """Build the AssetCreateTxn for a single credential NFT (exactly 1 supply)"""
+    return AssetCreateTxn(
         sender=institution_address,
         total=1,
         decimals=0,
         default_frozen=False,
-        unit_name="CERT",
+        unit_name=CREDENTIAL_UNIT_NAME,
         asset_name=certificate_name,
         manager=institution_address,
         reserve=institution_address,
@@ -37,16 +130,103 @@ def mint_credential_nft(
         url=metadata_url,
         sp=params
     )
+
+def mint_credential_nft(
+    institution_private_key: str,
+    student_address: str,
+    certificate_name: str,
+    metadata_url: str
+) -> int:
+    """
+    Function 1: Mint credential NFT and return its Asset ID.
+    The student must opt-in BEFORE the transfer (which happens after minting).
+    """
+    institution_address = address_from_private_key(institution_private_key)
+    params = params_provider.get()
+    
+    # Create asset (NFT) with exactly 1 supply
+    txn = _credential_create_txn(
+        institution_address, certificate_name, metadata_url, params
+    )
     
     signed_txn = txn.sign(institution_private_key)
     txid = client.send_transaction(signed_txn)
     
     # Wait for confirmation
-    confirmed_txn = wait_for_confirmation(client, txid, 4)
-    asset_id = confirmed_txn["asset-index"]
+    _record_write(confirmation_tracker.wait(txid, params.last))
+    asset_id = client.pending_transaction_info(txid)["asset-index"]
     
     return asset_id
 
+def _chunked(records: Iterable[tuple], size: int) -> Iterator[list]:
+    """Yield consecutive lists of at most `size` records"""
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+def _mint_group(
+    institution_private_key: str,
+    institution_address: str,
+    group: list,
+) -> list:
+    """Sign, send and confirm one atomic group of credential mints.
+
+    Every transaction in an atomic group succeeds or fails together, so an
+    error is reported against every record in the group.
+    """
+    results = [
+        MintResult(student_address=student, certificate_name=name)
+        for student, name, _ in group
+    ]
+    try:
+        params = params_provider.get()
+        txns = [
+            _credential_create_txn(institution_address, name, url, params)
+            for _, name, url in group
+        ]
+        assign_group_id(txns)
+        signed_txns = [txn.sign(institution_private_key) for txn in txns]
+        client.send_transactions(signed_txns)
+
+        # The whole group lands in the same round, so one wait is enough
+        confirmed_round = _record_write(confirmation_tracker.wait(signed_txns[0].get_txid(), params.last))
+        for result, signed_txn in zip(results, signed_txns):
+            txid = signed_txn.get_txid()
+            result.txid = txid
+            result.confirmed_round = confirmed_round
+            result.asset_id = client.pending_transaction_info(txid)["asset-index"]
+    except Exception as e:
+        for result in results:
+            result.asset_id = None
+            result.error = str(e)
+    return results
+
+def mint_credentials_batch(
+    institution_private_key: str,
+    records: Iterable[tuple],
+    groups_in_flight: int = DEFAULT_GROUPS_IN_FLIGHT,
+) -> list:
+    """
+    Mint many credential NFTs using atomic groups of up to 16 AssetCreateTxns.
+
+    `records` is an iterable of (student_address, certificate_name, metadata_url)
+    tuples. Up to `groups_in_flight` groups are submitted and awaited
+    concurrently, so total time scales with the number of groups rather than
+    the number of students. Returns one MintResult per record, in input order;
+    records whose group failed carry an `error` instead of an `asset_id`.
+    """
+    institution_address = address_from_private_key(institution_private_key)
+    groups = _chunked(records, TX_GROUP_LIMIT)
+
+    with ThreadPoolExecutor(max_workers=groups_in_flight) as executor:
+        group_results = executor.map(
+            lambda group: _mint_group(
+                institution_private_key, institution_address, group
+            ),
+            groups,
+        )
+        return [result for results in group_results for result in results]
+
 def send_credential_nft(
     institution_private_key: str,
     student_address: str,
@@ -54,48 +234,326 @@ def send_credential_nft(
 ) -> str:
     """Helper to transfer the NFT after student has opted in"""
     institution_address = address_from_private_key(institution_private_key)
-    params = client.suggested_params()
+    params = params_provider.get()
     
     transfer_txn = AssetTransferTxn(
         sender=institution_address,
         index=asset_id,
-        amount=1,
+        amt=1,
         receiver=student_address,
         sp=params
     )
     
     signed_txn = transfer_txn.sign(institution_private_key)
     txid = client.send_transaction(signed_txn)
-    wait_for_confirmation(client, txid, 4)
+    _record_write(confirmation_tracker.wait(txid, params.last))
     return txid
 
 def opt_in_to_asset(student_private_key: str, asset_id: int) -> str:
     """Function 4: Student opts in to receive NFT"""
     student_address = address_from_private_key(student_private_key)
-    params = client.suggested_params()
+    params = params_provider.get()
     
     # Opt-in is an AssetTransferTxn to oneself with amount 0
     txn = AssetTransferTxn(
         sender=student_address,
         index=asset_id,
-        amount=0,
+        amt=0,
         receiver=student_address,
         sp=params
     )
     
     signed_txn = txn.sign(student_private_key)
     txid = client.send_transaction(signed_txn)
-    wait_for_confirmation(client, txid, 4)
+    _record_write(confirmation_tracker.wait(txid, params.last))
     return txid
 
-def get_student_credentials(student_address: str) -> list:
-    """Function 2: Fetch all credentials belonging to a wallet address"""
-    response = idx_client.account_assets(student_address)
-    # Only return assets where amount > 0 (actually owned)
-    assets = [a for a in response.get("assets", []) if a["amount"] > 0]
-    return assets
-
-def get_credential_details(asset_id: int) -> dict:
-    """Function 3: Fetch details of a single credential by its Asset ID"""
-    response = idx_client.asset_info(asset_id)
-    return response.get("asset", {}).get("params", {})
+def deliver_credential(
+    institution_private_key: str,
+    student_private_key: str,
+    asset_id: int
+) -> str:
+    """
+    Opt a custodial student wallet in and transfer the NFT in one atomic group.
+
+    Both keys sign their own transaction, so delivery is submitted once and
+    confirmed once instead of waiting for opt_in_to_asset and then
+    send_credential_nft. Returns the txid of the transfer.
+    """
+    institution_address = address_from_private_key(institution_private_key)
+    student_address = address_from_private_key(student_private_key)
+    params = params_provider.get()
+
+    opt_in_txn = AssetTransferTxn(
+        sender=student_address,
+        index=asset_id,
+        amt=0,
+        receiver=student_address,
+        sp=params
+    )
+    transfer_txn = AssetTransferTxn(
+        sender=institution_address,
+        index=asset_id,
+        amt=1,
+        receiver=student_address,
+        sp=params
+    )
+    assign_group_id([opt_in_txn, transfer_txn])
+
+    signed_txns = [
+        opt_in_txn.sign(student_private_key),
+        transfer_txn.sign(institution_private_key),
+    ]
+    client.send_transactions(signed_txns)
+    txid = signed_txns[1].get_txid()
+    _record_write(confirmation_tracker.wait(txid, params.last))
+    return txid
+
+def deliver_credentials_batch(
+    institution_private_key: str,
+    deliveries: Iterable[tuple],
+    groups_in_flight: int = DEFAULT_GROUPS_IN_FLIGHT,
+) -> list:
+    """
+    Deliver many credentials with deliver_credential, several groups at a time.
+
+    `deliveries` is an iterable of (student_private_key, asset_id) tuples. Each
+    delivery stays its own group so one student's failure doesn't undo the
+    others. Returns one DeliveryResult per delivery, in input order.
+    """
+    def deliver(delivery: tuple) -> DeliveryResult:
+        student_private_key, asset_id = delivery
+        result = DeliveryResult(
+            student_address=address_from_private_key(student_private_key),
+            asset_id=asset_id,
+        )
+        try:
+            result.txid = deliver_credential(
+                institution_private_key, student_private_key, asset_id
+            )
+        except Exception as e:
+            result.error = str(e)
+        return result
+
+    with ThreadPoolExecutor(max_workers=groups_in_flight) as executor:
+        return list(executor.map(deliver, deliveries))
+
+def iter_student_credentials(
+    student_address: str,
+    unit_name: str | None = None,
+    page_size: int = ACCOUNT_ASSETS_PAGE_SIZE,
+) -> Iterator[dict]:
+    """
+    Stream the assets held by a wallet address, one indexer page at a time.
+
+    Every page is walked (the next one is prefetched while the caller handles
+    the current one) and only holdings with amount > 0 are yielded. Pass
+    `unit_name=CREDENTIAL_UNIT_NAME` to keep only credential NFTs.
+    """
+    pages = iter_pages(
+        lambda next_token: indexer_round.observe(idx_client.lookup_account_assets(
+            student_address, limit=page_size, next_page=next_token
+        ))
+    )
+    for page in pages:
+        # Only return assets where amount > 0 (actually owned)
+        owned = [h for h in page.get("assets", []) if h["amount"] > 0]
+        if unit_name is not None:
+            details = get_credentials_details(h["asset-id"] for h in owned)
+            owned = [
+                h for h in owned
+                if details.get(h["asset-id"], {}).get("unit-name") == unit_name
+            ]
+        yield from owned
+
+def _with_unit_name(holdings: list, unit_name: str | None) -> list:
+    if unit_name is None:
+        return holdings
+    return [h for h in holdings if h["params"].get("unit-name") == unit_name]
+
+def _local_student_credentials(student_address: str, unit_name: str | None, min_round: int | None) -> list | None:
+    """
+    Holdings from the local index, or None when it can't answer: it must have
+    followed the chain to `min_round`, or without one to within
+    LOCAL_INDEX_MAX_LAG rounds of algod and past this process's own writes.
+    """
+    # The index only mirrors credentials, so it can't list a wallet's other assets
+    if credential_index is None or unit_name is None:
+        return None
+    checkpoint = credential_index.get_checkpoint(DEFAULT_CHECKPOINT_NAME)
+    if checkpoint is None:
+        return None
+    if min_round is None:
+        # A follower that stopped leaves the index stale with nothing to say so
+        min_round = max(last_write_round(), client.status()["last-round"] - LOCAL_INDEX_MAX_LAG)
+    if checkpoint < min_round:
+        return None
+    holdings = [
+        {**h, "params": credential_index.get_credential_details(h["asset-id"])}
+        for h in credential_index.get_student_credentials(student_address)
+    ]
+    return _with_unit_name(holdings, unit_name)
+
+def _algod_student_credentials(student_address: str, unit_name: str | None, page_size: int) -> list | None:
+    """
+    Holdings from algod's live account state, params included, or None when
+    the node doesn't serve /v2/accounts/{address}/assets.
+    """
+    pages = iter_pages(
+        lambda next_token: client.account_assets_info(
+            student_address, limit=page_size, next_page=next_token
+        )
+    )
+    holdings = []
+    try:
+        for page in pages:
+            for entry in page.get("asset-holdings") or []:
+                holding = entry["asset-holding"]
+                if holding["amount"] <= 0:
+                    continue
+                params = entry.get("asset-params")
+                if params is not None and cacheable_params(params):
+                    credential_cache.put(holding["asset-id"], params)
+                holdings.append({**holding, "params": params})
+    except AlgodHTTPError as e:
+        if e.code in (404, 501):
+            return None
+        raise
+
+    # Params are only missing for destroyed assets; fetch those in one batch
+    missing = get_credentials_details(h["asset-id"] for h in holdings if h["params"] is None)
+    for h in holdings:
+        if h["params"] is None:
+            h["params"] = missing.get(h["asset-id"], {})
+    return _with_unit_name(holdings, unit_name)
+
+def _indexer_student_credentials(
+    student_address: str, unit_name: str | None, min_round: int | None, page_size: int
+) -> list:
+    holdings = list(iter_student_credentials(student_address, page_size=page_size))
+    details = get_credentials_details((h["asset-id"] for h in holdings), min_round)
+    holdings = [{**h, "params": details.get(h["asset-id"], {})} for h in holdings]
+    return _with_unit_name(holdings, unit_name)
+
+def get_student_credentials(
+    student_address: str,
+    unit_name: str | None = None,
+    min_round: int | None = None,
+    page_size: int = ACCOUNT_ASSETS_PAGE_SIZE,
+) -> list:
+    """
+    Function 2: Fetch all credentials belonging to a wallet address.
+    Returns the holdings with amount > 0, each an asset holding dict
+    ("asset-id", "amount", ...) plus a "params" key with the asset's params.
+    They are read from the local index when it is fresh enough, else algod,
+    else the indexer. `unit_name` keeps only assets with that unit name.
+    """
+    holdings = _local_student_credentials(student_address, unit_name, min_round)
+    if holdings is None:
+        holdings = _algod_student_credentials(student_address, unit_name, page_size)
+    if holdings is None:
+        holdings = _indexer_student_credentials(student_address, unit_name, min_round, page_size)
+    return holdings
+
+def cacheable_params(params: dict) -> bool:
+    """
+    Blank pool credentials (ARC-19 template URL, reserve still the creating
+    app) change params when they are assigned, which processes other than
+    the assigning one would never hear of; everything else only changes
+    through an acfg the follower invalidates on.
+    """
+    return not (params.get("url") == ARC19_TEMPLATE_URL and params.get("reserve") == params.get("creator"))
+
+def _is_not_found(error: Exception) -> bool:
+    # The SDK's own IndexerClient raises without a status; only the message tells a 404 apart
+    return getattr(error, "code", None) == 404 or "no assets found" in str(error)
+
+def _fetch_credential_details(asset_id: int, min_round: int | None = None) -> dict:
+    try:
+        if indexer_round.caught_up(min_round):
+            response = indexer_round.observe(idx_client.asset_info(asset_id))
+            params = response.get("asset", {}).get("params", {})
+        else:
+            params = client.asset_info(asset_id).get("params", {})
+    except (AlgodHTTPError, IndexerHTTPError) as e:
+        if _is_not_found(e):
+            return {}
+        raise
+    if cacheable_params(params):
+        credential_cache.put(asset_id, params)
+    return params
+
+def get_credential_details(asset_id: int, min_round: int | None = None) -> dict:
+    """
+    Function 3: Fetch details of a single credential by its Asset ID
+    (empty if no such asset exists).
+    With `min_round` (e.g. the round it was minted in) the read goes to algod
+    while the indexer is behind that round.
+    """
+    params = credential_cache.get(asset_id)
+    if params is None:
+        params = _fetch_credential_details(asset_id, min_round)
+    return params
+
+def _algod_amount(address: str, asset_id: int) -> int:
+    try:
+        return client.account_asset_info(address, asset_id)["asset-holding"]["amount"]
+    except AlgodHTTPError as e:
+        if e.code == 404:
+            return 0
+        raise
+
+def holds_credential(address: str, asset_id: int, min_round: int | None = None) -> bool:
+    """Whether `address` currently holds a credential; algod answers while the indexer is behind `min_round`"""
+    if not indexer_round.caught_up(min_round):
+        return _algod_amount(address, asset_id) > 0
+    page = indexer_round.observe(idx_client.lookup_account_assets(address, asset_id=asset_id))
+    return any(h["asset-id"] == asset_id and h["amount"] > 0 for h in page.get("assets", []))
+
+def get_credential_holder(asset_id: int, min_round: int | None = None) -> str | None:
+    """
+    Return the address currently holding a credential, if any.
+    Algod can't search balances by asset, so while the indexer is behind
+    `min_round` only the accounts a credential can be at after issuance are
+    checked there: its reserve (the student, for app-issued credentials) and
+    its creator. Anyone else falls back to the indexer.
+    """
+    if not indexer_round.caught_up(min_round):
+        params = get_credential_details(asset_id, min_round)
+        for candidate in dict.fromkeys(filter(None, (params.get("reserve"), params.get("creator")))):
+            if _algod_amount(candidate, asset_id) > 0:
+                return candidate
+    response = indexer_round.observe(idx_client.asset_balances(asset_id, min_balance=0))
+    balances = response.get("balances", [])
+    return balances[0]["address"] if balances else None
+
+def get_credentials_details(asset_ids: Iterable[int], min_round: int | None = None) -> dict:
+    """
+    Fetch details of many credentials, keyed by Asset ID.
+
+    Cached assets cost no network call; the rest are fetched from the indexer
+    (or algod, while the indexer is behind `min_round`) with at most
+    DETAILS_FETCH_CONCURRENCY requests in flight. Assets that cannot be
+    fetched (e.g. unknown IDs) are left out of the result.
+    """
+    details = {}
+    missing = []
+    for asset_id in dict.fromkeys(asset_ids):
+        params = credential_cache.get(asset_id)
+        if params is None:
+            missing.append(asset_id)
+        else:
+            details[asset_id] = params
+
+    def fetch(asset_id: int) -> dict | None:
+        try:
+            return _fetch_credential_details(asset_id, min_round)
+        except Exception:
+            return None
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=DETAILS_FETCH_CONCURRENCY) as executor:
+            for asset_id, params in zip(missing, executor.map(fetch, missing)):
+                if params:
+                    details[asset_id] = params
+    return details
@@ -0,0 +1,335 @@
+import http.client
+import itertools
+import json
+import os
+import select
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib import parse
+
+from algosdk import constants
+from algosdk.error import AlgodHTTPError, IndexerHTTPError
+from algosdk.v2client import algod, indexer
+
+DEFAULT_ALGOD_URL = "https://testnet-api.algonode.cloud"
+DEFAULT_INDEXER_URL = "https://testnet-idx.algonode.cloud"
+
+# Idle keep-alive connections kept per host
+DEFAULT_MAX_IDLE = 8
+# A GET still running past this percentile of recent latencies is duplicated
+# to the next endpoint, and whichever answers first wins
+DEFAULT_HEDGE_PERCENTILE = 0.95
+LATENCY_WINDOW = 200
+MIN_LATENCY_SAMPLES = 20
+# Hedging sooner than this only doubles the load on ordinary jitter
+MIN_HEDGE_SECONDS = 0.05
+# How often a hedged request checks whether the duplicate has answered
+HEDGE_POLL_SECONDS = 0.005
+HEDGE_WORKERS = 32
+# Long polls that are meant to block; never hedged or counted as latency
+LONG_POLL_PATHS = ("/v2/status/wait-for-block-after/",)
+
+
+def endpoints_from_env(name: str, default: str) -> list[str]:
+    """Comma-separated endpoint list from the environment, e.g. ALGOD_URLS=https://a,https://b"""
+    urls = [url.strip().rstrip("/") for url in os.getenv(name, "").split(",") if url.strip()]
+    return urls or [default]
+
+
+class EndpointUnreachable(ConnectionError):
+    """No connection could be opened, so the request never reached the endpoint"""
+
+
+class PendingResponse:
+    """A request written to a pooled connection whose response has not been read yet"""
+
+    def __init__(self, pool: "ConnectionPool", parts: parse.SplitResult, conn: http.client.HTTPConnection, reused: bool, retry: tuple):
+        self.pool = pool
+        self.parts = parts
+        self.conn = conn
+        self.reused = reused
+        self.retry = retry
+
+    def ready(self, timeout: float) -> bool:
+        """Whether the response has started arriving, waiting up to `timeout` seconds"""
+        sock = self.conn.sock
+        if sock is None or getattr(sock, "pending", lambda: 0)():
+            return True
+        readable, _, _ = select.select([sock], [], [], timeout)
+        return bool(readable)
+
+    def result(self) -> tuple[int, bytes]:
+        """Read the response and return (status, body)"""
+        try:
+            response = self.conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            self.conn.close()
+            if self.reused:
+                # The server dropped an idle connection; retry on a fresh one
+                return self.pool.request(*self.retry)
+            raise
+        if response.will_close:
+            self.conn.close()
+        else:
+            self.pool._release(self.parts.scheme, self.parts.netloc, self.conn)
+        return response.status, data
+
+    def abandon(self) -> None:
+        """Drop the request; its connection is closed rather than reused"""
+        self.conn.close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections, per host"""
+
+    def __init__(self, max_idle_per_host: int = DEFAULT_MAX_IDLE):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def _acquire(self, scheme: str, netloc: str, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.opened += 1
+        return connection_class(netloc, timeout=timeout), False
+
+    @staticmethod
+    def _connect(conn: http.client.HTTPConnection) -> None:
+        try:
+            conn.connect()
+        except OSError as e:
+            conn.close()
+            raise EndpointUnreachable(f"{conn.host}:{conn.port}: {e}") from e
+
+    def _release(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def send(
+        self, method: str, url: str, headers: dict, body: bytes | None = None, timeout: float = 30
+    ) -> PendingResponse:
+        """Write one request, reusing an idle connection when there is one, without waiting for the response"""
+        parts = parse.urlsplit(url)
+        path = parts.path + (f"?{parts.query}" if parts.query else "")
+        while True:
+            conn, reused = self._acquire(parts.scheme, parts.netloc, timeout)
+            if not reused:
+                self._connect(conn)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if reused:
+                    # The server dropped an idle connection; retry on a fresh one
+                    continue
+                raise
+            return PendingResponse(self, parts, conn, reused, (method, url, headers, body, timeout))
+
+    def request(
+        self, method: str, url: str, headers: dict, body: bytes | None = None, timeout: float = 30
+    ) -> tuple[int, bytes]:
+        """Send one request and return (status, body), reusing an idle connection when there is one"""
+        return self.send(method, url, headers, body, timeout).result()
+
+
+class LatencyTracker:
+    """Rolling window of request latencies"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> float | None:
+        """Latency at percentile `p` (0-1), or None until enough samples are in"""
+        with self._lock:
+            if len(self._samples) < MIN_LATENCY_SAMPLES:
+                return None
+            samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(p * len(samples)))]
+
+
+class EndpointTransport:
+    """
+    Sends requests for one service (algod or indexer) across several
+    equivalent endpoints over pooled keep-alive connections.
+
+    Requests rotate through the endpoints. A GET that fails falls over to
+    the next endpoint; any other request only does when it could not connect,
+    since one that was sent may already have taken effect. A GET still
+    outstanding after the hedge percentile of recent latencies is sent again
+    to the next endpoint and the first answer wins, so one slow node costs
+    at most that percentile plus the other node's latency. The first attempt
+    runs on the caller's thread; only the duplicate goes to a worker.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        pool: ConnectionPool | None = None,
+        hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE,
+    ):
+        if not urls:
+            raise ValueError("At least one endpoint is required")
+        self.urls = [url.rstrip("/") for url in urls]
+        self.pool = pool or ConnectionPool()
+        self.latency = LatencyTracker()
+        self.hedge_percentile = hedge_percentile
+        self.hedged = 0
+        self._rotation = itertools.count()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="hedge")
+
+    def _send_to(self, url: str, method: str, path: str, headers: dict, body, timeout: float) -> tuple[int, bytes]:
+        started = time.monotonic()
+        result = self.pool.request(method, url + path, headers, body, timeout)
+        if not path.startswith(LONG_POLL_PATHS):
+            self.latency.record(time.monotonic() - started)
+        return result
+
+    def _failover(self, urls: list[str], method: str, *args) -> tuple[int, bytes]:
+        retryable = (http.client.HTTPException, OSError) if method == "GET" else EndpointUnreachable
+        for i, url in enumerate(urls):
+            try:
+                return self._send_to(url, method, *args)
+            except retryable:
+                if i == len(urls) - 1:
+                    raise
+
+    def request(
+        self, method: str, path: str, headers: dict, body: bytes | None = None, timeout: float = 30
+    ) -> tuple[int, bytes]:
+        start = next(self._rotation)
+        urls = [self.urls[(start + i) % len(self.urls)] for i in range(len(self.urls))]
+        args = (method, path, headers, body, timeout)
+
+        hedge_after = None
+        if method == "GET" and len(urls) > 1 and not path.startswith(LONG_POLL_PATHS):
+            hedge_after = self.latency.percentile(self.hedge_percentile)
+        if hedge_after is None:
+            return self._failover(urls, *args)
+
+        started = time.monotonic()
+        try:
+            primary = self.pool.send(method, urls[0] + path, headers, body, timeout)
+        except (http.client.HTTPException, OSError):
+            return self._failover(urls[1:], *args)
+
+        # One latency sample per request, however many endpoints it went to
+        hedge = result = None
+        if not primary.ready(max(hedge_after, MIN_HEDGE_SECONDS)):
+            with self._lock:
+                self.hedged += 1
+            hedge = self._executor.submit(self.pool.request, method, urls[1] + path, headers, body, timeout)
+            result = self._hedge_answer(primary, hedge, started + timeout)
+        if result is None:
+            try:
+                result = primary.result()
+            except (http.client.HTTPException, OSError):
+                if hedge is None:
+                    return self._failover(urls[1:], *args)
+                result = hedge.result()
+        self.latency.record(time.monotonic() - started)
+        return result
+
+    @staticmethod
+    def _hedge_answer(primary: PendingResponse, hedge, deadline: float) -> tuple[int, bytes] | None:
+        """The hedge's answer if it comes first (or the deadline passes); None once the primary's is arriving"""
+        while not primary.ready(HEDGE_POLL_SECONDS):
+            if (hedge.done() and hedge.exception() is None) or time.monotonic() > deadline:
+                primary.abandon()
+                return hedge.result()
+        return None
+
+
+def _request_path(requrl: str, params) -> str:
+    if requrl not in constants.unversioned_paths:
+        requrl = algod.api_version_path_prefix + requrl
+    if params:
+        requrl = requrl + "?" + parse.urlencode(params)
+    return requrl
+
+
+def _error_message(body: bytes) -> tuple[str, dict]:
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return body.decode("utf-8", errors="replace"), {}
+    if not isinstance(payload, dict):
+        return str(payload), {}
+    return payload.get("message", ""), payload
+
+
+class PooledAlgodClient(algod.AlgodClient):
+    """AlgodClient whose requests go through an EndpointTransport"""
+
+    def __init__(self, algod_token: str, transport: EndpointTransport, headers=None):
+        super().__init__(algod_token, transport.urls[0], headers)
+        self.transport = transport
+
+    def algod_request(self, method, requrl, params=None, data=None, headers=None, response_format="json", timeout=30):
+        header = {"User-Agent": "py-algorand-sdk", **(self.headers or {}), **(headers or {})}
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+
+        status, body = self.transport.request(method, _request_path(requrl, params), header, data, timeout)
+        if status >= 400:
+            message, payload = _error_message(body)
+            raise AlgodHTTPError(message, status, payload.get("data"))
+        if response_format != "json":
+            return body
+        return json.loads(body) if body else {}
+
+
+class PooledIndexerClient(indexer.IndexerClient):
+    """IndexerClient whose requests go through an EndpointTransport"""
+
+    def __init__(self, indexer_token: str, transport: EndpointTransport, headers=None):
+        super().__init__(indexer_token, transport.urls[0], headers)
+        self.transport = transport
+
+    def indexer_request(self, method, requrl, params=None, data=None, headers=None, timeout=30):
+        header = {"User-Agent": "py-algorand-sdk", **(self.headers or {}), **(headers or {})}
+        if requrl not in constants.no_auth and self.indexer_token:
+            header[constants.indexer_auth_header] = self.indexer_token
+
+        status, body = self.transport.request(method, _request_path(requrl, params), header, data, timeout)
+        if status >= 400:
+            error = IndexerHTTPError(_error_message(body)[0])
+            # The SDK's indexer errors carry no status; schedulers need it to spot throttling
+            error.code = status
+            raise error
+        return json.loads(body)
+
+
+def make_algod_client(urls: list[str] | None = None, token: str | None = None, **transport_options) -> PooledAlgodClient:
+    """Algod client for ALGOD_URLS (comma-separated) and ALGOD_TOKEN unless given explicitly"""
+    urls = urls or endpoints_from_env("ALGOD_URLS", DEFAULT_ALGOD_URL)
+    token = token if token is not None else os.getenv("ALGOD_TOKEN", "")
+    return PooledAlgodClient(token, EndpointTransport(urls, **transport_options))
+
+
+def make_indexer_client(urls: list[str] | None = None, token: str | None = None, **transport_options) -> PooledIndexerClient:
+    """Indexer client for INDEXER_URLS (comma-separated) and INDEXER_TOKEN unless given explicitly"""
+    urls = urls or endpoints_from_env("INDEXER_URLS", DEFAULT_INDEXER_URL)
+    token = token if token is not None else os.getenv("INDEXER_TOKEN", "")
+    return PooledIndexerClient(token, EndpointTransport(urls, **transport_options))
@@ -0,0 +1,144 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+# Rounds re-scanned when the tracker (re)starts following the chain, so a
+# transaction confirmed just before it was tracked is still seen
+DEFAULT_LOOKBACK_ROUNDS = 2
+# Recent blocks whose txids are kept for late track() calls
+DEFAULT_HISTORY_ROUNDS = 16
+RETRY_DELAY_SECONDS = 1.0
+
+
+class TransactionExpiredError(Exception):
+    """Raised when a tracked transaction's last_valid round passes unconfirmed"""
+
+    def __init__(self, txid: str, last_valid: int):
+        super().__init__(f"Transaction {txid} not confirmed by last valid round {last_valid}")
+        self.txid = txid
+        self.last_valid = last_valid
+
+
+class ConfirmationTracker:
+    """
+    Resolve confirmations for many in-flight transactions from one block follower.
+
+    A single background thread long-polls `status_after_block` once per round
+    and reads that block's txids, resolving the Future of every tracked txid it
+    finds with the confirmed round. A txid still pending once the chain passes
+    its `last_valid` round fails with TransactionExpiredError. Callers can block
+    on `future.result()` or attach work with `future.add_done_callback`.
+    The thread only follows the chain while something is being tracked.
+    """
+
+    def __init__(
+        self,
+        client,
+        params_provider=None,
+        lookback_rounds: int = DEFAULT_LOOKBACK_ROUNDS,
+        history_rounds: int = DEFAULT_HISTORY_ROUNDS,
+    ):
+        self.client = client
+        self.params_provider = params_provider
+        self.lookback_rounds = lookback_rounds
+        self.history_rounds = history_rounds
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._pending: dict[str, tuple[int, Future]] = {}
+        self._recent: OrderedDict[int, set[str]] = OrderedDict()
+        self._next_round: int | None = None
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+
+    def track(self, txid: str, last_valid: int) -> Future:
+        """Return a Future resolving to the round `txid` is confirmed in"""
+        future: Future = Future()
+        with self._lock:
+            for round_num, txids in self._recent.items():
+                if txid in txids:
+                    future.set_result(round_num)
+                    return future
+            self._pending[txid] = (last_valid, future)
+            self._ensure_started()
+            self._wakeup.notify()
+        return future
+
+    def wait(self, txid: str, last_valid: int, timeout: float | None = None) -> int:
+        """Block until `txid` is confirmed and return its confirmed round"""
+        return self.track(txid, last_valid).result(timeout)
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _ensure_started(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="confirmation-tracker", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._pending and not self._stopped:
+                    # Idle: forget our position so we resume near the tip
+                    self._next_round = None
+                    self._wakeup.wait()
+                if self._stopped:
+                    return
+            try:
+                self._follow_one_round()
+            except Exception as e:
+                logger.warning(f"Confirmation tracker error, retrying: {e}")
+                time.sleep(RETRY_DELAY_SECONDS)
+
+    def _follow_one_round(self) -> None:
+        if self._next_round is None:
+            last_round = self.client.status()["last-round"]
+            self._next_round = max(1, last_round - self.lookback_rounds + 1)
+        else:
+            last_round = self.client.status_after_block(self._next_round - 1)["last-round"]
+        if self.params_provider is not None:
+            self.params_provider.observe_round(last_round)
+
+        while self._next_round <= last_round:
+            round_num = self._next_round
+            txids = set(self.client.get_block_txids(round_num).get("blockTxids") or [])
+            self._resolve_round(round_num, txids)
+            self._next_round = round_num + 1
+
+    def _resolve_round(self, round_num: int, txids: set[str]) -> None:
+        resolved: list[tuple[Future, int | Exception]] = []
+        with self._lock:
+            self._recent[round_num] = txids
+            while len(self._recent) > self.history_rounds:
+                self._recent.popitem(last=False)
+
+            for txid, (last_valid, future) in list(self._pending.items()):
+                if txid in txids:
+                    resolved.append((future, round_num))
+                elif round_num >= last_valid:
+                    resolved.append((future, TransactionExpiredError(txid, last_valid)))
+                else:
+                    continue
+                del self._pending[txid]
+
+        # Complete futures outside the lock so callbacks may track more txids
+        for future, outcome in resolved:
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
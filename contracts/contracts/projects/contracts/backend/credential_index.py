@@ -0,0 +1,246 @@
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass
+from typing import Iterable
+
+from backend.pagination import iter_pages
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS credentials (
+    asset_id INTEGER PRIMARY KEY,
+    name TEXT,
+    unit_name TEXT,
+    url TEXT,
+    creator TEXT NOT NULL,
+    manager TEXT,
+    reserve TEXT,
+    holder TEXT,
+    issue_round INTEGER,
+    serial INTEGER,
+    revoked INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_credentials_holder ON credentials (holder);
+CREATE INDEX IF NOT EXISTS idx_credentials_name ON credentials (name);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    round INTEGER NOT NULL
+);
+"""
+
+COLUMNS = (
+    "asset_id", "name", "unit_name", "url", "creator",
+    "manager", "reserve", "holder", "issue_round", "serial",
+)
+
+
+@dataclass
+class CredentialRecord:
+    """One minted credential ASA as stored in the local index"""
+    asset_id: int
+    creator: str
+    name: str | None = None
+    unit_name: str | None = None
+    url: str | None = None
+    manager: str | None = None
+    reserve: str | None = None
+    holder: str | None = None
+    issue_round: int | None = None
+    # The credential's bit in the contract's revocation bitmap
+    serial: int | None = None
+    # Maintained by mark_revoked only; upserts never touch it
+    revoked: bool = False
+
+
+class CredentialIndex:
+    """
+    SQLite mirror of every credential ASA minted by the CredentialVerifier app
+    account or the institution account.
+
+    Writes are idempotent upserts so the same chain data can be applied more
+    than once (e.g. after a follower restarts). The query methods return the
+    same shapes as `get_student_credentials` and `get_credential_details` in
+    `backend/blockchain.py`, but answer from local disk.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(SCHEMA)
+        columns = {row["name"] for row in self._db.execute("PRAGMA table_info(credentials)")}
+        if "revoked" not in columns:
+            # Index files created before revocation existed
+            self._db.execute("ALTER TABLE credentials ADD COLUMN revoked INTEGER NOT NULL DEFAULT 0")
+        if "serial" not in columns:
+            self._db.execute("ALTER TABLE credentials ADD COLUMN serial INTEGER")
+        self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # ------------------------------ Writes ------------------------------ #
+
+    def upsert_credentials(self, records: Iterable[CredentialRecord]) -> int:
+        """Insert or update credentials, keeping the known holder if a record has none"""
+        rows = [asdict(record) for record in records]
+        if not rows:
+            return 0
+        placeholders = ", ".join(f":{column}" for column in COLUMNS)
+        updates = ", ".join(
+            f"{column} = COALESCE(excluded.{column}, credentials.{column})"
+            for column in COLUMNS
+            if column != "asset_id"
+        )
+        with self._lock:
+            self._db.executemany(
+                f"INSERT INTO credentials ({', '.join(COLUMNS)}) VALUES ({placeholders}) "
+                f"ON CONFLICT (asset_id) DO UPDATE SET {updates}",
+                rows,
+            )
+            self._db.commit()
+        return len(rows)
+
+    def set_holder(self, asset_id: int, holder: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE credentials SET holder = ? WHERE asset_id = ?", (holder, asset_id)
+            )
+            self._db.commit()
+
+    def set_roles(self, asset_id: int, manager: str | None, reserve: str | None) -> None:
+        """Apply an asset reconfiguration (acfg) to a known credential"""
+        with self._lock:
+            self._db.execute(
+                "UPDATE credentials SET manager = ?, reserve = ? WHERE asset_id = ?",
+                (manager, reserve, asset_id),
+            )
+            self._db.commit()
+
+    def mark_revoked(self, asset_ids: Iterable[int]) -> None:
+        with self._lock:
+            self._db.executemany(
+                "UPDATE credentials SET revoked = 1 WHERE asset_id = ?",
+                [(asset_id,) for asset_id in asset_ids],
+            )
+            self._db.commit()
+
+    def get_checkpoint(self, name: str) -> int | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT round FROM checkpoints WHERE name = ?", (name,)
+            ).fetchone()
+        return row["round"] if row else None
+
+    def set_checkpoint(self, name: str, round_num: int) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints (name, round) VALUES (?, ?)",
+                (name, round_num),
+            )
+            self._db.commit()
+
+    # ------------------------------ Queries ----------------------------- #
+
+    def get_record(self, asset_id: int) -> CredentialRecord | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT * FROM credentials WHERE asset_id = ?", (asset_id,)
+            ).fetchone()
+        return _row_to_record(row) if row else None
+
+    def get_student_credentials(self, student_address: str) -> list:
+        """Local equivalent of blockchain.get_student_credentials"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT asset_id FROM credentials WHERE holder = ? ORDER BY asset_id",
+                (student_address,),
+            ).fetchall()
+        return [
+            {"asset-id": row["asset_id"], "amount": 1, "is-frozen": False}
+            for row in rows
+        ]
+
+    def get_credential_details(self, asset_id: int) -> dict:
+        """Local equivalent of blockchain.get_credential_details"""
+        record = self.get_record(asset_id)
+        if record is None:
+            return {}
+        return _record_to_params(record)
+
+    def find_by_name(self, name: str) -> list[CredentialRecord]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT * FROM credentials WHERE name = ? ORDER BY asset_id", (name,)
+            ).fetchall()
+        return [_row_to_record(row) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM credentials").fetchone()[0]
+
+
+def _row_to_record(row: sqlite3.Row) -> CredentialRecord:
+    values = dict(row)
+    values["revoked"] = bool(values["revoked"])
+    return CredentialRecord(**values)
+
+
+def _record_to_params(record: CredentialRecord) -> dict:
+    """Shape a record like indexer asset params"""
+    params = {
+        "creator": record.creator,
+        "name": record.name,
+        "unit-name": record.unit_name,
+        "url": record.url,
+        "manager": record.manager,
+        "reserve": record.reserve,
+        "total": 1,
+        "decimals": 0,
+    }
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def record_from_indexer_asset(asset: dict) -> CredentialRecord:
+    """Build a record from an indexer asset object (as returned by search_assets)"""
+    params = asset.get("params", {})
+    return CredentialRecord(
+        asset_id=asset["index"],
+        creator=params.get("creator"),
+        name=params.get("name"),
+        unit_name=params.get("unit-name"),
+        url=params.get("url"),
+        manager=params.get("manager"),
+        reserve=params.get("reserve"),
+        issue_round=asset.get("created-at-round"),
+    )
+
+
+def sync_from_indexer(
+    index: CredentialIndex,
+    idx_client,
+    creators: Iterable[str],
+    unit_name: str = "CERT",
+) -> int:
+    """
+    Mirror every `unit_name` asset created by `creators` into the index.
+
+    Holders are read from each asset's balances, so this is meant for an
+    initial load; afterwards a block follower keeps the index current.
+    """
+    synced = 0
+    for creator in creators:
+        pages = iter_pages(
+            lambda next_token: idx_client.search_assets(
+                creator=creator, unit=unit_name, next_page=next_token
+            )
+        )
+        for page in pages:
+            records = [record_from_indexer_asset(asset) for asset in page.get("assets", [])]
+            for record in records:
+                balances = idx_client.asset_balances(record.asset_id, min_balance=0)
+                holders = [b["address"] for b in balances.get("balances", [])]
+                record.holder = holders[0] if holders else None
+            synced += index.upsert_credentials(records)
+    return synced
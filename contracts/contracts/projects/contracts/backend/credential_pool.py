@@ -0,0 +1,317 @@
+import base64
+import copy
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from algosdk import abi
+from algosdk.account import address_from_private_key
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.encoding import decode_address, encode_address
+from algosdk.logic import get_application_address
+from algosdk.transaction import AssetTransferTxn
+
+from backend.confirmation import ConfirmationTracker
+from backend.follower import ABI_RETURN_PREFIX
+from backend.registry import (
+    ARC19_TEMPLATE_URL,
+    STUDENT_PAGE_IDS,
+    credential_box_name,
+    read_global_uint,
+    read_student_credential_count,
+    student_page_box_name,
+)
+
+logger = logging.getLogger(__name__)
+
+# Mirrors the pool constants in smart_contracts/credential_verifier/contract.py
+MAX_POOL_MINT = 64
+POOL_MINT_OPCODE_BUDGET = 100
+APP_CALL_BUDGET = 700
+
+DEFAULT_LOW_WATER = 50
+DEFAULT_TARGET = 200
+TOP_UP_INTERVAL_SECONDS = 60.0
+
+MINT_POOL = abi.Method.from_signature("mint_pool(uint64)uint64[]")
+ASSIGN_CREDENTIAL = abi.Method.from_signature("assign_credential(uint64,address,byte[32])void")
+ASSET_IDS_TYPE = abi.ABIType.from_string("uint64[]")
+
+# A CIDv0 is the base58 encoding of a sha2-256 multihash
+SHA256_MULTIHASH_PREFIX = bytes([0x12, 0x20])
+_BASE58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def _base58_decode(text: str) -> bytes:
+    number = 0
+    for char in text:
+        number = number * 58 + _BASE58.index(char)
+    body = number.to_bytes((number.bit_length() + 7) // 8, "big")
+    return b"\x00" * (len(text) - len(text.lstrip("1"))) + body
+
+
+def _base58_encode(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    text = ""
+    while number:
+        number, digit = divmod(number, 58)
+        text = _BASE58[digit] + text
+    return "1" * (len(data) - len(data.lstrip(b"\x00"))) + text
+
+
+def cid_digest(cid_or_url: str) -> bytes:
+    """sha2-256 digest of a CIDv0, given bare or as an ipfs:// or gateway URL"""
+    cid = urlparse(cid_or_url).path.rstrip("/").split("/")[-1] or urlparse(cid_or_url).netloc
+    multihash = _base58_decode(cid)
+    if not multihash.startswith(SHA256_MULTIHASH_PREFIX) or len(multihash) != 34:
+        raise ValueError(f"Not a sha2-256 CIDv0: {cid}")
+    return multihash[2:]
+
+
+def reserve_address_for_cid(cid_or_url: str) -> str:
+    """ARC-19 reserve address that makes the template URL resolve to this CID"""
+    return encode_address(cid_digest(cid_or_url))
+
+
+def cid_for_reserve_address(address: str) -> str:
+    return _base58_encode(SHA256_MULTIHASH_PREFIX + decode_address(address))
+
+
+@dataclass
+class PoolStatus:
+    """Pool level and how fast it is being drained"""
+    level: int
+    low_water: int
+    target: int
+    assigned: int
+    assignments_per_hour: float
+
+    @property
+    def depleted(self) -> bool:
+        return self.level == 0
+
+    @property
+    def low(self) -> bool:
+        return self.level < self.low_water
+
+    @property
+    def hours_to_empty(self) -> float | None:
+        if not self.assignments_per_hour:
+            return None
+        return self.level / self.assignments_per_hour
+
+
+class CredentialPool:
+    """
+    Keeps a pool of blank ARC-19 credentials minted ahead of time and issues
+    from it.
+
+    `top_up` mints with `mint_pool` whenever the on-chain pool size falls
+    below `low_water`, up to `target`; run it off-peak or let `run` do it on
+    an interval. `assign` then issues a credential in one group: the
+    student's opt-in plus `assign_credential`, which points the asset's
+    reserve at the metadata CID and transfers it.
+
+    Confirmations come from `confirmation_tracker` (pass the process-wide
+    one). Assigning changes the asset's params, so its entry in
+    `asset_cache` is dropped; blank credentials are never cached (see
+    blockchain.cacheable_params), so other processes hold nothing stale.
+    """
+
+    def __init__(
+        self,
+        client,
+        app_id: int,
+        institution_private_key: str,
+        low_water: int = DEFAULT_LOW_WATER,
+        target: int = DEFAULT_TARGET,
+        params_provider=None,
+        clock=time.monotonic,
+        confirmation_tracker: ConfirmationTracker | None = None,
+        asset_cache=None,
+    ):
+        self.client = client
+        self.app_id = app_id
+        self.app_address = get_application_address(app_id)
+        self.institution_address = address_from_private_key(institution_private_key)
+        self.signer = AccountTransactionSigner(institution_private_key)
+        self.low_water = low_water
+        self.target = target
+        self.params_provider = params_provider
+        self.confirmation_tracker = confirmation_tracker or ConfirmationTracker(client, params_provider)
+        self.asset_cache = asset_cache
+        self.clock = clock
+        self.started = clock()
+        self.assigned = 0
+        self._available: deque[int] = deque()
+        self._lock = threading.Lock()
+
+    def _params(self):
+        return self.params_provider.get() if self.params_provider else self.client.suggested_params()
+
+    def _submit(self, atc: AtomicTransactionComposer) -> tuple[str, dict]:
+        """Send a group and return the txid and pending info of its last transaction"""
+        signed_txns = atc.gather_signatures()
+        self.client.send_transactions(signed_txns)
+        txid = signed_txns[-1].get_txid()
+        self.confirmation_tracker.wait(txid, signed_txns[-1].transaction.last_valid_round)
+        return txid, self.client.pending_transaction_info(txid)
+
+    def level(self) -> int:
+        """Blank credentials left in the pool, as counted by the contract"""
+        return read_global_uint(self.client, self.app_id, b"pool_size")
+
+    def mint(self, count: int) -> list[int]:
+        """Mint up to MAX_POOL_MINT blank credentials in one app call"""
+        count = min(count, MAX_POOL_MINT)
+        params = self._params()
+        op_ups = math.ceil(count * POOL_MINT_OPCODE_BUDGET / APP_CALL_BUDGET)
+        params.flat_fee = True
+        params.fee = params.min_fee * (1 + count + op_ups)
+
+        atc = AtomicTransactionComposer()
+        atc.add_method_call(
+            self.app_id, MINT_POOL, self.institution_address, params, self.signer, method_args=[count]
+        )
+        _, info = self._submit(atc)
+        raw = base64.b64decode(info["logs"][-1])
+        if not raw.startswith(ABI_RETURN_PREFIX):
+            raise ValueError("mint_pool returned no asset IDs")
+        asset_ids = ASSET_IDS_TYPE.decode(raw[len(ABI_RETURN_PREFIX):])
+        with self._lock:
+            self._available.extend(asset_ids)
+        return asset_ids
+
+    def top_up(self) -> int:
+        """Mint back up to `target` if the pool is below `low_water`; returns how many were minted"""
+        level = self.level()
+        if level >= self.low_water:
+            return 0
+        minted = 0
+        while level + minted < self.target:
+            minted += len(self.mint(self.target - level - minted))
+        logger.info(f"Pool topped up from {level} to {level + minted}")
+        return minted
+
+    def _load_available(self) -> None:
+        """Rebuild the local list of blank credentials from the app account's created assets"""
+        account = self.client.account_info(self.app_address)
+        blank = [
+            asset["index"]
+            for asset in account.get("created-assets", [])
+            if asset["params"].get("reserve") == self.app_address
+            and asset["params"].get("url") == ARC19_TEMPLATE_URL
+        ]
+        with self._lock:
+            self._available.extend(sorted(set(blank) - set(self._available)))
+
+    def _take(self) -> int:
+        with self._lock:
+            if self._available:
+                return self._available.popleft()
+        self._load_available()
+        with self._lock:
+            if not self._available:
+                raise RuntimeError("Credential pool is depleted")
+            return self._available.popleft()
+
+    def _still_blank(self, asset_id: int) -> bool:
+        """Whether the asset's reserve is still the app account, i.e. nobody has assigned it"""
+        try:
+            params = self.client.asset_info(asset_id)["params"]
+        except Exception as e:
+            logger.warning(f"Could not check pooled credential {asset_id}: {e}")
+            return False
+        return params.get("reserve") == self.app_address
+
+    def assign(self, student_private_key: str, metadata_url: str) -> tuple[int, str]:
+        """Issue a pooled credential to a custodial student wallet; returns (asset_id, txid)"""
+        digest = cid_digest(metadata_url)
+        student_address = address_from_private_key(student_private_key)
+        asset_id = None
+        try:
+            asset_id = self._take()
+            params = self._params()
+            # The credential is appended to the student's current index page
+            page = read_student_credential_count(self.client, self.app_id, student_address) // STUDENT_PAGE_IDS
+
+            opt_in_txn = AssetTransferTxn(
+                sender=student_address,
+                index=asset_id,
+                amt=0,
+                receiver=student_address,
+                sp=params,
+            )
+            call_params = copy.copy(params)
+            call_params.flat_fee = True
+            # The reconfiguration and the transfer are inner transactions with no fee
+            call_params.fee = call_params.min_fee * 3
+
+            atc = AtomicTransactionComposer()
+            atc.add_transaction(TransactionWithSigner(opt_in_txn, AccountTransactionSigner(student_private_key)))
+            atc.add_method_call(
+                self.app_id,
+                ASSIGN_CREDENTIAL,
+                self.institution_address,
+                call_params,
+                self.signer,
+                method_args=[asset_id, student_address, digest],
+                foreign_assets=[asset_id],
+                # Page 0 holds the student's count; a later page is named too once it is in use
+                boxes=[
+                    (self.app_id, credential_box_name(asset_id)),
+                    *[(self.app_id, student_page_box_name(student_address, p)) for p in sorted({0, page})],
+                ],
+            )
+            txid, _ = self._submit(atc)
+        except Exception:
+            # The group may have failed after the asset was assigned (e.g. a
+            # confirmation timeout), or someone else assigned it first; only
+            # a credential that is still blank on chain goes back in the pool.
+            # Dropped blanks are found again by _load_available.
+            if asset_id is None:
+                raise
+            if self._still_blank(asset_id):
+                with self._lock:
+                    self._available.appendleft(asset_id)
+            else:
+                logger.warning(f"Pooled credential {asset_id} is no longer blank; dropped from the pool")
+            raise
+        finally:
+            if asset_id is not None and self.asset_cache is not None:
+                self.asset_cache.invalidate(asset_id)
+        self.assigned += 1
+        return asset_id, txid
+
+    def status(self) -> PoolStatus:
+        hours = (self.clock() - self.started) / 3600
+        return PoolStatus(
+            level=self.level(),
+            low_water=self.low_water,
+            target=self.target,
+            assigned=self.assigned,
+            assignments_per_hour=self.assigned / hours if hours else 0.0,
+        )
+
+    def run(self, stop: threading.Event | None = None, interval: float = TOP_UP_INTERVAL_SECONDS) -> None:
+        """Keep the pool topped up and report depletion until `stop` is set"""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self.top_up()
+                status = self.status()
+                if status.depleted:
+                    logger.error("Credential pool is depleted")
+                elif status.low:
+                    logger.warning(f"Credential pool low: {status.level} left, {status.hours_to_empty} hours to empty")
+            except Exception as e:
+                logger.warning(f"Pool maintenance failed, retrying: {e}")
+            stop.wait(interval)
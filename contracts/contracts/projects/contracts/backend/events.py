@@ -0,0 +1,58 @@
+import base64
+import hashlib
+from dataclasses import dataclass
+from typing import Iterable
+
+from algosdk import abi
+
+# ARC-28 events emitted by CredentialVerifier (see contract.py)
+CREDENTIAL_ISSUED = "CredentialIssued"
+CREDENTIAL_REVOKED = "CredentialRevoked"
+EVENT_ARGS = {
+    # asset_id, holder, document_hash, serial
+    CREDENTIAL_ISSUED: "(uint64,address,byte[32],uint64)",
+    CREDENTIAL_REVOKED: "(uint64,address,byte[32])",
+}
+EVENT_TYPES = {name: abi.ABIType.from_string(args) for name, args in EVENT_ARGS.items()}
+
+
+def event_selector(name: str) -> bytes:
+    """First 4 bytes of sha512/256 over the event signature, as in ARC-28"""
+    return hashlib.new("sha512_256", f"{name}{EVENT_ARGS[name]}".encode()).digest()[:4]
+
+
+EVENT_SELECTORS = {event_selector(name): name for name in (CREDENTIAL_ISSUED, CREDENTIAL_REVOKED)}
+
+
+@dataclass
+class CredentialEvent:
+    name: str
+    asset_id: int
+    holder: str
+    document_hash: bytes
+    # Revocation bitmap bit; CredentialIssued only
+    serial: int | None = None
+
+
+def decode_event(log: bytes) -> CredentialEvent | None:
+    """Decode one raw log entry; anything that isn't a credential event gives None"""
+    name = EVENT_SELECTORS.get(log[:4])
+    if name is None or len(log) != 4 + EVENT_TYPES[name].byte_len():
+        return None
+    asset_id, holder, document_hash, *serial = EVENT_TYPES[name].decode(log[4:])
+    return CredentialEvent(name, asset_id, holder, bytes(document_hash), *serial)
+
+
+def decode_logs(logs: Iterable[str]) -> list[CredentialEvent]:
+    """Decode the base64 `logs` of a confirmed transaction or the `lg` of a block entry"""
+    events = []
+    for entry in logs:
+        event = decode_event(base64.b64decode(entry))
+        if event is not None:
+            events.append(event)
+    return events
+
+
+def issued_asset_ids(pending_info: dict) -> list[int]:
+    """Asset IDs issued by a confirmed issue_credential(s) call, in order"""
+    return [e.asset_id for e in decode_logs(pending_info.get("logs", [])) if e.name == CREDENTIAL_ISSUED]
@@ -0,0 +1,295 @@
+import base64
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Protocol
+
+from algosdk.encoding import encode_address
+from algosdk.logic import get_application_address
+
+from backend.credential_index import CredentialIndex, CredentialRecord
+from backend.events import CREDENTIAL_ISSUED, CREDENTIAL_REVOKED, CredentialEvent, decode_logs
+from backend.registry import ARC19_TEMPLATE_URL, POOL_CREDENTIAL_NAME
+
+logger = logging.getLogger(__name__)
+
+# ARC-4 prefix on the log entry carrying an ABI method's return value
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+DEFAULT_CHECKPOINT_NAME = "credential-follower"
+RETRY_DELAY_SECONDS = 1.0
+
+
+@dataclass
+class BlockChanges:
+    """Credential-relevant effects of one block"""
+    round: int
+    issued: list[CredentialRecord] = field(default_factory=list)
+    # (asset_id, receiver) for every asset transfer moving a non-zero amount
+    transfers: list[tuple[int, str]] = field(default_factory=list)
+    # asset_id -> new (manager, reserve) for asset reconfigurations
+    reconfigured: dict[int, tuple[str | None, str | None]] = field(default_factory=dict)
+    # Asset IDs from CredentialRevoked events
+    revoked: list[int] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.issued or self.transfers or self.reconfigured or self.revoked)
+
+
+class CredentialSink(Protocol):
+    """Destination for ingested changes; must tolerate replays of the same round"""
+
+    def apply_changes(self, changes: BlockChanges) -> None: ...
+
+    def get_checkpoint(self, name: str) -> int | None: ...
+
+    def set_checkpoint(self, name: str, round_num: int) -> None: ...
+
+
+def _abi_return_uint64(logs: list[str]) -> int | None:
+    for entry in reversed(logs):
+        raw = base64.b64decode(entry)
+        if raw.startswith(ABI_RETURN_PREFIX) and len(raw) == len(ABI_RETURN_PREFIX) + 8:
+            return int.from_bytes(raw[len(ABI_RETURN_PREFIX):], "big")
+    return None
+
+
+def _address(value: str | None) -> str | None:
+    """Block JSON carries addresses as base64 of the raw 32 bytes; convert to the usual base32 form"""
+    if value is None:
+        return None
+    return encode_address(base64.b64decode(value))
+
+
+def _record_from_acfg(stxn: dict, asset_id: int, round_num: int, serial: int | None = None) -> CredentialRecord:
+    txn = stxn["txn"]
+    params = txn.get("apar", {})
+    creator = _address(txn["snd"])
+    return CredentialRecord(
+        asset_id=asset_id,
+        creator=creator,
+        name=params.get("an"),
+        unit_name=params.get("un"),
+        url=params.get("au"),
+        manager=_address(params.get("m")),
+        reserve=_address(params.get("r")),
+        # The whole supply starts with the creator until it is transferred
+        holder=creator,
+        issue_round=round_num,
+        serial=serial,
+    )
+
+
+def _record_from_pool_event(event: CredentialEvent, app_address: str, unit_name: str, round_num: int) -> CredentialRecord:
+    """Record for a pooled credential; its blank creation carried only the pool's fixed params"""
+    return CredentialRecord(
+        asset_id=event.asset_id,
+        creator=app_address,
+        name=POOL_CREDENTIAL_NAME,
+        unit_name=unit_name,
+        url=ARC19_TEMPLATE_URL,
+        manager=app_address,
+        holder=event.holder,
+        issue_round=round_num,
+        serial=event.serial,
+    )
+
+
+def _is_blank_pool_credential(txn: dict) -> bool:
+    params = txn.get("apar", {})
+    return params.get("au") == ARC19_TEMPLATE_URL and params.get("r") == txn.get("snd")
+
+
+def _is_asset_creation(stxn: dict) -> bool:
+    txn = stxn.get("txn", {})
+    return txn.get("type") == "acfg" and "caid" not in txn
+
+
+def extract_changes(
+    block: dict,
+    round_num: int,
+    app_id: int,
+    creators: Iterable[str] = (),
+    unit_name: str = "CERT",
+) -> BlockChanges:
+    """
+    Pull credential issuance, transfers and reconfigurations out of an algod block.
+
+    `block` is the JSON form algod serves, in which addresses are base64;
+    every address in the returned changes is converted to base32.
+
+    Calls to `app_id` are read from their ARC-28 events: each CredentialIssued
+    log carries the asset ID and revocation serial and pairs, in order, with
+    the inner AssetConfig that created it (which supplies name and URL). An
+    `assign_credential` event has no creation to pair with, as its asset was
+    minted blank by `mint_pool`; blank creations are not issuance and are
+    skipped, and the assigned credential is recorded from the event and the
+    pool's fixed params. Calls from app versions that predate the events
+    fall back to the inner creation, with the asset ID taken from the
+    `issue_credential` return log. Top-level asset creations sent by one of
+    `creators` count as issuance too.
+    """
+    changes = BlockChanges(round=round_num)
+    creators = set(creators)
+    app_address = get_application_address(app_id)
+
+    def visit(stxn: dict, inner: bool, returned_id: int | None = None) -> None:
+        txn = stxn.get("txn", {})
+        kind = txn.get("type")
+        if kind == "acfg":
+            params = txn.get("apar")
+            if "caid" in txn:
+                # Reconfiguration (or destruction) of an existing asset
+                params = params or {}
+                changes.reconfigured[txn["caid"]] = (_address(params.get("m")), _address(params.get("r")))
+            elif params and params.get("un") == unit_name and not _is_blank_pool_credential(txn):
+                asset_id = stxn.get("caid") or returned_id
+                if asset_id and (inner or _address(txn.get("snd")) in creators):
+                    changes.issued.append(_record_from_acfg(stxn, asset_id, round_num))
+        elif kind == "axfer" and txn.get("aamt", 0) > 0:
+            changes.transfers.append((txn["xaid"], _address(txn["arcv"])))
+        elif kind == "appl":
+            apply_data = stxn.get("dt", {})
+            inner_txns = apply_data.get("itx", [])
+            is_credential_app = (txn.get("apid") or stxn.get("apid")) == app_id
+            returned_id = None
+            if is_credential_app:
+                events = decode_logs(apply_data.get("lg", []))
+                changes.revoked.extend(e.asset_id for e in events if e.name == CREDENTIAL_REVOKED)
+                issued = [e for e in events if e.name == CREDENTIAL_ISSUED]
+                if issued:
+                    creations = [t for t in inner_txns if _is_asset_creation(t)]
+                    for i, event in enumerate(issued):
+                        if i < len(creations):
+                            record = _record_from_acfg(creations[i], event.asset_id, round_num, event.serial)
+                        else:
+                            record = _record_from_pool_event(event, app_address, unit_name, round_num)
+                        changes.issued.append(record)
+                    inner_txns = [t for t in inner_txns if not _is_asset_creation(t)]
+                elif len(inner_txns) == 1:
+                    returned_id = _abi_return_uint64(apply_data.get("lg", []))
+            for inner_stxn in inner_txns:
+                visit(inner_stxn, inner=is_credential_app, returned_id=returned_id)
+
+    for stxn in block.get("txns", []):
+        visit(stxn, inner=False)
+    return changes
+
+
+class BlockFollower:
+    """
+    Follow algod blocks from a checkpoint and feed credential changes to a sink.
+
+    Each round is applied to the sink and then checkpointed, so after a crash
+    the follower resumes from the last completed round; the sink's upserts make
+    re-applying that round harmless. Work is proportional to new blocks only.
+    """
+
+    def __init__(
+        self,
+        client,
+        sink: CredentialSink,
+        app_id: int,
+        creators: Iterable[str] = (),
+        start_round: int | None = None,
+        checkpoint_name: str = DEFAULT_CHECKPOINT_NAME,
+        asset_cache=None,
+    ):
+        self.client = client
+        self.sink = sink
+        self.app_id = app_id
+        self.creators = set(creators) | {get_application_address(app_id)}
+        self.checkpoint_name = checkpoint_name
+        self.asset_cache = asset_cache
+        self.start_round = start_round
+        self.tip_round = 0
+
+    @property
+    def checkpoint(self) -> int | None:
+        return self.sink.get_checkpoint(self.checkpoint_name)
+
+    def next_round(self) -> int:
+        checkpoint = self.checkpoint
+        if checkpoint is not None:
+            return checkpoint + 1
+        if self.start_round is not None:
+            return self.start_round
+        return self.client.status()["last-round"]
+
+    def lag(self) -> int:
+        """Rounds between the last ingested round and the chain tip"""
+        self.tip_round = max(self.tip_round, self.client.status()["last-round"])
+        return max(0, self.tip_round - (self.next_round() - 1))
+
+    def process_round(self, round_num: int) -> BlockChanges:
+        block = self.client.block_info(round_num=round_num)["block"]
+        changes = extract_changes(block, round_num, self.app_id, self.creators)
+        if changes:
+            self.sink.apply_changes(changes)
+        if changes.reconfigured and self.asset_cache is not None:
+            self.asset_cache.invalidate_many(changes.reconfigured)
+        self.sink.set_checkpoint(self.checkpoint_name, round_num)
+        return changes
+
+    def catch_up(self, max_rounds: int | None = None) -> int:
+        """Process every available round up to the tip; returns rounds processed"""
+        self.tip_round = self.client.status()["last-round"]
+        round_num = self.next_round()
+        processed = 0
+        while round_num <= self.tip_round and (max_rounds is None or processed < max_rounds):
+            self.process_round(round_num)
+            round_num += 1
+            processed += 1
+        return processed
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """Follow the chain until `stop` is set, waiting one round at a time"""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self.catch_up()
+                logger.info(f"Caught up to round {self.tip_round}, lag {self.lag()}")
+                self.client.status_after_block(self.tip_round)
+            except Exception as e:
+                logger.warning(f"Follower error, retrying: {e}")
+                time.sleep(RETRY_DELAY_SECONDS)
+
+
+class IndexSink:
+    """CredentialSink writing into a CredentialIndex"""
+
+    def __init__(self, index: CredentialIndex):
+        self.index = index
+
+    def apply_changes(self, changes: BlockChanges) -> None:
+        self.index.upsert_credentials(changes.issued)
+        for asset_id, receiver in changes.transfers:
+            self.index.set_holder(asset_id, receiver)
+        for asset_id, (manager, reserve) in changes.reconfigured.items():
+            self.index.set_roles(asset_id, manager, reserve)
+        if changes.revoked:
+            self.index.mark_revoked(changes.revoked)
+
+    def get_checkpoint(self, name: str) -> int | None:
+        return self.index.get_checkpoint(name)
+
+    def set_checkpoint(self, name: str, round_num: int) -> None:
+        self.index.set_checkpoint(name, round_num)
+
+
+if __name__ == "__main__":
+    from backend.blockchain import CREDENTIAL_APP_ID, INSTITUTION_ADDRESS, client, credential_cache
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    db_path = sys.argv[1] if len(sys.argv) > 1 else "credentials.db"
+    start = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    follower = BlockFollower(
+        client,
+        IndexSink(CredentialIndex(db_path)),
+        CREDENTIAL_APP_ID,
+        creators=[INSTITUTION_ADDRESS] if INSTITUTION_ADDRESS else [],
+        start_round=start,
+        asset_cache=credential_cache,
+    )
+    follower.run()
@@ -0,0 +1,48 @@
+import threading
+import time
+from typing import Callable
+
+from backend.params import ROUND_SECONDS
+
+
+class IndexerRoundTracker:
+    """
+    Latest round the indexer is known to have caught up to.
+
+    Indexer responses that report `current-round` are fed through `observe`.
+    When a read needs a newer round than that, the indexer's health endpoint
+    is asked at most once per ROUND_SECONDS before the read gives up on the
+    indexer; callers then go to algod, which is never behind its own writes.
+    """
+
+    def __init__(self, health: Callable[[], dict], clock=time.monotonic):
+        self.health = health
+        self.clock = clock
+        self.round = 0
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def observe(self, response: dict) -> dict:
+        """Record the round an indexer response was served at; returns the response"""
+        current_round = response.get("current-round")
+        if current_round is not None:
+            with self._lock:
+                self.round = max(self.round, current_round)
+        return response
+
+    def caught_up(self, min_round: int | None) -> bool:
+        """Whether the indexer has reached `min_round` (always True without a hint)"""
+        if min_round is None or self.round >= min_round:
+            return True
+        now = self.clock()
+        with self._lock:
+            if now - self._checked_at < ROUND_SECONDS:
+                return False
+            self._checked_at = now
+        try:
+            health_round = self.health().get("round", 0)
+        except Exception:
+            return False
+        with self._lock:
+            self.round = max(self.round, health_round)
+            return self.round >= min_round
@@ -0,0 +1,185 @@
+import base64
+import logging
+import os
+import re
+import sys
+from typing import Iterable, Iterator
+
+from algosdk import abi, mnemonic
+from algosdk.account import address_from_private_key
+from algosdk.atomic_transaction_composer import AccountTransactionSigner, AtomicTransactionComposer
+from algosdk.encoding import decode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from backend.blockchain import MintResult
+from backend.confirmation import ConfirmationTracker
+from backend.events import issued_asset_ids
+
+logger = logging.getLogger(__name__)
+
+ISSUE_CREDENTIAL = abi.Method.from_signature("issue_credential(address,string,string)uint64")
+# Box name prefix of the contract's delegate registry
+DELEGATE_BOX_PREFIX = b"d"
+# Simulations (and sends) per issuance: the record box is named after the
+# next asset ID, which any creation on the network can take between
+# simulate and send
+ISSUE_ATTEMPTS = 3
+STALE_BOX_REFERENCE = re.compile(r"invalid Box reference|unavailable Box", re.IGNORECASE)
+
+
+class FeeBudgetExhausted(Exception):
+    """The worker would spend more on fees than it was given"""
+
+
+def delegate_box_name(address: str) -> bytes:
+    return DELEGATE_BOX_PREFIX + decode_address(address)
+
+
+def shard(records: Iterable[tuple], worker_index: int, worker_count: int) -> Iterator[tuple]:
+    """The records one worker out of `worker_count` is responsible for"""
+    for i, record in enumerate(records):
+        if i % worker_count == worker_index:
+            yield record
+
+
+class IssuerWorker:
+    """
+    One independent signing worker issuing through `issue_credential`.
+
+    Each worker signs with its own key, registered on the contract as a
+    delegate (see `add_delegate`), so several workers on separate hosts can
+    issue in parallel without sharing a hot key; the contract enforces each
+    delegate's quota. `fee_budget` caps the microAlgos this worker may spend.
+
+    The record box is named after the asset ID the call is about to create,
+    so each call is simulated first to learn its box references. If another
+    creation takes that ID before the call lands, the node rejects the now
+    unreferenced box and the call is simulated and sent again, up to
+    ISSUE_ATTEMPTS times. Confirmations come from `confirmation_tracker`
+    (pass the process-wide one).
+    """
+
+    def __init__(
+        self,
+        client,
+        app_id: int,
+        private_key: str,
+        fee_budget: int | None = None,
+        params_provider=None,
+        confirmation_tracker: ConfirmationTracker | None = None,
+    ):
+        self.client = client
+        self.app_id = app_id
+        self.address = address_from_private_key(private_key)
+        self.signer = AccountTransactionSigner(private_key)
+        self.fee_budget = fee_budget
+        self.fees_spent = 0
+        self.params_provider = params_provider
+        self.confirmation_tracker = confirmation_tracker or ConfirmationTracker(client, params_provider)
+
+    def _params(self):
+        params = self.params_provider.get() if self.params_provider else self.client.suggested_params()
+        params.flat_fee = True
+        # The outer call also pays for the inner asset creation
+        params.fee = params.min_fee * 2
+        return params
+
+    def _compose(self, params, student_address: str, name: str, url: str, boxes: list) -> AtomicTransactionComposer:
+        atc = AtomicTransactionComposer()
+        atc.add_method_call(
+            self.app_id,
+            ISSUE_CREDENTIAL,
+            self.address,
+            params,
+            self.signer,
+            method_args=[student_address, name, url],
+            boxes=boxes,
+        )
+        return atc
+
+    def _simulated_boxes(self, atc: AtomicTransactionComposer) -> list[tuple[int, bytes]]:
+        request = SimulateRequest(
+            txn_groups=[SimulateRequestTransactionGroup(txns=atc.gather_signatures())],
+            allow_unnamed_resources=True,
+        )
+        group = self.client.simulate_transactions(request)["txn-groups"][0]
+        if group.get("failure-message"):
+            raise RuntimeError(group["failure-message"])
+        accessed = [group.get("unnamed-resources-accessed", {})]
+        accessed += [result.get("unnamed-resources-accessed", {}) for result in group.get("txn-results", [])]
+        return [
+            (box["app"], base64.b64decode(box["name"]))
+            for resources in accessed
+            for box in resources.get("boxes", [])
+        ]
+
+    def issue(self, student_address: str, certificate_name: str, metadata_url: str) -> MintResult:
+        params = self._params()
+        if self.fee_budget is not None and self.fees_spent + params.fee > self.fee_budget:
+            raise FeeBudgetExhausted(f"{self.fees_spent} of {self.fee_budget} microAlgos spent")
+
+        for attempt in range(1, ISSUE_ATTEMPTS + 1):
+            boxes = [(self.app_id, delegate_box_name(self.address))]
+            draft = self._compose(params, student_address, certificate_name, metadata_url, boxes)
+            boxes += self._simulated_boxes(draft)
+            signed_txns = self._compose(params, student_address, certificate_name, metadata_url, boxes).gather_signatures()
+            try:
+                self.client.send_transactions(signed_txns)
+                break
+            except AlgodHTTPError as e:
+                if attempt == ISSUE_ATTEMPTS or not STALE_BOX_REFERENCE.search(str(e)):
+                    raise
+                logger.info(f"Asset ID taken before issuance landed, simulating again: {e}")
+
+        txid = signed_txns[0].get_txid()
+        self.confirmation_tracker.wait(txid, signed_txns[0].transaction.last_valid_round)
+        info = self.client.pending_transaction_info(txid)
+        self.fees_spent += params.fee
+        return MintResult(
+            student_address=student_address,
+            certificate_name=certificate_name,
+            asset_id=issued_asset_ids(info)[0],
+            txid=txid,
+        )
+
+    def issue_many(self, records: Iterable[tuple]) -> list[MintResult]:
+        """
+        Issue (student_address, certificate_name, metadata_url) records one by
+        one. Failures are recorded per record; once the fee budget runs out
+        the remaining records are returned unissued with an error.
+        """
+        results = []
+        exhausted = None
+        for student_address, certificate_name, metadata_url in records:
+            if exhausted:
+                results.append(MintResult(student_address, certificate_name, error=exhausted))
+                continue
+            try:
+                results.append(self.issue(student_address, certificate_name, metadata_url))
+            except FeeBudgetExhausted as e:
+                exhausted = f"Fee budget exhausted: {e}"
+                results.append(MintResult(student_address, certificate_name, error=exhausted))
+            except Exception as e:
+                results.append(MintResult(student_address, certificate_name, error=str(e)))
+        return results
+
+
+if __name__ == "__main__":
+    from backend.blockchain import CREDENTIAL_APP_ID, client, confirmation_tracker, params_provider
+    from backend.merkle import read_roster
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s")
+    roster_path, worker_index, worker_count = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+    budget = os.getenv("FEE_BUDGET_MICROALGOS")
+    worker = IssuerWorker(
+        client,
+        CREDENTIAL_APP_ID,
+        mnemonic.to_private_key(os.environ["DELEGATE_MNEMONIC"]),
+        fee_budget=int(budget) if budget else None,
+        params_provider=params_provider,
+        confirmation_tracker=confirmation_tracker,
+    )
+    results = worker.issue_many(shard(read_roster(roster_path), worker_index, worker_count))
+    issued = sum(result.ok for result in results)
+    print(f"Worker {worker_index}/{worker_count}: issued {issued} of {len(results)}, spent {worker.fees_spent} microAlgos")
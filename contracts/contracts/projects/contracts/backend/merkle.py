@@ -0,0 +1,155 @@
+import csv
+import hashlib
+import json
+import sys
+from itertools import islice
+from typing import Iterable, Iterator
+
+from algosdk.encoding import decode_address
+
+# Domain separation so a leaf can never be passed off as an inner node
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+HASH_SIZE = 32
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def certificate_hash(student_address: str, credential_name: str, metadata_url: str) -> bytes:
+    """Hash one roster entry; names and URLs are length-prefixed so fields can't run together"""
+    name = credential_name.encode()
+    url = metadata_url.encode()
+    return hashlib.sha256(
+        decode_address(student_address)
+        + len(name).to_bytes(2, "big") + name
+        + len(url).to_bytes(2, "big") + url
+    ).digest()
+
+
+def leaf_hash(cert_hash: bytes) -> bytes:
+    return hashlib.sha256(LEAF_PREFIX + cert_hash).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+class MerkleTree:
+    """
+    Binary Merkle tree over certificate hashes.
+
+    Every level is kept as one flat bytearray of 32-byte hashes instead of a
+    list of bytes objects, so a 100k-student cohort costs a few MB. An
+    unpaired node at the end of a level is carried up unchanged, which means
+    proofs can be shorter than the tree height; the verifier works out where
+    that happens from the leaf index and the anchored leaf count.
+    """
+
+    def __init__(self, levels: list[bytearray]):
+        self.levels = levels
+
+    @classmethod
+    def build(cls, cert_hashes: Iterable[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE) -> "MerkleTree":
+        leaves = bytearray()
+        iterator = iter(cert_hashes)
+        while chunk := list(islice(iterator, chunk_size)):
+            for cert_hash in chunk:
+                leaves += leaf_hash(cert_hash)
+        if not leaves:
+            raise ValueError("Cannot build a Merkle tree without leaves")
+
+        levels = [leaves]
+        while len(levels[-1]) > HASH_SIZE:
+            below = levels[-1]
+            count = len(below) // HASH_SIZE
+            level = bytearray()
+            for i in range(0, count - 1, 2):
+                level += node_hash(_node(below, i), _node(below, i + 1))
+            if count % 2:
+                level += _node(below, count - 1)
+            levels.append(level)
+        return cls(levels)
+
+    @property
+    def root(self) -> bytes:
+        return bytes(self.levels[-1])
+
+    @property
+    def leaf_count(self) -> int:
+        return len(self.levels[0]) // HASH_SIZE
+
+    def proof(self, index: int) -> list[bytes]:
+        """Sibling hashes from the leaf up to the root"""
+        if not 0 <= index < self.leaf_count:
+            raise IndexError(f"Leaf {index} out of range")
+        siblings = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level) // HASH_SIZE:
+                siblings.append(_node(level, sibling))
+            index //= 2
+        return siblings
+
+    def iter_proofs(self) -> Iterator[tuple[int, list[bytes]]]:
+        for index in range(self.leaf_count):
+            yield index, self.proof(index)
+
+
+def _node(level: bytearray, index: int) -> bytes:
+    return bytes(level[index * HASH_SIZE:(index + 1) * HASH_SIZE])
+
+
+def verify_proof(cert_hash: bytes, index: int, leaf_count: int, proof: list[bytes], root: bytes) -> bool:
+    """Check an inclusion proof produced by MerkleTree.proof against `root`"""
+    if not 0 <= index < leaf_count:
+        return False
+    node = leaf_hash(cert_hash)
+    siblings = iter(proof)
+    width = leaf_count
+    while width > 1:
+        if index ^ 1 < width:
+            sibling = next(siblings, None)
+            if sibling is None:
+                return False
+            node = node_hash(sibling, node) if index % 2 else node_hash(node, sibling)
+        index //= 2
+        width = (width + 1) // 2
+    return next(siblings, None) is None and node == root
+
+
+def read_roster(path: str) -> Iterator[tuple[str, str, str]]:
+    """Stream (student_address, credential_name, metadata_url) rows from a CSV file"""
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            yield row["student_address"], row["credential_name"], row["metadata_url"]
+
+
+def build_cohort(roster: Iterable[tuple[str, str, str]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> MerkleTree:
+    return MerkleTree.build((certificate_hash(*entry) for entry in roster), chunk_size)
+
+
+def write_proofs(tree: MerkleTree, roster: Iterable[tuple[str, str, str]], cohort_id: int, out) -> int:
+    """
+    Write one JSON line per student with everything needed to verify it later.
+    `roster` is streamed again in the same order it was built from.
+    """
+    written = 0
+    for (index, proof), (student_address, credential_name, metadata_url) in zip(tree.iter_proofs(), roster):
+        out.write(json.dumps({
+            "cohort_id": cohort_id,
+            "index": index,
+            "student_address": student_address,
+            "credential_name": credential_name,
+            "metadata_url": metadata_url,
+            "proof": [sibling.hex() for sibling in proof],
+        }) + "\n")
+        written += 1
+    return written
+
+
+if __name__ == "__main__":
+    roster_path, cohort_id, proofs_path = sys.argv[1], int(sys.argv[2]), sys.argv[3]
+    tree = build_cohort(read_roster(roster_path))
+    with open(proofs_path, "w") as out:
+        count = write_proofs(tree, read_roster(roster_path), cohort_id, out)
+    print(f"Cohort {cohort_id}: {count} certificates, root {tree.root.hex()}")
+    print(f"Anchor with anchor_cohort({cohort_id}, {tree.root.hex()}, {tree.leaf_count})")
@@ -0,0 +1,25 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+
+
+def iter_pages(
+    fetch_page: Callable[[str | None], dict],
+    token_key: str = "next-token",
+) -> Iterator[dict]:
+    """
+    Yield every page of a paginated algod/indexer listing.
+
+    `fetch_page(next_token)` is called with None for the first page. While the
+    caller works on one page the next one is already being fetched on a
+    background thread, so only two pages are ever held in memory.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(fetch_page, None)
+        while future is not None:
+            page = future.result()
+            token = page.get(token_key)
+            future = executor.submit(fetch_page, token) if token else None
+            yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,86 @@
+import copy
+import threading
+import time
+
+from algosdk.transaction import SuggestedParams
+
+# Approximate Algorand block time, used to estimate the current round
+ROUND_SECONDS = 2.8
+# Cached params older than this are refetched (about one round by default)
+DEFAULT_MAX_AGE_SECONDS = ROUND_SECONDS
+# Refetch once fewer than this many rounds remain before the cached last_valid
+DEFAULT_LAST_VALID_MARGIN = 50
+
+
+class SuggestedParamsProvider:
+    """
+    Thread-safe cache in front of `client.suggested_params()`.
+
+    Cached params are reused until the chain moves past the round they were
+    fetched in (reported through `observe_round`, or estimated from `max_age`),
+    or until the estimated current round comes within `last_valid_margin`
+    rounds of their validity window's end. Every caller gets its own copy, so
+    mutating fee fields on a returned object never leaks into the cache.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+        last_valid_margin: int = DEFAULT_LAST_VALID_MARGIN,
+        clock=time.monotonic,
+    ):
+        self.client = client
+        self.max_age = max_age
+        self.last_valid_margin = last_valid_margin
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._params: SuggestedParams | None = None
+        self._fetched_at = 0.0
+        self._latest_round = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _is_fresh(self, now: float) -> bool:
+        if self._params is None:
+            return False
+        if self._latest_round > self._params.first:
+            return False
+        age = now - self._fetched_at
+        if age >= self.max_age:
+            return False
+        estimated_round = self._params.first + int(age / ROUND_SECONDS)
+        return estimated_round + self.last_valid_margin < self._params.last
+
+    def get(self) -> SuggestedParams:
+        """Return suggested params, fetching from algod only when stale"""
+        with self._lock:
+            now = self._clock()
+            if self._is_fresh(now):
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._params = self.client.suggested_params()
+                self._fetched_at = now
+                self._latest_round = max(self._latest_round, self._params.first)
+            return copy.copy(self._params)
+
+    def observe_round(self, round_num: int) -> None:
+        """Record that the chain has reached `round_num` (e.g. from a block follower)"""
+        with self._lock:
+            self._latest_round = max(self._latest_round, round_num)
+
+    def invalidate(self) -> None:
+        """Drop the cached params so the next `get` refetches them"""
+        with self._lock:
+            self._params = None
+
+    def stats(self) -> dict:
+        """Hit/miss counters for confirming the cache saving under load"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
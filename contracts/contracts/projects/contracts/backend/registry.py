@@ -0,0 +1,155 @@
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from algosdk import abi
+from algosdk.encoding import decode_address
+from algosdk.error import AlgodHTTPError
+
+from backend.merkle import verify_proof
+
+# Box name prefix of the CredentialVerifier registry (BoxMap key_prefix)
+CREDENTIAL_BOX_PREFIX = b"c"
+# Mirrors CredentialRecord in smart_contracts/credential_verifier/contract.py
+CREDENTIAL_RECORD_TYPE = abi.ABIType.from_string("(address,byte[32],uint64,uint8,uint64)")
+STATUS_ACTIVE = 1
+STATUS_REVOKED = 2
+# Cohort Merkle anchors (CohortAnchor in the contract)
+COHORT_BOX_PREFIX = b"m"
+COHORT_ANCHOR_TYPE = abi.ABIType.from_string("(byte[32],uint64,uint64)")
+# Per-student credential index: pages of packed uint64 Asset IDs, page 0
+# starting with the student's total count
+STUDENT_PAGE_BOX_PREFIX = b"i"
+STUDENT_PAGE_IDS = 126
+STUDENT_INDEX_HEADER_BYTES = 8
+# Fixed params of the blank credentials mint_pool creates
+ARC19_TEMPLATE_URL = "template-ipfs://{ipfs:0:dag-pb:reserve:sha2-256}"
+POOL_CREDENTIAL_NAME = "Credential"
+PAGE_FETCH_CONCURRENCY = 8
+
+
+@dataclass
+class RegistryRecord:
+    """Decoded registry box for one credential"""
+    asset_id: int
+    holder: str
+    document_hash: bytes
+    issue_round: int
+    status: int
+    serial: int
+
+    @property
+    def active(self) -> bool:
+        return self.status == STATUS_ACTIVE
+
+
+@dataclass
+class CohortAnchor:
+    """Decoded Merkle anchor of one cohort"""
+    cohort_id: int
+    merkle_root: bytes
+    leaf_count: int
+    anchor_round: int
+
+
+def credential_box_name(asset_id: int) -> bytes:
+    return CREDENTIAL_BOX_PREFIX + asset_id.to_bytes(8, "big")
+
+
+def decode_credential_record(asset_id: int, value: bytes) -> RegistryRecord:
+    holder, document_hash, issue_round, status, serial = CREDENTIAL_RECORD_TYPE.decode(value)
+    return RegistryRecord(asset_id, holder, bytes(document_hash), issue_round, status, serial)
+
+
+def cohort_box_name(cohort_id: int) -> bytes:
+    return COHORT_BOX_PREFIX + cohort_id.to_bytes(8, "big")
+
+
+def student_page_box_name(address: str, page: int) -> bytes:
+    return STUDENT_PAGE_BOX_PREFIX + decode_address(address) + page.to_bytes(8, "big")
+
+
+def read_box(client, app_id: int, box_name: bytes) -> bytes | None:
+    try:
+        response = client.application_box_by_name(app_id, box_name)
+    except AlgodHTTPError as e:
+        if e.code == 404:
+            return None
+        raise
+    return base64.b64decode(response["value"])
+
+
+def read_global_uint(client, app_id: int, key: bytes) -> int:
+    """Current value of one of the app's global uint64s (0 when unset)"""
+    state = client.application_info(app_id)["params"].get("global-state", [])
+    for entry in state:
+        if base64.b64decode(entry["key"]) == key:
+            return entry["value"].get("uint", 0)
+    return 0
+
+
+def read_credential_record(client, app_id: int, asset_id: int) -> RegistryRecord | None:
+    """Read a credential's registry record straight from algod (one box read, no indexer)"""
+    value = read_box(client, app_id, credential_box_name(asset_id))
+    return decode_credential_record(asset_id, value) if value is not None else None
+
+
+def _decode_student_page(value: bytes | None, page: int) -> list[int]:
+    value = value or b""
+    if page == 0:
+        value = value[STUDENT_INDEX_HEADER_BYTES:]
+    return [int.from_bytes(value[i:i + 8], "big") for i in range(0, len(value), 8)]
+
+
+def read_student_credential_count(client, app_id: int, address: str) -> int:
+    """How many credentials a student has been issued, from the header of their first index page"""
+    value = read_box(client, app_id, student_page_box_name(address, 0))
+    return int.from_bytes(value[:STUDENT_INDEX_HEADER_BYTES], "big") if value is not None else 0
+
+
+def read_student_credential_page(client, app_id: int, address: str, page: int) -> list[int]:
+    """One page (up to STUDENT_PAGE_IDS) of the Asset IDs issued to a student, oldest first"""
+    return _decode_student_page(read_box(client, app_id, student_page_box_name(address, page)), page)
+
+
+def read_student_credentials(client, app_id: int, address: str) -> list[int]:
+    """
+    Every Asset ID issued to a student, read from the contract's index boxes
+    on algod: page 0, whose header gives the count, then any further pages
+    (one page per STUDENT_PAGE_IDS credentials).
+    """
+    first = read_box(client, app_id, student_page_box_name(address, 0))
+    if first is None:
+        return []
+    count = int.from_bytes(first[:STUDENT_INDEX_HEADER_BYTES], "big")
+    page_count = -(-count // STUDENT_PAGE_IDS)
+
+    def fetch(page: int) -> list[int]:
+        return read_student_credential_page(client, app_id, address, page)
+
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_CONCURRENCY) as executor:
+        later = [asset_id for page in executor.map(fetch, range(1, page_count)) for asset_id in page]
+    return _decode_student_page(first, 0) + later
+
+
+def read_cohort_anchor(client, app_id: int, cohort_id: int) -> CohortAnchor | None:
+    value = read_box(client, app_id, cohort_box_name(cohort_id))
+    if value is None:
+        return None
+    merkle_root, leaf_count, anchor_round = COHORT_ANCHOR_TYPE.decode(value)
+    return CohortAnchor(cohort_id, bytes(merkle_root), leaf_count, anchor_round)
+
+
+def verify_cohort_membership(
+    client,
+    app_id: int,
+    cohort_id: int,
+    cert_hash: bytes,
+    index: int,
+    proof: list[bytes],
+) -> bool:
+    """Check a student's inclusion proof against the cohort root anchored on-chain"""
+    anchor = read_cohort_anchor(client, app_id, cohort_id)
+    if anchor is None:
+        return False
+    return verify_proof(cert_hash, index, anchor.leaf_count, proof, anchor.merkle_root)
@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.registry import read_box, read_global_uint
+
+# Mirrors the revocation pages in smart_contracts/credential_verifier/contract.py
+REVOCATION_BOX_PREFIX = b"r"
+REVOCATION_PAGE_BYTES = 1024
+REVOCATION_PAGE_BITS = REVOCATION_PAGE_BYTES * 8
+PAGE_FETCH_CONCURRENCY = 8
+
+
+def revocation_box_name(page: int) -> bytes:
+    return REVOCATION_BOX_PREFIX + page.to_bytes(8, "big")
+
+
+class RevocationBitmap:
+    """
+    In-memory copy of the contract's revocation bitset.
+
+    Bit `serial` is set once the credential with that serial is revoked. Bits
+    are numbered like the AVM's setbit on byte arrays: bit 0 is the high bit
+    of the first byte. Pages that were never written are all zeros, so only
+    pages with revocations take memory; lookups are O(1).
+    """
+
+    def __init__(self, pages: dict[int, bytes], serial_count: int):
+        self.pages = pages
+        self.serial_count = serial_count
+
+    def is_revoked(self, serial: int) -> bool:
+        page = self.pages.get(serial // REVOCATION_PAGE_BITS)
+        if page is None:
+            return False
+        bit = serial % REVOCATION_PAGE_BITS
+        return bool(page[bit // 8] & (0x80 >> (bit % 8)))
+
+    def revoked_count(self) -> int:
+        return sum(bin(byte).count("1") for page in self.pages.values() for byte in page)
+
+
+def read_serial_count(client, app_id: int) -> int:
+    """Number of serials handed out so far (the contract's next_serial)"""
+    return read_global_uint(client, app_id, b"next_serial")
+
+
+def download_revocations(client, app_id: int) -> RevocationBitmap:
+    """Fetch every revocation page once; one box read per 8192 credentials"""
+    serial_count = read_serial_count(client, app_id)
+    page_count = -(-serial_count // REVOCATION_PAGE_BITS)
+
+    def fetch(page: int) -> tuple[int, bytes | None]:
+        return page, read_box(client, app_id, revocation_box_name(page))
+
+    with ThreadPoolExecutor(max_workers=PAGE_FETCH_CONCURRENCY) as executor:
+        pages = {page: value for page, value in executor.map(fetch, range(page_count)) if value is not None}
+    return RevocationBitmap(pages, serial_count)
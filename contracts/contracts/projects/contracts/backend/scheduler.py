@@ -0,0 +1,210 @@
+import http.client
+import logging
+import random
+import threading
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# In-flight limit bounds for one service
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 64
+# Responses slower than this count as congestion even without a 429
+DEFAULT_LATENCY_TARGET = 1.0
+THROTTLE_BACKOFF = 0.5
+LATENCY_BACKOFF = 0.9
+
+# Retries: full jitter on an exponential schedule, and never more retries
+# than RETRY_RATIO of first attempts plus RETRY_RESERVE per second
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_BASE_DELAY = 0.1
+DEFAULT_MAX_DELAY = 5.0
+RETRY_RATIO = 0.2
+RETRY_RESERVE = 10
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit adjusted by AIMD.
+
+    Every success within the latency target adds 1/limit (about +1 per
+    round trip's worth of requests); a 429 halves the limit and a slow
+    response trims it by 10%. Decreases happen at most once per round trip
+    (a moving average of latency), so the burst of 429s that one window of
+    requests runs into only counts once.
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_LIMIT,
+        minimum: int = DEFAULT_MIN_LIMIT,
+        maximum: int = DEFAULT_MAX_LIMIT,
+        latency_target: float = DEFAULT_LATENCY_TARGET,
+        clock=time.monotonic,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.clock = clock
+        self.in_flight = 0
+        self.round_trip = 0.0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def _decrease(self, factor: float) -> None:
+        now = self.clock()
+        if now - self._last_decrease < self.round_trip:
+            return
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * factor)
+
+    def on_success(self, latency: float) -> None:
+        with self._condition:
+            self.round_trip = latency if not self.round_trip else 0.8 * self.round_trip + 0.2 * latency
+            if latency > self.latency_target:
+                self._decrease(LATENCY_BACKOFF)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def on_throttle(self) -> None:
+        with self._condition:
+            self._decrease(THROTTLE_BACKOFF)
+
+
+class RetryBudget:
+    """
+    Token bucket capping retries at `ratio` of first attempts plus
+    `reserve` per second, so retries grow with traffic but can never
+    multiply the load on a node that is down.
+    """
+
+    def __init__(self, ratio: float = RETRY_RATIO, reserve: float = RETRY_RESERVE, clock=time.monotonic):
+        self.ratio = ratio
+        self.reserve = reserve
+        self.clock = clock
+        self.capacity = float(reserve)
+        self.tokens = float(reserve)
+        self._refilled_at = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, amount: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill(self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            now = self.clock()
+            self._refill((now - self._refilled_at) * self.reserve)
+            self._refilled_at = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+def _status(error: Exception) -> int | None:
+    return getattr(error, "code", None)
+
+
+def is_throttled(error: Exception) -> bool:
+    return _status(error) == 429
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, (http.client.HTTPException, OSError)):
+        return True
+    return _status(error) in RETRYABLE_STATUSES
+
+
+class RequestScheduler:
+    """
+    Runs calls to one service under an AdaptiveLimiter, retrying throttled
+    and transient failures with jittered exponential backoff while the
+    RetryBudget allows.
+    """
+
+    def __init__(
+        self,
+        limiter: AdaptiveLimiter | None = None,
+        retry_budget: RetryBudget | None = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        sleep=time.sleep,
+        rng=random.random,
+    ):
+        self.limiter = limiter or AdaptiveLimiter()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.rng = rng
+        self.throttled = 0
+        self.retries = 0
+
+    def call(self, fn: Callable, *args, **kwargs):
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            started = time.monotonic()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                error = e
+            else:
+                self.limiter.on_success(time.monotonic() - started)
+                if attempt == 0:
+                    self.retry_budget.deposit()
+                return result
+            finally:
+                self.limiter.release()
+
+            if is_throttled(error):
+                self.throttled += 1
+                self.limiter.on_throttle()
+            attempt += 1
+            if not is_retryable(error) or attempt >= self.max_attempts or not self.retry_budget.withdraw():
+                raise error
+            self.retries += 1
+            delay = self.rng() * min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+            logger.debug(f"Retrying {getattr(fn, '__name__', fn)} in {delay:.2f}s after: {error}")
+            self.sleep(delay)
+
+
+class ScheduledClient:
+    """Proxy that routes every method call of an SDK client through a RequestScheduler"""
+
+    def __init__(self, client, scheduler: RequestScheduler):
+        self._client = client
+        self.scheduler = scheduler
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
+
+        def scheduled(*args, **kwargs):
+            return self.scheduler.call(attribute, *args, **kwargs)
+
+        scheduled.__name__ = name
+        return scheduled
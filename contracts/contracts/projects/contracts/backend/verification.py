@@ -0,0 +1,161 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from algosdk.logic import get_application_address
+
+from backend import blockchain
+from backend.credential_index import CredentialIndex
+from backend.revocation import RevocationBitmap
+
+DEFAULT_MAX_CONCURRENCY = 32
+
+
+@dataclass
+class VerificationResult:
+    """Verdict for one credential asset; `valid` is None when a lookup failed"""
+    asset_id: int
+    valid: bool | None
+    reason: str | None = None
+    holder: str | None = None
+    metadata_url: str | None = None
+    name: str | None = None
+    creator: str | None = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one underlying call.
+
+    While a call for a key is in flight, later callers wait on the same
+    Future instead of issuing a duplicate request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: dict = {}
+        self.coalesced = 0
+
+    def do(self, key, fn: Callable):
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                leader = True
+        if not leader:
+            return future.result()
+        try:
+            future.set_result(fn())
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return future.result()
+
+
+class VerificationEngine:
+    """
+    Verify credential assets in bulk against the trusted issuers.
+
+    An asset is valid when it was created by the CredentialVerifier app
+    account or the institution account, carries the CERT unit name and is
+    not revoked. Lookups run with at most `max_concurrency` in flight, params
+    come from the shared credential cache, and concurrent checks of the same
+    asset (within or across verify_many calls) share a single request. A
+    failed lookup (e.g. an indexer or algod outage) says nothing about the
+    credential, so its result is indeterminate (`valid` is None), not invalid.
+
+    Revocation is checked locally: `index` maps an asset to its serial (and
+    knows revocations the follower has seen), and a downloaded `revocations`
+    bitmap answers for each serial without touching the chain.
+    """
+
+    def __init__(
+        self,
+        trusted_creators: Iterable[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        unit_name: str = blockchain.CREDENTIAL_UNIT_NAME,
+        index: CredentialIndex | None = None,
+        revocations: RevocationBitmap | None = None,
+    ):
+        self.trusted_creators = set(trusted_creators)
+        self.unit_name = unit_name
+        self.index = index
+        self.revocations = revocations
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._params = SingleFlight()
+        self._holders = SingleFlight()
+
+    def is_revoked(self, asset_id: int) -> bool:
+        record = self.index.get_record(asset_id) if self.index is not None else None
+        if record is None:
+            return False
+        if record.revoked:
+            return True
+        return self.revocations is not None and record.serial is not None and self.revocations.is_revoked(record.serial)
+
+    def verify(self, asset_id: int) -> VerificationResult:
+        try:
+            params = self._params.do(asset_id, lambda: blockchain.get_credential_details(asset_id))
+        except Exception as e:
+            return VerificationResult(asset_id, None, reason=f"lookup failed: {e}")
+        if not params:
+            return VerificationResult(asset_id, False, reason="asset not found")
+
+        result = VerificationResult(
+            asset_id,
+            False,
+            metadata_url=params.get("url"),
+            name=params.get("name"),
+            creator=params.get("creator"),
+        )
+        if result.creator not in self.trusted_creators:
+            result.reason = "untrusted creator"
+        elif params.get("unit-name") != self.unit_name:
+            result.reason = "not a credential asset"
+        elif self.is_revoked(asset_id):
+            result.reason = "revoked"
+        else:
+            try:
+                result.holder = self._holders.do(
+                    asset_id, lambda: blockchain.get_credential_holder(asset_id)
+                )
+                result.valid = True
+            except Exception as e:
+                result.valid = None
+                result.reason = f"holder lookup failed: {e}"
+        return result
+
+    def verify_many(self, asset_ids: Iterable[int]) -> list[VerificationResult]:
+        """Verify every asset and return the results in input order"""
+        return list(self._executor.map(self.verify, asset_ids))
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+
+_default_engine: VerificationEngine | None = None
+_default_engine_lock = threading.Lock()
+
+
+def default_engine() -> VerificationEngine:
+    """Engine trusting the configured CredentialVerifier app and institution"""
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            creators = [get_application_address(blockchain.CREDENTIAL_APP_ID)]
+            if blockchain.INSTITUTION_ADDRESS:
+                creators.append(blockchain.INSTITUTION_ADDRESS)
+            _default_engine = VerificationEngine(creators, index=blockchain.credential_index)
+        return _default_engine
+
+
+def verify_many(asset_ids: Iterable[int]) -> list[VerificationResult]:
+    """Bulk-verify credentials with the default engine"""
+    return default_engine().verify_many(asset_ids)
@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "address", "name": "institution"}], "name": "create", "returns": {"type": "void"}, "desc": "Initialize the contract with the authorized institution", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "student_address"}, {"type": "string", "name": "credential_name"}, {"type": "string", "name": "metadata_url"}], "name": "issue_credential", "returns": {"type": "uint64"}, "desc": "Issue a credential to a student.\nMints an NFT and returns the Asset ID. Only the authorized institution can call this.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset_id"}], "name": "verify_credential", "returns": {"type": "string"}, "desc": "Verify if a credential is valid (dummy for now)", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_contract_info", "returns": {"type": "string"}, "desc": "Get contract information", "events": [], "readonly": true, "recommendations": {}}], "name": "CredentialVerifier", "state": {"keys": {"box": {}, "global": {"authorized_institution": {"key": "YXV0aG9yaXplZF9pbnN0aXR1dGlvbg==", "keyType": "AVMString", "valueType": "address"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CyAEAQAgAiYBFmF1dGhvcml6ZWRfaW5zdGl0dXRpb24xGRREMRhBAFeCAwQ4jK/7BDBqL1MELu67uTYaAI4DAFYAtwABAIA1FR98dQAvQ3JlZGVudGlhbFZlcmlmaWVyIC0gQWxnb3JhbmQgQ3JlZGVudGlhbCBTeXN0ZW2wIkOABMxpTqo2GgCOAQABADYaAUkVJBJEKExnIkM2GgFJFSQSRDYaAkkjWSUISwEVEkRXAgA2GgNJI1klCEsBFRJEVwIAMQAjKGVEEkSxMgpPA7IqsimyJ4AEQ0VSVLIlsiYjsiMisiKBA7IQI7IBs7Q8FoAEFR98dUxQsCJDNhoBFYEIEkSADhUffHUACFZlcmlmaWVksCJD", "clear": "C4EBQw=="}, "desc": "Algorand Credential Verifier Smart Contract", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMzIgMgogICAgYnl0ZWNibG9jayAiYXV0aG9yaXplZF9pbnN0aXR1dGlvbiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIENyZWRlbnRpYWxWZXJpZmllcihBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEA5CiAgICBwdXNoYnl0ZXNzIDB4Mzg4Y2FmZmIgMHgzMDZhMmY1MyAweDJlZWViYmI5IC8vIG1ldGhvZCAiaXNzdWVfY3JlZGVudGlhbChhZGRyZXNzLHN0cmluZyxzdHJpbmcpdWludDY0IiwgbWV0aG9kICJ2ZXJpZnlfY3JlZGVudGlhbCh1aW50NjQpc3RyaW5nIiwgbWV0aG9kICJnZXRfY29udHJhY3RfaW5mbygpc3RyaW5nIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggaXNzdWVfY3JlZGVudGlhbCB2ZXJpZnlfY3JlZGVudGlhbCBtYWluX2dldF9jb250cmFjdF9pbmZvX3JvdXRlQDcKICAgIGVycgoKbWFpbl9nZXRfY29udHJhY3RfaW5mb19yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAyZjQzNzI2NTY0NjU2ZTc0Njk2MTZjNTY2NTcyNjk2NjY5NjU3MjIwMmQyMDQxNmM2NzZmNzI2MTZlNjQyMDQzNzI2NTY0NjU2ZTc0Njk2MTZjMjA1Mzc5NzM3NDY1NmQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfTm9PcEA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQ3JlZGVudGlhbFZlcmlmaWVyKEFSQzRDb250cmFjdCk6CiAgICBwdXNoYnl0ZXMgMHhjYzY5NGVhYSAvLyBtZXRob2QgImNyZWF0ZShhZGRyZXNzKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBjcmVhdGUKICAgIGVycgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci5jcmVhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxMQogICAgLy8gQGFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNAogICAgLy8gc2VsZi5hdXRob3JpemVkX2luc3RpdHV0aW9uLnZhbHVlID0gaW5zdGl0dXRpb24KICAgIGJ5dGVjXzAgLy8gImF1dGhvcml6ZWRfaW5zdGl0dXRpb24iCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTEKICAgIC8vIEBhYmltZXRob2QoY3JlYXRlPSJyZXF1aXJlIikKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY3JlZGVudGlhbF92ZXJpZmllci5jb250cmFjdC5DcmVkZW50aWFsVmVyaWZpZXIuaXNzdWVfY3JlZGVudGlhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cmlzc3VlX2NyZWRlbnRpYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNgogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyAxCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmF1dGhvcml6ZWRfaW5zdGl0dXRpb24udmFsdWUsICJPbmx5IHRoZSBhdXRob3JpemVkIGluc3RpdHV0aW9uIGNhbiBpc3N1ZSBjcmVkZW50aWFscyIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18wIC8vICJhdXRob3JpemVkX2luc3RpdHV0aW9uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmF1dGhvcml6ZWRfaW5zdGl0dXRpb24gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGF1dGhvcml6ZWQgaW5zdGl0dXRpb24gY2FuIGlzc3VlIGNyZWRlbnRpYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyNy0zNgogICAgLy8gIyBNaW50IHRoZSBORlQgdXNpbmcgYW4gaW5uZXIgdHJhbnNhY3Rpb24KICAgIC8vIGFzc2V0X2NyZWF0ZSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9MSwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGFzc2V0X25hbWU9Y3JlZGVudGlhbF9uYW1lLAogICAgLy8gICAgIHVuaXRfbmFtZT1TdHJpbmcoIkNFUlQiKSwKICAgIC8vICAgICB1cmw9bWV0YWRhdGFfdXJsLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgICMgQ29udHJhY3QgaXMgdGhlIG1hbmFnZXIKICAgIC8vICAgICByZXNlcnZlPXN0dWRlbnRfYWRkcmVzcywgIyBSZXNlcnZlIGlzIHRoZSBzdHVkZW50CiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNAogICAgLy8gbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAgIyBDb250cmFjdCBpcyB0aGUgbWFuYWdlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIHVuY292ZXIgMwogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VVJMCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMgogICAgLy8gdW5pdF9uYW1lPVN0cmluZygiQ0VSVCIpLAogICAgcHVzaGJ5dGVzICJDRVJUIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzAKICAgIC8vIGRlY2ltYWxzPTAsCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyOQogICAgLy8gdG90YWw9MSwKICAgIGludGNfMCAvLyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI3LTI4CiAgICAvLyAjIE1pbnQgdGhlIE5GVCB1c2luZyBhbiBpbm5lciB0cmFuc2FjdGlvbgogICAgLy8gYXNzZXRfY3JlYXRlID0gaXR4bi5Bc3NldENvbmZpZygKICAgIHB1c2hpbnQgMyAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI3LTM2CiAgICAvLyAjIE1pbnQgdGhlIE5GVCB1c2luZyBhbiBpbm5lciB0cmFuc2FjdGlvbgogICAgLy8gYXNzZXRfY3JlYXRlID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xLAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1jcmVkZW50aWFsX25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiQ0VSVCIpLAogICAgLy8gICAgIHVybD1tZXRhZGF0YV91cmwsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAgIyBDb250cmFjdCBpcyB0aGUgbWFuYWdlcgogICAgLy8gICAgIHJlc2VydmU9c3R1ZGVudF9hZGRyZXNzLCAjIFJlc2VydmUgaXMgdGhlIHN0dWRlbnQKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNgogICAgLy8gQGFiaW1ldGhvZAogICAgaXRvYgogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNyZWRlbnRpYWxfdmVyaWZpZXIuY29udHJhY3QuQ3JlZGVudGlhbFZlcmlmaWVyLnZlcmlmeV9jcmVkZW50aWFsW3JvdXRpbmddKCkgLT4gdm9pZDoKdmVyaWZ5X2NyZWRlbnRpYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMDg1NjY1NzI2OTY2Njk2NTY0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [202], "errorMessage": "Only the authorized institution can issue credentials"}, {"pc": [200], "errorMessage": "check self.authorized_institution exists"}, {"pc": [168, 184], "errorMessage": "invalid array length header"}, {"pc": [175, 191], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [149, 162], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [259], "errorMessage": "invalid number of bytes for arc4.uint64"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": []}, "methods": [{"actions": {"call": [], "create": ["NoOp"]}, "args": [{"type": "address", "name": "institution"}], "name": "create", "returns": {"type": "void"}, "desc": "Initialize the contract with the authorized institution", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "delegate"}, {"type": "uint64", "name": "quota"}], "name": "add_delegate", "returns": {"type": "void"}, "desc": "Let `delegate` issue credentials, at most `quota` of them (0 for no limit).\nRe-adding a delegate changes its quota and keeps its issued count.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "delegate"}], "name": "remove_delegate", "returns": {"type": "void"}, "desc": "Revoke a delegate's right to issue", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "student_address"}, {"type": "string", "name": "credential_name"}, {"type": "string", "name": "metadata_url"}], "name": "issue_credential", "returns": {"type": "uint64"}, "desc": "Issue a credential to a student.\nMints an NFT, records it in the credential registry and returns the Asset ID. Only the authorized institution or one of its delegates can call this.", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "holder"}, {"type": "byte[32]", "name": "document_hash"}, {"type": "uint64", "name": "serial"}], "name": "CredentialIssued", "desc": "ARC-28 event logged for every credential issued"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "student_addresses"}, {"type": "string[]", "name": "credential_names"}, {"type": "string[]", "name": "metadata_urls"}], "name": "issue_credentials_batch", "returns": {"type": "uint64[]"}, "desc": "Issue many credentials in one app call and return their Asset IDs in order.\nInner transactions carry no fee, so the outer call pays for every mint (fee pooling), and missing opcode budget is bought with OpUp calls paid from the same group credit.", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "holder"}, {"type": "byte[32]", "name": "document_hash"}, {"type": "uint64", "name": "serial"}], "name": "CredentialIssued", "desc": "ARC-28 event logged for every credential issued"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "count"}], "name": "mint_pool", "returns": {"type": "uint64[]"}, "desc": "Pre-mint blank ARC-19 credentials (e.g. off-peak) so issuing one later\nis a reserve reconfiguration plus a transfer instead of a full mint. Blank credentials have the app account as reserve and hold no record.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset"}, {"type": "address", "name": "student_address"}, {"type": "byte[32]", "name": "metadata_digest"}], "name": "assign_credential", "returns": {"type": "void"}, "desc": "Issue a pre-minted credential: point its reserve at the metadata CID\ndigest and transfer it to the student, who must already be opted in (e.g. earlier in the same group).", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "holder"}, {"type": "byte[32]", "name": "document_hash"}, {"type": "uint64", "name": "serial"}], "name": "CredentialIssued", "desc": "ARC-28 event logged for every credential issued"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "asset_ids"}], "name": "revoke_credentials", "returns": {"type": "void"}, "desc": "Revoke credentials by Asset ID. Each one costs a record update and a\nsingle bit flip in its revocation page, regardless of how many exist.", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "holder"}, {"type": "byte[32]", "name": "document_hash"}], "name": "CredentialRevoked", "desc": "ARC-28 event logged for every credential revoked"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "cohort_id"}, {"type": "byte[32]", "name": "merkle_root"}, {"type": "uint64", "name": "leaf_count"}], "name": "anchor_cohort", "returns": {"type": "void"}, "desc": "Anchor the Merkle root of a whole cohort's certificates in one transaction.\nStudents prove membership off-chain with an inclusion proof against this root. Anchors are write-once.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset_id"}], "name": "verify_credential", "returns": {"type": "string"}, "desc": "Verify a credential with a single registry box read", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "asset_ids"}], "name": "verify_credentials", "returns": {"type": "(uint64,bool,address)[]"}, "desc": "Verify many credentials in one call, meant to be run through simulate.\nA credential is valid when its registry record is active and the asset is a CERT created by this app. Unknown IDs cost one box lookup and no asset reference.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "asset_id"}], "name": "get_credential", "returns": {"type": "(address,byte[32],uint64,uint8,uint64)", "struct": "CredentialRecord"}, "desc": "Return the full registry record for a credential", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "student_address"}, {"type": "uint64", "name": "page"}], "name": "list_credentials", "returns": {"type": "(uint64,uint64[])", "struct": "StudentCredentials"}, "desc": "Return one page of the Asset IDs issued to a student, oldest first, and\ntheir total count; pages past the end are empty.", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "delegate"}], "name": "get_delegate", "returns": {"type": "(uint64,uint64)", "struct": "IssuerDelegate"}, "desc": "Return a delegate's quota and how many credentials it has issued", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "cohort_id"}], "name": "get_cohort", "returns": {"type": "(byte[32],uint64,uint64)", "struct": "CohortAnchor"}, "desc": "Return the anchored Merkle root of a cohort", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_contract_info", "returns": {"type": "string"}, "desc": "Get contract information", "events": [], "readonly": true, "recommendations": {}}], "name": "CredentialVerifier", "state": {"keys": {"box": {}, "global": {"authorized_institution": {"key": "YXV0aG9yaXplZF9pbnN0aXR1dGlvbg==", "keyType": "AVMString", "valueType": "address"}, "next_serial": {"key": "bmV4dF9zZXJpYWw=", "keyType": "AVMString", "valueType": "AVMUint64"}, "pool_size": {"key": "cG9vbF9zaXpl", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"credentials": {"keyType": "uint64", "valueType": "CredentialRecord", "prefix": "Yw=="}, "cohorts": {"keyType": "uint64", "valueType": "CohortAnchor", "prefix": "bQ=="}, "revocations": {"keyType": "uint64", "valueType": "AVMBytes", "prefix": "cg=="}, "delegates": {"keyType": "address", "valueType": "IssuerDelegate", "prefix": "ZA=="}, "student_pages": {"keyType": "AVMBytes", "valueType": "AVMBytes", "prefix": "aQ=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"CohortAnchor": [{"name": "merkle_root", "type": "byte[32]"}, {"name": "leaf_count", "type": "uint64"}, {"name": "anchor_round", "type": "uint64"}], "CredentialRecord": [{"name": "holder", "type": "address"}, {"name": "document_hash", "type": "byte[32]"}, {"name": "issue_round", "type": "uint64"}, {"name": "status", "type": "uint8"}, {"name": "serial", "type": "uint64"}], "IssuerDelegate": [{"name": "quota", "type": "uint64"}, {"name": "issued", "type": "uint64"}], "StudentCredentials": [{"name": "total", "type": "uint64"}, {"name": "asset_ids", "type": "uint64[]"}]}, "byteCode": {"approval": "CyAEAAEIAiYKBBUffHUWYXV0aG9yaXplZF9pbnN0aXR1dGlvbgFkAWMJcG9vbF9zaXplAWkLbmV4dF9zZXJpYWwCAAAEQ0VSVAMGgQExGEAACCcGImcnBCJnMRkURDEYQQCrgg8E8ViEeQTkqUIdBDiMr/sE0twh0wTY9styBO0ejK4EybeUZQTrlfCWBDBqL1MELdkIKAQz2+E0BKSujKwEIrqDewQbO5gmBC7uu7k2GgCODwCSANUA8gEpAngDLQPDBFoElwTmBZgFsAZEBl0AAQCANRUffHUAL0NyZWRlbnRpYWxWZXJpZmllciAtIEFsZ29yYW5kIENyZWRlbnRpYWwgU3lzdGVtsCNDgATMaU6qNhoAjgEAPACKAgCL/oEKCIsAMgwNQQAqsYEGshCBBbIZJwmyHicJsh+L/40CAAsABLNC/9syALIBQv/1IrIBQv/viTYaAUkVgSASRClMZyNDNhoBSRWBIBJENhoCSU4CFSQSRDEAIillRBJEgAgAAAAAAAAAAEwqTFBJvUUBQQAISb5EVwgIRQJLAksCUEsBTL8jQzYaAUkVgSASRDEAIillRBJEKkxQSb1FAUS8SCNDNhoBSRWBIBJENhoCSSJZJQhLARUSRFcCADYaA0kiWSUISwEVEkRXAgAjiAVYiAWoFihMULAjQyJJgABHBDYaAUcCIllJTgKBIAslCEwVEkQ2GgJJIllJTgIlC0xJFUxXAgAiSUsFDEEAJEcCJQtLA0lPAllJSwdJTgQSREsBFVIiWSUICEUFIwhFAUL/1UsDJQhLAxJENhoDSSJZSUUOJQtFCkkVRQlXAgBFDiJFCksJSwwMQQAlSwlJJQtLD0lPAllJSwxJTgQSREsBFVIiWSUICEUKIwhFCkL/00sIJQhLCBJESwRLBhJBAJZLC0sGEkEAjiNESwVJgQsOREmIBISBrAILIoj+TicHRQ0iRQtLCksGDEEAY0sGVwIASwtJTgKBIAuBIFhLAUsHDERLASULSwRJTgJLAVlLAksBWSUITwNOAlhXAgBLA0sQDERLEUlPA1lKWSUIWFcCAIgEeBZLDklPAlBMIlkjCBZXBgJcAEUOIwhFC0L/lShLDVCwI0MiQv9vNhoBSRUkEkQXSTEAIillRBJESYFADkSBZAsiiP2zJwciSUsDDEEAerEyCkmyKrIpgDB0ZW1wbGF0ZS1pcGZzOi8ve2lwZnM6MDpkYWctcGI6cmVzZXJ2ZTpzaGEyLTI1Nn2yJycIsiWACkNyZWRlbnRpYWyyJiKyIyOyIoEDshAisgGztDwWSwJJTwJQTCJZIwgWVwYCXABFAkkjCEUBQv9/IicEZURLAwgnBExnKEsCULAjQzYaAUcCFSQSRBdJNhoCSU4CFYEgEkQ2GgNJTgIVSU4CgSASRCOIAyIyCklOAkxxC0QSQQBdSwRxCERLARJBAFIjRCtLBlC9RQEURLGBIEsCEkRLAkmyKksBsilLBUmyIYEDshAisgGzsSOyEksFSU4CshRJshGBBLIQIrIBsyInBGVEIwknBExnTE8CiANESCNDIkL/qzYaAUcCIllJTgJJJAslCE8CFRJEMQAiKWVEEkSBCw5EIklLAgxBAG1LAlcCAEsBSU4CJAskWCtLAVBJvUUBREm+SIABAlxITIFIgAECu0mBSVtJgYBAChaAAXJMUEmBgAi5SEyBgEAYSSQKSwJLASO6TwIkGCNUu0lXACBMVyAgTgJQTFCABChnYiJMULAjCEUBQv+MI0M2GgFJFSQSRDYaAkkVgSASRDYaA0kVJBJESRcxACIpZUQSRESAAW1PA1BJvUUBFEQyBhZPA08DUExQvyNDNhoBSRUkEkQrTFBJvUUBQAAZgAlOb3QgRm91bmRJFRZXBgJMUChMULAjQ0m+RIFIVSMSQQANgAhWZXJpZmllZEL/2oAHSW52YWxpZEL/ziJHA4AARwI2GgFHAiJZSU4CJAslCEwVEkQnByJJSwMMQQCISwNXAgBJRQxLASQLSUUJJFhJRQsiRQYyA0UJK0xQSUUKvUUBQQAySwi+RElXACBFCUsLSwhbRQeBSFUjEkEAQksFcQtEMgoSQQA3SwVxA0QnCBJBACwjRQWAAQAiSwZUSwpMUEsIUEsCSU8CUEwiWSMIFlcGAlwARQJJIwhFAUL/dyJFBUL/0ShLAlCwI0M2GgFJFSQSRCtMUEm9RQFEvkgoTFCwI0MiSTYaAUcCFYEgEkQ2GgJJFSQSRBdMIkwiFlAnBUxQSb1FAUEAEkcCvUgkSwEPJE4CTSJMuhdFAoAARQVLAhZLBExQJwVMUElFB71FAUEAIksFvkxFBkRLAkAAFksFSb1IJEsBDyRLAk8CTUxLAQm6RQVLBEkVJAoWSZOBEA5EVwYCTFBLAhaAAgAKUExQKExQsCNDNhoBSRWBIBJEKkxQSb1FAUS+SChMULAjQzYaAUkVJBJEgAFtTFBJvUUBRL5IKExQsCNDigEAIoAASTEAIillRBJBAAGJKjEAUL1FAUQqMQBQvkxJTgKMAERJJFuL/wiMASJbSYwCQQAIiwGLAg5BABEjRIsBFosATFwIKjEAUEy/iSJC/+yKAwGxMgqL/bIqsimL/7InJwiyJYv+siYisiMjsiKBA7IQIrIBs7Q8i/8BSwGL/U8CiAACSImKAwEigABJIicGZURJFklOAjIGFov+i/9QTFCAAQFQTFCL/RZJTgMrTFBMvyMIJwZMZyIWi/5MUCcFTFBJvUUBQAAlIxaLBFCLBUm8SEy/iwSL/lCL/1CLA1CABKNVFJZMULCL/4wAiYsFIiS6F0mMAUmBfhgkC4wCgX4MQQAfiwIkCEkkCIsFSU8C00yLBLuLASMIFosFIk8Cu0L/sYsBgX4KFov+TFAnBUxQjACLAkAAD4sAJLlIiwCLAosEu0L/zosCJAiLAEzTQv/r", "clear": "C4EBQw=="}, "desc": "Algorand Credential Verifier Smart Contract", "events": [{"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "holder"}, {"type": "byte[32]", "name": "document_hash"}, {"type": "uint64", "name": "serial"}], "name": "CredentialIssued", "desc": "ARC-28 event logged for every credential issued"}, {"args": [{"type": "uint64", "name": "asset_id"}, {"type": "address", "name": "holder"}, {"type": "byte[32]", "name": "document_hash"}], "name": "CredentialRevoked", "desc": "ARC-28 event logged for every credential revoked"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAyCiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgImF1dGhvcml6ZWRfaW5zdGl0dXRpb24iIDB4NjQgMHg2MyAicG9vbF9zaXplIiAweDY5ICJuZXh0X3NlcmlhbCIgMHgwMDAwIDB4NDM0NTUyNTQgMHgwNjgxMDEKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gc2VsZi5uZXh0X3NlcmlhbCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNiAvLyAibmV4dF9zZXJpYWwiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gc2VsZi5wb29sX3NpemUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDQgLy8gInBvb2xfc2l6ZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxMjAKICAgIC8vIGNsYXNzIENyZWRlbnRpYWxWZXJpZmllcihBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEAyMQogICAgcHVzaGJ5dGVzcyAweGYxNTg4NDc5IDB4ZTRhOTQyMWQgMHgzODhjYWZmYiAweGQyZGMyMWQzIDB4ZDhmNmNiNzIgMHhlZDFlOGNhZSAweGM5Yjc5NDY1IDB4ZWI5NWYwOTYgMHgzMDZhMmY1MyAweDJkZDkwODI4IDB4MzNkYmUxMzQgMHhhNGFlOGNhYyAweDIyYmE4MzdiIDB4MWIzYjk4MjYgMHgyZWVlYmJiOSAvLyBtZXRob2QgImFkZF9kZWxlZ2F0ZShhZGRyZXNzLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZW1vdmVfZGVsZWdhdGUoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJpc3N1ZV9jcmVkZW50aWFsKGFkZHJlc3Msc3RyaW5nLHN0cmluZyl1aW50NjQiLCBtZXRob2QgImlzc3VlX2NyZWRlbnRpYWxzX2JhdGNoKGFkZHJlc3NbXSxzdHJpbmdbXSxzdHJpbmdbXSl1aW50NjRbXSIsIG1ldGhvZCAibWludF9wb29sKHVpbnQ2NCl1aW50NjRbXSIsIG1ldGhvZCAiYXNzaWduX2NyZWRlbnRpYWwodWludDY0LGFkZHJlc3MsYnl0ZVszMl0pdm9pZCIsIG1ldGhvZCAicmV2b2tlX2NyZWRlbnRpYWxzKHVpbnQ2NFtdKXZvaWQiLCBtZXRob2QgImFuY2hvcl9jb2hvcnQodWludDY0LGJ5dGVbMzJdLHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJ2ZXJpZnlfY3JlZGVudGlhbCh1aW50NjQpc3RyaW5nIiwgbWV0aG9kICJ2ZXJpZnlfY3JlZGVudGlhbHModWludDY0W10pKHVpbnQ2NCxib29sLGFkZHJlc3MpW10iLCBtZXRob2QgImdldF9jcmVkZW50aWFsKHVpbnQ2NCkoYWRkcmVzcyxieXRlWzMyXSx1aW50NjQsdWludDgsdWludDY0KSIsIG1ldGhvZCAibGlzdF9jcmVkZW50aWFscyhhZGRyZXNzLHVpbnQ2NCkodWludDY0LHVpbnQ2NFtdKSIsIG1ldGhvZCAiZ2V0X2RlbGVnYXRlKGFkZHJlc3MpKHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJnZXRfY29ob3J0KHVpbnQ2NCkoYnl0ZVszMl0sdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9jb250cmFjdF9pbmZvKClzdHJpbmciCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBhZGRfZGVsZWdhdGUgcmVtb3ZlX2RlbGVnYXRlIGlzc3VlX2NyZWRlbnRpYWwgaXNzdWVfY3JlZGVudGlhbHNfYmF0Y2ggbWludF9wb29sIGFzc2lnbl9jcmVkZW50aWFsIHJldm9rZV9jcmVkZW50aWFscyBhbmNob3JfY29ob3J0IHZlcmlmeV9jcmVkZW50aWFsIHZlcmlmeV9jcmVkZW50aWFscyBnZXRfY3JlZGVudGlhbCBsaXN0X2NyZWRlbnRpYWxzIGdldF9kZWxlZ2F0ZSBnZXRfY29ob3J0IG1haW5fZ2V0X2NvbnRyYWN0X2luZm9fcm91dGVAMTkKICAgIGVycgoKbWFpbl9nZXRfY29udHJhY3RfaW5mb19yb3V0ZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjQ0MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDJmNDM3MjY1NjQ2NTZlNzQ2OTYxNmM1NjY1NzI2OTY2Njk2NTcyMjAyZDIwNDE2YzY3NmY3MjYxNmU2NDIwNDM3MjY1NjQ2NTZlNzQ2OTYxNmMyMDUzNzk3Mzc0NjU2ZAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9Ob09wQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTIwCiAgICAvLyBjbGFzcyBDcmVkZW50aWFsVmVyaWZpZXIoQVJDNENvbnRyYWN0KToKICAgIHB1c2hieXRlcyAweGNjNjk0ZWFhIC8vIG1ldGhvZCAiY3JlYXRlKGFkZHJlc3Mpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIGNyZWF0ZQogICAgZXJyCgoKLy8gX3B1eWFfbGliLnV0aWwuZW5zdXJlX2J1ZGdldChyZXF1aXJlZF9idWRnZXQ6IHVpbnQ2NCwgZmVlX3NvdXJjZTogdWludDY0KSAtPiB2b2lkOgplbnN1cmVfYnVkZ2V0OgogICAgcHJvdG8gMiAwCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgMTAKICAgICsKCmVuc3VyZV9idWRnZXRfd2hpbGVfdG9wQDE6CiAgICBmcmFtZV9kaWcgMAogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgPgogICAgYnogZW5zdXJlX2J1ZGdldF9hZnRlcl93aGlsZUA2CiAgICBpdHhuX2JlZ2luCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgYnl0ZWMgOSAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW0KICAgIGJ5dGVjIDkgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQ2xlYXJTdGF0ZVByb2dyYW0KICAgIGZyYW1lX2RpZyAtMQogICAgc3dpdGNoIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0CgplbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANToKICAgIGl0eG5fc3VibWl0CiAgICBiIGVuc3VyZV9idWRnZXRfd2hpbGVfdG9wQDEKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMUA0OgogICAgZ2xvYmFsIE1pblR4bkZlZQogICAgaXR4bl9maWVsZCBGZWUKICAgIGIgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV9uZXh0QDUKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfMEAzOgogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBiIGVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfbmV4dEA1CgplbnN1cmVfYnVkZ2V0X2FmdGVyX3doaWxlQDY6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY3JlZGVudGlhbF92ZXJpZmllci5jb250cmFjdC5DcmVkZW50aWFsVmVyaWZpZXIuY3JlYXRlW3JvdXRpbmddKCkgLT4gdm9pZDoKY3JlYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTM0CiAgICAvLyBAYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxMzcKICAgIC8vIHNlbGYuYXV0aG9yaXplZF9pbnN0aXR1dGlvbi52YWx1ZSA9IGluc3RpdHV0aW9uCiAgICBieXRlY18xIC8vICJhdXRob3JpemVkX2luc3RpdHV0aW9uIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjEzNAogICAgLy8gQGFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci5hZGRfZGVsZWdhdGVbcm91dGluZ10oKSAtPiB2b2lkOgphZGRfZGVsZWdhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxMzkKICAgIC8vIEBhYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5hdXRob3JpemVkX2luc3RpdHV0aW9uLnZhbHVlLCAiT25seSB0aGUgYXV0aG9yaXplZCBpbnN0aXR1dGlvbiBjYW4gbWFuYWdlIGRlbGVnYXRlcyIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhdXRob3JpemVkX2luc3RpdHV0aW9uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmF1dGhvcml6ZWRfaW5zdGl0dXRpb24gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGF1dGhvcml6ZWQgaW5zdGl0dXRpb24gY2FuIG1hbmFnZSBkZWxlZ2F0ZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gaXNzdWVkID0gYXJjNC5VSW50NjQoMCkKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gaWYgZGVsZWdhdGUgaW4gc2VsZi5kZWxlZ2F0ZXM6CiAgICBieXRlY18yIC8vIDB4NjQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGFkZF9kZWxlZ2F0ZV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gaXNzdWVkID0gc2VsZi5kZWxlZ2F0ZXNbZGVsZWdhdGVdLmlzc3VlZAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5kZWxlZ2F0ZXMgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDggOAogICAgYnVyeSAyCgphZGRfZGVsZWdhdGVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTQ5CiAgICAvLyBzZWxmLmRlbGVnYXRlc1tkZWxlZ2F0ZV0gPSBJc3N1ZXJEZWxlZ2F0ZShxdW90YT1hcmM0LlVJbnQ2NChxdW90YSksIGlzc3VlZD1pc3N1ZWQpCiAgICBkaWcgMgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjEzOQogICAgLy8gQGFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci5yZW1vdmVfZGVsZWdhdGVbcm91dGluZ10oKSAtPiB2b2lkOgpyZW1vdmVfZGVsZWdhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNTEKICAgIC8vIEBhYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE1NAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5hdXRob3JpemVkX2luc3RpdHV0aW9uLnZhbHVlLCAiT25seSB0aGUgYXV0aG9yaXplZCBpbnN0aXR1dGlvbiBjYW4gbWFuYWdlIGRlbGVnYXRlcyIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhdXRob3JpemVkX2luc3RpdHV0aW9uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmF1dGhvcml6ZWRfaW5zdGl0dXRpb24gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGF1dGhvcml6ZWQgaW5zdGl0dXRpb24gY2FuIG1hbmFnZSBkZWxlZ2F0ZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE1NQogICAgLy8gYXNzZXJ0IGRlbGVnYXRlIGluIHNlbGYuZGVsZWdhdGVzLCAiVW5rbm93biBkZWxlZ2F0ZSIKICAgIGJ5dGVjXzIgLy8gMHg2NAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFVua25vd24gZGVsZWdhdGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE1NgogICAgLy8gZGVsIHNlbGYuZGVsZWdhdGVzW2RlbGVnYXRlXQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNTEKICAgIC8vIEBhYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY3JlZGVudGlhbF92ZXJpZmllci5jb250cmFjdC5DcmVkZW50aWFsVmVyaWZpZXIuaXNzdWVfY3JlZGVudGlhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cmlzc3VlX2NyZWRlbnRpYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNzEKICAgIC8vIEBhYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZGlnIDEKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTgwCiAgICAvLyBzZWxmLl9hdXRob3JpemVfaXNzdWVyKFVJbnQ2NCgxKSkKICAgIGludGNfMSAvLyAxCiAgICBjYWxsc3ViIF9hdXRob3JpemVfaXNzdWVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxODEKICAgIC8vIHJldHVybiBzZWxmLl9pc3N1ZShzdHVkZW50X2FkZHJlc3MsIGNyZWRlbnRpYWxfbmFtZSwgbWV0YWRhdGFfdXJsKQogICAgY2FsbHN1YiBfaXNzdWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE3MQogICAgLy8gQGFiaW1ldGhvZAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci5pc3N1ZV9jcmVkZW50aWFsc19iYXRjaFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cmlzc3VlX2NyZWRlbnRpYWxzX2JhdGNoOgogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXBuIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE4MwogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDMyCiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgc3dhcAogICAgZHVwCiAgICBsZW4KICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBpbnRjXzAgLy8gMAoKaXNzdWVfY3JlZGVudGlhbHNfYmF0Y2hfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTgzCiAgICAvLyBAYWJpbWV0aG9kCiAgICBkdXAKICAgIGRpZyA1CiAgICA8CiAgICBieiBpc3N1ZV9jcmVkZW50aWFsc19iYXRjaF9hZnRlcl9mb3JANAogICAgZHVwbiAyCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZGlnIDMKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBlbmNvZGluZwogICAgZHVwCiAgICBkaWcgNwogICAgZHVwCiAgICBjb3ZlciA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgdGFpbCBwb2ludGVyIGZvciAobGVuKyhsZW4rdXRmOFtdKVtdKQogICAgZGlnIDEKICAgIGxlbgogICAgc3Vic3RyaW5nMwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICArCiAgICBidXJ5IDUKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgaXNzdWVfY3JlZGVudGlhbHNfYmF0Y2hfZm9yX2hlYWRlckAxCgppc3N1ZV9jcmVkZW50aWFsc19iYXRjaF9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE4MwogICAgLy8gQGFiaW1ldGhvZAogICAgZGlnIDMKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMwogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4Pj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgYnVyeSAxNAogICAgaW50Y18zIC8vIDIKICAgICoKICAgIGJ1cnkgMTAKICAgIGR1cAogICAgbGVuCiAgICBidXJ5IDkKICAgIGV4dHJhY3QgMiAwCiAgICBidXJ5IDE0CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSAxMAoKaXNzdWVfY3JlZGVudGlhbHNfYmF0Y2hfZm9yX2hlYWRlckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTgzCiAgICAvLyBAYWJpbWV0aG9kCiAgICBkaWcgOQogICAgZGlnIDEyCiAgICA8CiAgICBieiBpc3N1ZV9jcmVkZW50aWFsc19iYXRjaF9hZnRlcl9mb3JAOAogICAgZGlnIDkKICAgIGR1cAogICAgaW50Y18zIC8vIDIKICAgICoKICAgIGRpZyAxNQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGVuY29kaW5nCiAgICBkdXAKICAgIGRpZyAxMgogICAgZHVwCiAgICBjb3ZlciA0CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgdGFpbCBwb2ludGVyIGZvciAobGVuKyhsZW4rdXRmOFtdKVtdKQogICAgZGlnIDEKICAgIGxlbgogICAgc3Vic3RyaW5nMwogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICArCiAgICBidXJ5IDEwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxMAogICAgYiBpc3N1ZV9jcmVkZW50aWFsc19iYXRjaF9mb3JfaGVhZGVyQDUKCmlzc3VlX2NyZWRlbnRpYWxzX2JhdGNoX2FmdGVyX2ZvckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTgzCiAgICAvLyBAYWJpbWV0aG9kCiAgICBkaWcgOAogICAgaW50Y18zIC8vIDIKICAgICsKICAgIGRpZyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+PgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTk3CiAgICAvLyBhc3NlcnQgY3JlZGVudGlhbF9uYW1lcy5sZW5ndGggPT0gY291bnQgYW5kIG1ldGFkYXRhX3VybHMubGVuZ3RoID09IGNvdW50LCAiQXJyYXkgbGVuZ3RocyBkaWZmZXIiCiAgICBkaWcgNAogICAgZGlnIDYKICAgID09CiAgICBieiBpc3N1ZV9jcmVkZW50aWFsc19iYXRjaF9ib29sX2ZhbHNlQDEyCiAgICBkaWcgMTEKICAgIGRpZyA2CiAgICA9PQogICAgYnogaXNzdWVfY3JlZGVudGlhbHNfYmF0Y2hfYm9vbF9mYWxzZUAxMgogICAgaW50Y18xIC8vIDEKCmlzc3VlX2NyZWRlbnRpYWxzX2JhdGNoX2Jvb2xfbWVyZ2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxOTcKICAgIC8vIGFzc2VydCBjcmVkZW50aWFsX25hbWVzLmxlbmd0aCA9PSBjb3VudCBhbmQgbWV0YWRhdGFfdXJscy5sZW5ndGggPT0gY291bnQsICJBcnJheSBsZW5ndGhzIGRpZmZlciIKICAgIGFzc2VydCAvLyBBcnJheSBsZW5ndGhzIGRpZmZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTk4CiAgICAvLyBhc3NlcnQgY291bnQgPD0gTUFYX0JBVENIX1NJWkUsICJCYXRjaCB0b28gbGFyZ2UiCiAgICBkaWcgNQogICAgZHVwCiAgICBwdXNoaW50IDExCiAgICA8PQogICAgYXNzZXJ0IC8vIEJhdGNoIHRvbyBsYXJnZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTk5CiAgICAvLyBzZWxmLl9hdXRob3JpemVfaXNzdWVyKGNvdW50KQogICAgZHVwCiAgICBjYWxsc3ViIF9hdXRob3JpemVfaXNzdWVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMDAKICAgIC8vIGVuc3VyZV9idWRnZXQoY291bnQgKiBJU1NVRV9PUENPREVfQlVER0VULCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0KQogICAgcHVzaGludCAzMDAKICAgICoKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gYXNzZXRfaWRzID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKCkKICAgIGJ5dGVjIDcgLy8gMHgwMDAwCiAgICBidXJ5IDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMDMKICAgIC8vIGZvciBpIGluIHVyYW5nZShjb3VudCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSAxMQoKaXNzdWVfY3JlZGVudGlhbHNfYmF0Y2hfZm9yX2hlYWRlckAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGNvdW50KToKICAgIGRpZyAxMAogICAgZGlnIDYKICAgIDwKICAgIGJ6IGlzc3VlX2NyZWRlbnRpYWxzX2JhdGNoX2FmdGVyX2ZvckAxNwogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjA1CiAgICAvLyBzdHVkZW50X2FkZHJlc3Nlc1tpXS5uYXRpdmUsCiAgICBkaWcgNgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDMyCiAgICAqCiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIwNgogICAgLy8gY3JlZGVudGlhbF9uYW1lc1tpXS5uYXRpdmUsCiAgICBkaWcgMQogICAgZGlnIDcKICAgIDwKICAgIGFzc2VydCAvLyBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDEKICAgIGludGNfMyAvLyAyCiAgICAqCiAgICBkaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkaWcgMQogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAyCiAgICBkaWcgMQogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMyAvLyAyCiAgICArCiAgICB1bmNvdmVyIDMKICAgIGNvdmVyIDIKICAgIGV4dHJhY3QzCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjA3CiAgICAvLyBtZXRhZGF0YV91cmxzW2ldLm5hdGl2ZSwKICAgIGRpZyAzCiAgICBkaWcgMTYKICAgIDwKICAgIGFzc2VydCAvLyBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDE3CiAgICBkdXAKICAgIHVuY292ZXIgMwogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgZXh0cmFjdDMKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMDQtMjA4CiAgICAvLyBhc3NldF9pZCA9IHNlbGYuX2lzc3VlKAogICAgLy8gICAgIHN0dWRlbnRfYWRkcmVzc2VzW2ldLm5hdGl2ZSwKICAgIC8vICAgICBjcmVkZW50aWFsX25hbWVzW2ldLm5hdGl2ZSwKICAgIC8vICAgICBtZXRhZGF0YV91cmxzW2ldLm5hdGl2ZSwKICAgIC8vICkKICAgIGNhbGxzdWIgX2lzc3VlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMDkKICAgIC8vIGFzc2V0X2lkcy5hcHBlbmQoYXJjNC5VSW50NjQoYXNzZXRfaWQpKQogICAgaXRvYgogICAgZGlnIDE0CiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY29uY2F0IC8vIG9uIGVycm9yOiBtYXggYXJyYXkgbGVuZ3RoIGV4Y2VlZGVkCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcmVwbGFjZTIgMAogICAgYnVyeSAxNAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjAzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoY291bnQpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgMTEKICAgIGIgaXNzdWVfY3JlZGVudGlhbHNfYmF0Y2hfZm9yX2hlYWRlckAxNAoKaXNzdWVfY3JlZGVudGlhbHNfYmF0Y2hfYWZ0ZXJfZm9yQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTgzCiAgICAvLyBAYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIGRpZyAxMwogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmlzc3VlX2NyZWRlbnRpYWxzX2JhdGNoX2Jvb2xfZmFsc2VAMTI6CiAgICBpbnRjXzAgLy8gMAogICAgYiBpc3N1ZV9jcmVkZW50aWFsc19iYXRjaF9ib29sX21lcmdlQDEzCgoKLy8gc21hcnRfY29udHJhY3RzLmNyZWRlbnRpYWxfdmVyaWZpZXIuY29udHJhY3QuQ3JlZGVudGlhbFZlcmlmaWVyLm1pbnRfcG9vbFtyb3V0aW5nXSgpIC0+IHZvaWQ6Cm1pbnRfcG9vbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIxMgogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMTkKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuYXV0aG9yaXplZF9pbnN0aXR1dGlvbi52YWx1ZSwgIk9ubHkgdGhlIGF1dGhvcml6ZWQgaW5zdGl0dXRpb24gY2FuIG1pbnQgY3JlZGVudGlhbHMiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYXV0aG9yaXplZF9pbnN0aXR1dGlvbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hdXRob3JpemVkX2luc3RpdHV0aW9uIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IHRoZSBhdXRob3JpemVkIGluc3RpdHV0aW9uIGNhbiBtaW50IGNyZWRlbnRpYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMjAKICAgIC8vIGFzc2VydCBjb3VudCA8PSBNQVhfUE9PTF9NSU5ULCAiQmF0Y2ggdG9vIGxhcmdlIgogICAgZHVwCiAgICBwdXNoaW50IDY0CiAgICA8PQogICAgYXNzZXJ0IC8vIEJhdGNoIHRvbyBsYXJnZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjIxCiAgICAvLyBlbnN1cmVfYnVkZ2V0KGNvdW50ICogUE9PTF9NSU5UX09QQ09ERV9CVURHRVQsIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQpCiAgICBwdXNoaW50IDEwMAogICAgKgogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjIzCiAgICAvLyBhc3NldF9pZHMgPSBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0oKQogICAgYnl0ZWMgNyAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gZm9yIF9pIGluIHVyYW5nZShjb3VudCk6CiAgICBpbnRjXzAgLy8gMAoKbWludF9wb29sX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gZm9yIF9pIGluIHVyYW5nZShjb3VudCk6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiBtaW50X3Bvb2xfYWZ0ZXJfZm9yQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIyNS0yMzQKICAgIC8vIGFzc2V0X2NyZWF0ZSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9MSwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGFzc2V0X25hbWU9U3RyaW5nKFBPT0xfQ1JFREVOVElBTF9OQU1FKSwKICAgIC8vICAgICB1bml0X25hbWU9U3RyaW5nKCJDRVJUIiksCiAgICAvLyAgICAgdXJsPVN0cmluZyhBUkMxOV9URU1QTEFURV9VUkwpLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMzEKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMzIKICAgIC8vIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMzAKICAgIC8vIHVybD1TdHJpbmcoQVJDMTlfVEVNUExBVEVfVVJMKSwKICAgIHB1c2hieXRlcyAidGVtcGxhdGUtaXBmczovL3tpcGZzOjA6ZGFnLXBiOnJlc2VydmU6c2hhMi0yNTZ9IgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVSTAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjI5CiAgICAvLyB1bml0X25hbWU9U3RyaW5nKCJDRVJUIiksCiAgICBieXRlYyA4IC8vICJDRVJUIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMjgKICAgIC8vIGFzc2V0X25hbWU9U3RyaW5nKFBPT0xfQ1JFREVOVElBTF9OQU1FKSwKICAgIHB1c2hieXRlcyAiQ3JlZGVudGlhbCIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMjcKICAgIC8vIGRlY2ltYWxzPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMjYKICAgIC8vIHRvdGFsPTEsCiAgICBpbnRjXzEgLy8gMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMjUKICAgIC8vIGFzc2V0X2NyZWF0ZSA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjMzCiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjI1LTIzNAogICAgLy8gYXNzZXRfY3JlYXRlID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xLAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1TdHJpbmcoUE9PTF9DUkVERU5USUFMX05BTUUpLAogICAgLy8gICAgIHVuaXRfbmFtZT1TdHJpbmcoIkNFUlQiKSwKICAgIC8vICAgICB1cmw9U3RyaW5nKEFSQzE5X1RFTVBMQVRFX1VSTCksCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMzUKICAgIC8vIGFzc2V0X2lkcy5hcHBlbmQoYXJjNC5VSW50NjQoYXNzZXRfY3JlYXRlLmNyZWF0ZWRfYXNzZXQuaWQpKQogICAgaXRvYgogICAgZGlnIDIKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQgLy8gb24gZXJyb3I6IG1heCBhcnJheSBsZW5ndGggZXhjZWVkZWQKICAgIHN3YXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICByZXBsYWNlMiAwCiAgICBidXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gZm9yIF9pIGluIHVyYW5nZShjb3VudCk6CiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgbWludF9wb29sX2Zvcl9oZWFkZXJAMgoKbWludF9wb29sX2FmdGVyX2ZvckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjM2CiAgICAvLyBzZWxmLnBvb2xfc2l6ZSArPSBjb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInBvb2xfc2l6ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wb29sX3NpemUgZXhpc3RzCiAgICBkaWcgMwogICAgKwogICAgYnl0ZWMgNCAvLyAicG9vbF9zaXplIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIxMgogICAgLy8gQGFiaW1ldGhvZAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBkaWcgMgogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY3JlZGVudGlhbF92ZXJpZmllci5jb250cmFjdC5DcmVkZW50aWFsVmVyaWZpZXIuYXNzaWduX2NyZWRlbnRpYWxbcm91dGluZ10oKSAtPiB2b2lkOgphc3NpZ25fY3JlZGVudGlhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjIzOQogICAgLy8gQGFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI0NgogICAgLy8gc2VsZi5fYXV0aG9yaXplX2lzc3VlcihVSW50NjQoMSkpCiAgICBpbnRjXzEgLy8gMQogICAgY2FsbHN1YiBfYXV0aG9yaXplX2lzc3VlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjQ3CiAgICAvLyBhcHBfYWRkcmVzcyA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI0OAogICAgLy8gYXNzZXJ0IGFzc2V0LmNyZWF0b3IgPT0gYXBwX2FkZHJlc3MgYW5kIGFzc2V0LnJlc2VydmUgPT0gYXBwX2FkZHJlc3MsICJOb3QgYSBwb29sZWQgY3JlZGVudGlhbCIKICAgIHN3YXAKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRDcmVhdG9yCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICA9PQogICAgYnogYXNzaWduX2NyZWRlbnRpYWxfYm9vbF9mYWxzZUA0CiAgICBkaWcgNAogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldFJlc2VydmUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGRpZyAxCiAgICA9PQogICAgYnogYXNzaWduX2NyZWRlbnRpYWxfYm9vbF9mYWxzZUA0CiAgICBpbnRjXzEgLy8gMQoKYXNzaWduX2NyZWRlbnRpYWxfYm9vbF9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjQ4CiAgICAvLyBhc3NlcnQgYXNzZXQuY3JlYXRvciA9PSBhcHBfYWRkcmVzcyBhbmQgYXNzZXQucmVzZXJ2ZSA9PSBhcHBfYWRkcmVzcywgIk5vdCBhIHBvb2xlZCBjcmVkZW50aWFsIgogICAgYXNzZXJ0IC8vIE5vdCBhIHBvb2xlZCBjcmVkZW50aWFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyNDkKICAgIC8vIGFzc2VydCBhcmM0LlVJbnQ2NChhc3NldC5pZCkgbm90IGluIHNlbGYuY3JlZGVudGlhbHMsICJDcmVkZW50aWFsIGFscmVhZHkgYXNzaWduZWQiCiAgICBieXRlY18zIC8vIDB4NjMKICAgIGRpZyA2CiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIENyZWRlbnRpYWwgYWxyZWFkeSBhc3NpZ25lZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjUxLTI1NgogICAgLy8gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICBjb25maWdfYXNzZXQ9YXNzZXQsCiAgICAvLyAgICAgbWFuYWdlcj1hcHBfYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUFjY291bnQobWV0YWRhdGFfZGlnZXN0LmJ5dGVzKSwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI1NAogICAgLy8gcmVzZXJ2ZT1BY2NvdW50KG1ldGFkYXRhX2RpZ2VzdC5ieXRlcyksCiAgICBwdXNoaW50IDMyCiAgICBkaWcgMgogICAgPT0KICAgIGFzc2VydCAvLyBBZGRyZXNzIGxlbmd0aCBpcyAzMiBieXRlcwogICAgZGlnIDIKICAgIGR1cAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgZGlnIDUKICAgIGR1cAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjUxCiAgICAvLyBpdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI1NQogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI1MS0yNTYKICAgIC8vIGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgY29uZmlnX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIG1hbmFnZXI9YXBwX2FkZHJlc3MsCiAgICAvLyAgICAgcmVzZXJ2ZT1BY2NvdW50KG1ldGFkYXRhX2RpZ2VzdC5ieXRlcyksCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjU3LTI2MgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9c3R1ZGVudF9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0xLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjYwCiAgICAvLyBhc3NldF9hbW91bnQ9MSwKICAgIGludGNfMSAvLyAxCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBkaWcgNQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGR1cAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI1NwogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyNjEKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyNTctMjYyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zdHVkZW50X2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTEsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjYzCiAgICAvLyBzZWxmLnBvb2xfc2l6ZSAtPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAicG9vbF9zaXplIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBvb2xfc2l6ZSBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBieXRlYyA0IC8vICJwb29sX3NpemUiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjY0CiAgICAvLyBzZWxmLl9yZWdpc3Rlcihhc3NldC5pZCwgc3R1ZGVudF9hZGRyZXNzLCBtZXRhZGF0YV9kaWdlc3QuY29weSgpKQogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIF9yZWdpc3RlcgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyMzkKICAgIC8vIEBhYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmFzc2lnbl9jcmVkZW50aWFsX2Jvb2xfZmFsc2VANDoKICAgIGludGNfMCAvLyAwCiAgICBiIGFzc2lnbl9jcmVkZW50aWFsX2Jvb2xfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci5yZXZva2VfY3JlZGVudGlhbHNbcm91dGluZ10oKSAtPiB2b2lkOgpyZXZva2VfY3JlZGVudGlhbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyNjYKICAgIC8vIEBhYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50NjQ+CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyNzIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuYXV0aG9yaXplZF9pbnN0aXR1dGlvbi52YWx1ZSwgIk9ubHkgdGhlIGF1dGhvcml6ZWQgaW5zdGl0dXRpb24gY2FuIHJldm9rZSBjcmVkZW50aWFscyIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhdXRob3JpemVkX2luc3RpdHV0aW9uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmF1dGhvcml6ZWRfaW5zdGl0dXRpb24gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGF1dGhvcml6ZWQgaW5zdGl0dXRpb24gY2FuIHJldm9rZSBjcmVkZW50aWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjczCiAgICAvLyBhc3NlcnQgYXNzZXRfaWRzLmxlbmd0aCA8PSBNQVhfQkFUQ0hfU0laRSwgIkJhdGNoIHRvbyBsYXJnZSIKICAgIHB1c2hpbnQgMTEKICAgIDw9CiAgICBhc3NlcnQgLy8gQmF0Y2ggdG9vIGxhcmdlCiAgICBpbnRjXzAgLy8gMAoKcmV2b2tlX2NyZWRlbnRpYWxzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI3NAogICAgLy8gZm9yIGFzc2V0X2lkIGluIGFzc2V0X2lkczoKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IHJldm9rZV9jcmVkZW50aWFsc19hZnRlcl9mb3JANQogICAgZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBkaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBpbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mjc1CiAgICAvLyBhc3NlcnQgYXNzZXRfaWQgaW4gc2VsZi5jcmVkZW50aWFscywgIlVua25vd24gY3JlZGVudGlhbCIKICAgIGJ5dGVjXzMgLy8gMHg2MwogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBVbmtub3duIGNyZWRlbnRpYWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI3NgogICAgLy8gcmVjb3JkID0gc2VsZi5jcmVkZW50aWFsc1thc3NldF9pZF0uY29weSgpCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mjc3CiAgICAvLyByZWNvcmQuc3RhdHVzID0gYXJjNC5VSW50OChTVEFUVVNfUkVWT0tFRCkKICAgIHB1c2hieXRlcyAweDAyCiAgICByZXBsYWNlMiA3MgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mjc2LTI3OAogICAgLy8gcmVjb3JkID0gc2VsZi5jcmVkZW50aWFsc1thc3NldF9pZF0uY29weSgpCiAgICAvLyByZWNvcmQuc3RhdHVzID0gYXJjNC5VSW50OChTVEFUVVNfUkVWT0tFRCkKICAgIC8vIHNlbGYuY3JlZGVudGlhbHNbYXNzZXRfaWRdID0gcmVjb3JkLmNvcHkoKQogICAgc3dhcAogICAgcHVzaGludCA3MgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mjc3CiAgICAvLyByZWNvcmQuc3RhdHVzID0gYXJjNC5VSW50OChTVEFUVVNfUkVWT0tFRCkKICAgIHB1c2hieXRlcyAweDAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyNzYtMjc4CiAgICAvLyByZWNvcmQgPSBzZWxmLmNyZWRlbnRpYWxzW2Fzc2V0X2lkXS5jb3B5KCkKICAgIC8vIHJlY29yZC5zdGF0dXMgPSBhcmM0LlVJbnQ4KFNUQVRVU19SRVZPS0VEKQogICAgLy8gc2VsZi5jcmVkZW50aWFsc1thc3NldF9pZF0gPSByZWNvcmQuY29weSgpCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjgwCiAgICAvLyBzZXJpYWwgPSByZWNvcmQuc2VyaWFsLmFzX3VpbnQ2NCgpCiAgICBkdXAKICAgIHB1c2hpbnQgNzMKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyODEKICAgIC8vIHBhZ2UgPSBzZWxmLnJldm9jYXRpb25zLmJveChhcmM0LlVJbnQ2NChzZXJpYWwgLy8gUkVWT0NBVElPTl9QQUdFX0JJVFMpKQogICAgZHVwCiAgICBwdXNoaW50IDgxOTIKICAgIC8KICAgIGl0b2IKICAgIHB1c2hieXRlcyAweDcyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI4MgogICAgLy8gcGFnZS5jcmVhdGUoc2l6ZT1VSW50NjQoUkVWT0NBVElPTl9QQUdFX0JZVEVTKSkKICAgIGR1cAogICAgcHVzaGludCAxMDI0CiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI4MwogICAgLy8gYml0ID0gc2VyaWFsICUgUkVWT0NBVElPTl9QQUdFX0JJVFMKICAgIHN3YXAKICAgIHB1c2hpbnQgODE5MgogICAgJQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mjg0CiAgICAvLyBieXRlID0gcGFnZS5leHRyYWN0KGJpdCAvLyA4LCAxKQogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgLwogICAgZGlnIDIKICAgIGRpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI4NQogICAgLy8gcGFnZS5yZXBsYWNlKGJpdCAvLyA4LCBvcC5zZXRiaXRfYnl0ZXMoYnl0ZSwgYml0ICUgOCwgVHJ1ZSkpCiAgICB1bmNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAlCiAgICBpbnRjXzEgLy8gMQogICAgc2V0Yml0CiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mjg2CiAgICAvLyBhcmM0LmVtaXQoQ3JlZGVudGlhbFJldm9rZWQoYXNzZXRfaWQsIHJlY29yZC5ob2xkZXIsIHJlY29yZC5kb2N1bWVudF9oYXNoLmNvcHkoKSkpCiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMgogICAgc3dhcAogICAgZXh0cmFjdCAzMiAzMgogICAgY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDI4Njc2MjIyIC8vIG1ldGhvZCAiQ3JlZGVudGlhbFJldm9rZWQodWludDY0LGFkZHJlc3MsYnl0ZVszMl0pIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDEKICAgIGIgcmV2b2tlX2NyZWRlbnRpYWxzX2Zvcl9oZWFkZXJAMgoKcmV2b2tlX2NyZWRlbnRpYWxzX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MjY2CiAgICAvLyBAYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNyZWRlbnRpYWxfdmVyaWZpZXIuY29udHJhY3QuQ3JlZGVudGlhbFZlcmlmaWVyLmFuY2hvcl9jb2hvcnRbcm91dGluZ10oKSAtPiB2b2lkOgphbmNob3JfY29ob3J0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mjg4CiAgICAvLyBAYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBkdXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjI5NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5hdXRob3JpemVkX2luc3RpdHV0aW9uLnZhbHVlLCAiT25seSB0aGUgYXV0aG9yaXplZCBpbnN0aXR1dGlvbiBjYW4gYW5jaG9yIGNvaG9ydHMiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYXV0aG9yaXplZF9pbnN0aXR1dGlvbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hdXRob3JpemVkX2luc3RpdHV0aW9uIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBPbmx5IHRoZSBhdXRob3JpemVkIGluc3RpdHV0aW9uIGNhbiBhbmNob3IgY29ob3J0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mjk2CiAgICAvLyBhc3NlcnQgbGVhZl9jb3VudCA+IDAsICJFbXB0eSBjb2hvcnQiCiAgICBhc3NlcnQgLy8gRW1wdHkgY29ob3J0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyOTgKICAgIC8vIGFzc2VydCBrZXkgbm90IGluIHNlbGYuY29ob3J0cywgIkNvaG9ydCBhbHJlYWR5IGFuY2hvcmVkIgogICAgcHVzaGJ5dGVzIDB4NmQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIENvaG9ydCBhbHJlYWR5IGFuY2hvcmVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMDIKICAgIC8vIGFuY2hvcl9yb3VuZD1hcmM0LlVJbnQ2NChHbG9iYWwucm91bmQpLAogICAgZ2xvYmFsIFJvdW5kCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToyOTktMzAzCiAgICAvLyBzZWxmLmNvaG9ydHNba2V5XSA9IENvaG9ydEFuY2hvcigKICAgIC8vICAgICBtZXJrbGVfcm9vdD1tZXJrbGVfcm9vdC5jb3B5KCksCiAgICAvLyAgICAgbGVhZl9jb3VudD1hcmM0LlVJbnQ2NChsZWFmX2NvdW50KSwKICAgIC8vICAgICBhbmNob3Jfcm91bmQ9YXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kKSwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mjg4CiAgICAvLyBAYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNyZWRlbnRpYWxfdmVyaWZpZXIuY29udHJhY3QuQ3JlZGVudGlhbFZlcmlmaWVyLnZlcmlmeV9jcmVkZW50aWFsW3JvdXRpbmddKCkgLT4gdm9pZDoKdmVyaWZ5X2NyZWRlbnRpYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNjYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjM3MAogICAgLy8gaWYga2V5IG5vdCBpbiBzZWxmLmNyZWRlbnRpYWxzOgogICAgYnl0ZWNfMyAvLyAweDYzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogdmVyaWZ5X2NyZWRlbnRpYWxfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNzEKICAgIC8vIHJldHVybiBTdHJpbmcoIk5vdCBGb3VuZCIpCiAgICBwdXNoYnl0ZXMgIk5vdCBGb3VuZCIKCnZlcmlmeV9jcmVkZW50aWFsX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmNyZWRlbnRpYWxfdmVyaWZpZXIuY29udHJhY3QuQ3JlZGVudGlhbFZlcmlmaWVyLnZlcmlmeV9jcmVkZW50aWFsQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNjYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgp2ZXJpZnlfY3JlZGVudGlhbF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNzIKICAgIC8vIGlmIHNlbGYuY3JlZGVudGlhbHNba2V5XS5zdGF0dXMuYXNfdWludDY0KCkgPT0gU1RBVFVTX0FDVElWRToKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlZGVudGlhbHMgZW50cnkgZXhpc3RzCiAgICBwdXNoaW50IDcyCiAgICBnZXRieXRlCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IHZlcmlmeV9jcmVkZW50aWFsX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzczCiAgICAvLyByZXR1cm4gU3RyaW5nKCJWZXJpZmllZCIpCiAgICBwdXNoYnl0ZXMgIlZlcmlmaWVkIgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzY2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIHZlcmlmeV9jcmVkZW50aWFsX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmNyZWRlbnRpYWxfdmVyaWZpZXIuY29udHJhY3QuQ3JlZGVudGlhbFZlcmlmaWVyLnZlcmlmeV9jcmVkZW50aWFsQDYKCnZlcmlmeV9jcmVkZW50aWFsX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjM3NAogICAgLy8gcmV0dXJuIFN0cmluZygiSW52YWxpZCIpCiAgICBwdXNoYnl0ZXMgIkludmFsaWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNjYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgdmVyaWZ5X2NyZWRlbnRpYWxfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuY3JlZGVudGlhbF92ZXJpZmllci5jb250cmFjdC5DcmVkZW50aWFsVmVyaWZpZXIudmVyaWZ5X2NyZWRlbnRpYWxANgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci52ZXJpZnlfY3JlZGVudGlhbHNbcm91dGluZ10oKSAtPiB2b2lkOgp2ZXJpZnlfY3JlZGVudGlhbHM6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiAzCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mzc2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50NjQ+CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozODYKICAgIC8vIGNoZWNrcyA9IGFyYzQuRHluYW1pY0FycmF5W0NyZWRlbnRpYWxDaGVja10oKQogICAgYnl0ZWMgNyAvLyAweDAwMDAKICAgIGludGNfMCAvLyAwCgp2ZXJpZnlfY3JlZGVudGlhbHNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mzg3CiAgICAvLyBmb3IgYXNzZXRfaWQgaW4gYXNzZXRfaWRzOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogdmVyaWZ5X2NyZWRlbnRpYWxzX2FmdGVyX2ZvckAxMgogICAgZGlnIDMKICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIGJ1cnkgMTIKICAgIGRpZyAxCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZHVwCiAgICBidXJ5IDkKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgYnVyeSAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mzg4CiAgICAvLyB2YWxpZCA9IEZhbHNlCiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozODkKICAgIC8vIGhvbGRlciA9IGFyYzQuQWRkcmVzcygpCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGJ1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzkwCiAgICAvLyBpZiBhc3NldF9pZCBpbiBzZWxmLmNyZWRlbnRpYWxzOgogICAgYnl0ZWNfMyAvLyAweDYzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYnVyeSAxMAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiB2ZXJpZnlfY3JlZGVudGlhbHNfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzkxCiAgICAvLyByZWNvcmQgPSBzZWxmLmNyZWRlbnRpYWxzW2Fzc2V0X2lkXS5jb3B5KCkKICAgIGRpZyA4CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVkZW50aWFscyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjM5MgogICAgLy8gaG9sZGVyID0gcmVjb3JkLmhvbGRlcgogICAgZHVwCiAgICBleHRyYWN0IDAgMzIKICAgIGJ1cnkgOQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzkzCiAgICAvLyBhc3NldCA9IEFzc2V0KGFzc2V0X2lkLmFzX3VpbnQ2NCgpKQogICAgZGlnIDExCiAgICBkaWcgOAogICAgZXh0cmFjdF91aW50NjQKICAgIGJ1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mzk1CiAgICAvLyByZWNvcmQuc3RhdHVzLmFzX3VpbnQ2NCgpID09IFNUQVRVU19BQ1RJVkUKICAgIHB1c2hpbnQgNzIKICAgIGdldGJ5dGUKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mzk1LTM5NwogICAgLy8gcmVjb3JkLnN0YXR1cy5hc191aW50NjQoKSA9PSBTVEFUVVNfQUNUSVZFCiAgICAvLyBhbmQgYXNzZXQuY3JlYXRvciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyBhbmQgYXNzZXQudW5pdF9uYW1lID09IGIiQ0VSVCIKICAgIGJ6IHZlcmlmeV9jcmVkZW50aWFsc19ib29sX2ZhbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjM5NgogICAgLy8gYW5kIGFzc2V0LmNyZWF0b3IgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZGlnIDUKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRDcmVhdG9yCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjM5NS0zOTcKICAgIC8vIHJlY29yZC5zdGF0dXMuYXNfdWludDY0KCkgPT0gU1RBVFVTX0FDVElWRQogICAgLy8gYW5kIGFzc2V0LmNyZWF0b3IgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gYW5kIGFzc2V0LnVuaXRfbmFtZSA9PSBiIkNFUlQiCiAgICBieiB2ZXJpZnlfY3JlZGVudGlhbHNfYm9vbF9mYWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozOTcKICAgIC8vIGFuZCBhc3NldC51bml0X25hbWUgPT0gYiJDRVJUIgogICAgZGlnIDUKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVbml0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgYnl0ZWMgOCAvLyAweDQzNDU1MjU0CiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mzk1LTM5NwogICAgLy8gcmVjb3JkLnN0YXR1cy5hc191aW50NjQoKSA9PSBTVEFUVVNfQUNUSVZFCiAgICAvLyBhbmQgYXNzZXQuY3JlYXRvciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyBhbmQgYXNzZXQudW5pdF9uYW1lID09IGIiQ0VSVCIKICAgIGJ6IHZlcmlmeV9jcmVkZW50aWFsc19ib29sX2ZhbHNlQDgKICAgIGludGNfMSAvLyAxCiAgICBidXJ5IDUKCnZlcmlmeV9jcmVkZW50aWFsc19hZnRlcl9pZl9lbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mzk5CiAgICAvLyBjaGVja3MuYXBwZW5kKENyZWRlbnRpYWxDaGVjayhhc3NldF9pZD1hc3NldF9pZCwgdmFsaWQ9YXJjNC5Cb29sKHZhbGlkKSwgaG9sZGVyPWhvbGRlcikpCiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18wIC8vIDAKICAgIGRpZyA2CiAgICBzZXRiaXQKICAgIGRpZyAxMAogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgOAogICAgY29uY2F0CiAgICBkaWcgMgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdCAvLyBvbiBlcnJvcjogbWF4IGFycmF5IGxlbmd0aCBleGNlZWRlZAogICAgc3dhcAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHJlcGxhY2UyIDAKICAgIGJ1cnkgMgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnVyeSAxCiAgICBiIHZlcmlmeV9jcmVkZW50aWFsc19mb3JfaGVhZGVyQDIKCnZlcmlmeV9jcmVkZW50aWFsc19ib29sX2ZhbHNlQDg6CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA1CiAgICBiIHZlcmlmeV9jcmVkZW50aWFsc19hZnRlcl9pZl9lbHNlQDEwCgp2ZXJpZnlfY3JlZGVudGlhbHNfYWZ0ZXJfZm9yQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6Mzc2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci5nZXRfY3JlZGVudGlhbFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9jcmVkZW50aWFsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDAyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MDYKICAgIC8vIGFzc2VydCBrZXkgaW4gc2VsZi5jcmVkZW50aWFscywgIlVua25vd24gY3JlZGVudGlhbCIKICAgIGJ5dGVjXzMgLy8gMHg2MwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFVua25vd24gY3JlZGVudGlhbAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDA3CiAgICAvLyByZXR1cm4gc2VsZi5jcmVkZW50aWFsc1trZXldLmNvcHkoKQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MDIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY3JlZGVudGlhbF92ZXJpZmllci5jb250cmFjdC5DcmVkZW50aWFsVmVyaWZpZXIubGlzdF9jcmVkZW50aWFsc1tyb3V0aW5nXSgpIC0+IHZvaWQ6Cmxpc3RfY3JlZGVudGlhbHM6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MDkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgbGVuCiAgICBwdXNoaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnN0YXRpY19hcnJheTxhcmM0LnVpbnQ4LCAzMj4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjQxNQogICAgLy8gdG90YWwgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MTYKICAgIC8vIGZpcnN0X2tleSA9IHN0dWRlbnRfYWRkcmVzcy5ieXRlcyArIG9wLml0b2IoMCkKICAgIGludGNfMCAvLyAwCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjQxNwogICAgLy8gaWYgZmlyc3Rfa2V5IGluIHNlbGYuc3R1ZGVudF9wYWdlczoKICAgIGJ5dGVjIDUgLy8gMHg2OQogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogbGlzdF9jcmVkZW50aWFsc19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjQxOAogICAgLy8gdG90YWwgPSBvcC5idG9pKHNlbGYuc3R1ZGVudF9wYWdlc1tmaXJzdF9rZXldWzpTVFVERU5UX0lOREVYX0hFQURFUl9CWVRFU10pCiAgICBkdXBuIDIKICAgIGJveF9sZW4KICAgIHBvcAogICAgaW50Y18yIC8vIDgKICAgIGRpZyAxCiAgICA+PQogICAgaW50Y18yIC8vIDgKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBidXJ5IDIKCmxpc3RfY3JlZGVudGlhbHNfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDE5CiAgICAvLyBpZHMgPSBCeXRlcygpCiAgICBwdXNoYnl0ZXMgMHgKICAgIGJ1cnkgNQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDIwCiAgICAvLyBrZXkgPSBzdHVkZW50X2FkZHJlc3MuYnl0ZXMgKyBvcC5pdG9iKHBhZ2UpCiAgICBkaWcgMgogICAgaXRvYgogICAgZGlnIDQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDIxCiAgICAvLyBpZiBrZXkgaW4gc2VsZi5zdHVkZW50X3BhZ2VzOgogICAgYnl0ZWMgNSAvLyAweDY5CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYnVyeSA3CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGxpc3RfY3JlZGVudGlhbHNfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MjIKICAgIC8vIGlkcyA9IHNlbGYuc3R1ZGVudF9wYWdlc1trZXldCiAgICBkaWcgNQogICAgYm94X2dldAogICAgc3dhcAogICAgYnVyeSA2CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdHVkZW50X3BhZ2VzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDIzCiAgICAvLyBpZiBwYWdlID09IDA6CiAgICBkaWcgMgogICAgYm56IGxpc3RfY3JlZGVudGlhbHNfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MjQKICAgIC8vIGlkcyA9IGlkc1tTVFVERU5UX0lOREVYX0hFQURFUl9CWVRFUzpdCiAgICBkaWcgNQogICAgZHVwCiAgICBib3hfbGVuCiAgICBwb3AKICAgIGludGNfMiAvLyA4CiAgICBkaWcgMQogICAgPj0KICAgIGludGNfMiAvLyA4CiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHN3YXAKICAgIGRpZyAxCiAgICAtCiAgICBib3hfZXh0cmFjdAogICAgYnVyeSA1CgpsaXN0X2NyZWRlbnRpYWxzX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjQyNS00MjYKICAgIC8vICMgQSBwYWdlIGlzIGFscmVhZHkgdGhlIHBhY2tlZCBib2R5IG9mIGEgdWludDY0W107IG9ubHkgdGhlIGxlbmd0aCBwcmVmaXggaXMgbWlzc2luZwogICAgLy8gYXNzZXRfaWRzID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLmZyb21fYnl0ZXMoYXJjNC5VSW50MTYoaWRzLmxlbmd0aCAvLyA4KS5ieXRlcyArIGlkcykKICAgIGRpZyA0CiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgIC8KICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MjcKICAgIC8vIHJldHVybiBTdHVkZW50Q3JlZGVudGlhbHModG90YWw9YXJjNC5VSW50NjQodG90YWwpLCBhc3NldF9pZHM9YXNzZXRfaWRzLmNvcHkoKSkKICAgIGRpZyAyCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHgwMDBhCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDA5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmNyZWRlbnRpYWxfdmVyaWZpZXIuY29udHJhY3QuQ3JlZGVudGlhbFZlcmlmaWVyLmdldF9kZWxlZ2F0ZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9kZWxlZ2F0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjQyOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDMyCiAgICAvLyBhc3NlcnQgZGVsZWdhdGUgaW4gc2VsZi5kZWxlZ2F0ZXMsICJVbmtub3duIGRlbGVnYXRlIgogICAgYnl0ZWNfMiAvLyAweDY0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVW5rbm93biBkZWxlZ2F0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6NDMzCiAgICAvLyByZXR1cm4gc2VsZi5kZWxlZ2F0ZXNbZGVsZWdhdGVdLmNvcHkoKQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MjkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY3JlZGVudGlhbF92ZXJpZmllci5jb250cmFjdC5DcmVkZW50aWFsVmVyaWZpZXIuZ2V0X2NvaG9ydFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9jb2hvcnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MzUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjQzOQogICAgLy8gYXNzZXJ0IGtleSBpbiBzZWxmLmNvaG9ydHMsICJVbmtub3duIGNvaG9ydCIKICAgIHB1c2hieXRlcyAweDZkCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gVW5rbm93biBjb2hvcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjQ0MAogICAgLy8gcmV0dXJuIHNlbGYuY29ob3J0c1trZXldLmNvcHkoKQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTo0MzUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY3JlZGVudGlhbF92ZXJpZmllci5jb250cmFjdC5DcmVkZW50aWFsVmVyaWZpZXIuX2F1dGhvcml6ZV9pc3N1ZXIoY291bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKX2F1dGhvcml6ZV9pc3N1ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNTgtMTU5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9hdXRob3JpemVfaXNzdWVyKHNlbGYsIGNvdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTYxCiAgICAvLyBpZiBUeG4uc2VuZGVyID09IHNlbGYuYXV0aG9yaXplZF9pbnN0aXR1dGlvbi52YWx1ZToKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhdXRob3JpemVkX2luc3RpdHV0aW9uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmF1dGhvcml6ZWRfaW5zdGl0dXRpb24gZXhpc3RzCiAgICA9PQogICAgYnogX2F1dGhvcml6ZV9pc3N1ZXJfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNjIKICAgIC8vIHJldHVybgogICAgcmV0c3ViCgpfYXV0aG9yaXplX2lzc3Vlcl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNjMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyIGluIHNlbGYuZGVsZWdhdGVzLCAiT25seSB0aGUgYXV0aG9yaXplZCBpbnN0aXR1dGlvbiBvciBhIGRlbGVnYXRlIGNhbiBpc3N1ZSBjcmVkZW50aWFscyIKICAgIGJ5dGVjXzIgLy8gMHg2NAogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBPbmx5IHRoZSBhdXRob3JpemVkIGluc3RpdHV0aW9uIG9yIGEgZGVsZWdhdGUgY2FuIGlzc3VlIGNyZWRlbnRpYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNjQKICAgIC8vIGRlbGVnYXRlID0gc2VsZi5kZWxlZ2F0ZXNbVHhuLnNlbmRlcl0uY29weSgpCiAgICBieXRlY18yIC8vIDB4NjQKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlbGVnYXRlcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE2NQogICAgLy8gaXNzdWVkID0gZGVsZWdhdGUuaXNzdWVkLmFzX3VpbnQ2NCgpICsgY291bnQKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTY2CiAgICAvLyBxdW90YSA9IGRlbGVnYXRlLnF1b3RhLmFzX3VpbnQ2NCgpCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weToxNjcKICAgIC8vIGFzc2VydCBxdW90YSA9PSAwIG9yIGlzc3VlZCA8PSBxdW90YSwgIkRlbGVnYXRlIHF1b3RhIGV4Y2VlZGVkIgogICAgYnogX2F1dGhvcml6ZV9pc3N1ZXJfYm9vbF90cnVlQDQKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMgogICAgPD0KICAgIGJ6IF9hdXRob3JpemVfaXNzdWVyX2Jvb2xfZmFsc2VANQoKX2F1dGhvcml6ZV9pc3N1ZXJfYm9vbF90cnVlQDQ6CiAgICBpbnRjXzEgLy8gMQoKX2F1dGhvcml6ZV9pc3N1ZXJfYm9vbF9tZXJnZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTY3CiAgICAvLyBhc3NlcnQgcXVvdGEgPT0gMCBvciBpc3N1ZWQgPD0gcXVvdGEsICJEZWxlZ2F0ZSBxdW90YSBleGNlZWRlZCIKICAgIGFzc2VydCAvLyBEZWxlZ2F0ZSBxdW90YSBleGNlZWRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MTY4CiAgICAvLyBkZWxlZ2F0ZS5pc3N1ZWQgPSBhcmM0LlVJbnQ2NChpc3N1ZWQpCiAgICBmcmFtZV9kaWcgMQogICAgaXRvYgogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIHJlcGxhY2UyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjE2OQogICAgLy8gc2VsZi5kZWxlZ2F0ZXNbVHhuLnNlbmRlcl0gPSBkZWxlZ2F0ZS5jb3B5KCkKICAgIGJ5dGVjXzIgLy8gMHg2NAogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCl9hdXRob3JpemVfaXNzdWVyX2Jvb2xfZmFsc2VANToKICAgIGludGNfMCAvLyAwCiAgICBiIF9hdXRob3JpemVfaXNzdWVyX2Jvb2xfbWVyZ2VANgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci5faXNzdWUoc3R1ZGVudF9hZGRyZXNzOiBieXRlcywgY3JlZGVudGlhbF9uYW1lOiBieXRlcywgbWV0YWRhdGFfdXJsOiBieXRlcykgLT4gdWludDY0OgpfaXNzdWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMDUtMzA2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9pc3N1ZShzZWxmLCBzdHVkZW50X2FkZHJlc3M6IEFjY291bnQsIGNyZWRlbnRpYWxfbmFtZTogU3RyaW5nLCBtZXRhZGF0YV91cmw6IFN0cmluZykgLT4gVUludDY0OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMDctMzE3CiAgICAvLyAjIE1pbnQgdGhlIE5GVCB1c2luZyBhbiBpbm5lciB0cmFuc2FjdGlvbgogICAgLy8gYXNzZXRfY3JlYXRlID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xLAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgYXNzZXRfbmFtZT1jcmVkZW50aWFsX25hbWUsCiAgICAvLyAgICAgdW5pdF9uYW1lPVN0cmluZygiQ0VSVCIpLAogICAgLy8gICAgIHVybD1tZXRhZGF0YV91cmwsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAgIyBDb250cmFjdCBpcyB0aGUgbWFuYWdlcgogICAgLy8gICAgIHJlc2VydmU9c3R1ZGVudF9hZGRyZXNzLCAjIFJlc2VydmUgaXMgdGhlIHN0dWRlbnQKICAgIC8vICAgICBmZWU9MCwgICMgUGFpZCBieSB0aGUgb3V0ZXIgY2FsbAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzE0CiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICAjIENvbnRyYWN0IGlzIHRoZSBtYW5hZ2VyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVSTAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzEyCiAgICAvLyB1bml0X25hbWU9U3RyaW5nKCJDRVJUIiksCiAgICBieXRlYyA4IC8vICJDRVJUIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMTAKICAgIC8vIGRlY2ltYWxzPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMDkKICAgIC8vIHRvdGFsPTEsCiAgICBpbnRjXzEgLy8gMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMDctMzA4CiAgICAvLyAjIE1pbnQgdGhlIE5GVCB1c2luZyBhbiBpbm5lciB0cmFuc2FjdGlvbgogICAgLy8gYXNzZXRfY3JlYXRlID0gaXR4bi5Bc3NldENvbmZpZygKICAgIHB1c2hpbnQgMyAvLyBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMTYKICAgIC8vIGZlZT0wLCAgIyBQYWlkIGJ5IHRoZSBvdXRlciBjYWxsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjMwNy0zMTcKICAgIC8vICMgTWludCB0aGUgTkZUIHVzaW5nIGFuIGlubmVyIHRyYW5zYWN0aW9uCiAgICAvLyBhc3NldF9jcmVhdGUgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgLy8gICAgIHRvdGFsPTEsCiAgICAvLyAgICAgZGVjaW1hbHM9MCwKICAgIC8vICAgICBhc3NldF9uYW1lPWNyZWRlbnRpYWxfbmFtZSwKICAgIC8vICAgICB1bml0X25hbWU9U3RyaW5nKCJDRVJUIiksCiAgICAvLyAgICAgdXJsPW1ldGFkYXRhX3VybCwKICAgIC8vICAgICBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICAjIENvbnRyYWN0IGlzIHRoZSBtYW5hZ2VyCiAgICAvLyAgICAgcmVzZXJ2ZT1zdHVkZW50X2FkZHJlc3MsICMgUmVzZXJ2ZSBpcyB0aGUgc3R1ZGVudAogICAgLy8gICAgIGZlZT0wLCAgIyBQYWlkIGJ5IHRoZSBvdXRlciBjYWxsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzIwLTMyMgogICAgLy8gIyBUaGUgYm94IG5hbWUgZGVwZW5kcyBvbiB0aGUgbmV3IEFzc2V0IElELCBzbyBjYWxsZXJzIHBvcHVsYXRlIGJveAogICAgLy8gIyByZWZlcmVuY2VzIGJ5IHNpbXVsYXRpbmcgZmlyc3QgKGFsZ29raXQtdXRpbHMgZG9lcyB0aGlzIGJ5IGRlZmF1bHQpCiAgICAvLyBzZWxmLl9yZWdpc3Rlcihhc3NldF9pZCwgc3R1ZGVudF9hZGRyZXNzLCBCeXRlczMyLmZyb21fYnl0ZXMob3Auc2hhMjU2KG1ldGFkYXRhX3VybC5ieXRlcykpKQogICAgZnJhbWVfZGlnIC0xCiAgICBzaGEyNTYKICAgIGRpZyAxCiAgICBmcmFtZV9kaWcgLTMKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfcmVnaXN0ZXIKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzIzCiAgICAvLyByZXR1cm4gYXNzZXRfaWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci5fcmVnaXN0ZXIoYXNzZXRfaWQ6IHVpbnQ2NCwgc3R1ZGVudF9hZGRyZXNzOiBieXRlcywgZG9jdW1lbnRfaGFzaDogYnl0ZXMpIC0+IGJ5dGVzOgpfcmVnaXN0ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMjUtMzI2CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9yZWdpc3RlcihzZWxmLCBhc3NldF9pZDogVUludDY0LCBzdHVkZW50X2FkZHJlc3M6IEFjY291bnQsIGRvY3VtZW50X2hhc2g6IEJ5dGVzMzIpIC0+IE5vbmU6CiAgICBwcm90byAzIDEKICAgIGludGNfMCAvLyAwCiAgICBwdXNoYnl0ZXMgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzI4CiAgICAvLyBzZXJpYWwgPSBhcmM0LlVJbnQ2NChzZWxmLm5leHRfc2VyaWFsKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gIm5leHRfc2VyaWFsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm5leHRfc2VyaWFsIGV4aXN0cwogICAgZHVwCiAgICBpdG9iCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjMzMgogICAgLy8gaXNzdWVfcm91bmQ9YXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kKSwKICAgIGdsb2JhbCBSb3VuZAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzI5LTMzNQogICAgLy8gc2VsZi5jcmVkZW50aWFsc1thcmM0LlVJbnQ2NChhc3NldF9pZCldID0gQ3JlZGVudGlhbFJlY29yZCgKICAgIC8vICAgICBob2xkZXI9aG9sZGVyLAogICAgLy8gICAgIGRvY3VtZW50X2hhc2g9ZG9jdW1lbnRfaGFzaC5jb3B5KCksCiAgICAvLyAgICAgaXNzdWVfcm91bmQ9YXJjNC5VSW50NjQoR2xvYmFsLnJvdW5kKSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50OChTVEFUVVNfQUNUSVZFKSwKICAgIC8vICAgICBzZXJpYWw9c2VyaWFsLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMzMKICAgIC8vIHN0YXR1cz1hcmM0LlVJbnQ4KFNUQVRVU19BQ1RJVkUpLAogICAgcHVzaGJ5dGVzIDB4MDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjMyOS0zMzUKICAgIC8vIHNlbGYuY3JlZGVudGlhbHNbYXJjNC5VSW50NjQoYXNzZXRfaWQpXSA9IENyZWRlbnRpYWxSZWNvcmQoCiAgICAvLyAgICAgaG9sZGVyPWhvbGRlciwKICAgIC8vICAgICBkb2N1bWVudF9oYXNoPWRvY3VtZW50X2hhc2guY29weSgpLAogICAgLy8gICAgIGlzc3VlX3JvdW5kPWFyYzQuVUludDY0KEdsb2JhbC5yb3VuZCksCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDgoU1RBVFVTX0FDVElWRSksCiAgICAvLyAgICAgc2VyaWFsPXNlcmlhbCwKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozMjkKICAgIC8vIHNlbGYuY3JlZGVudGlhbHNbYXJjNC5VSW50NjQoYXNzZXRfaWQpXSA9IENyZWRlbnRpYWxSZWNvcmQoCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgMwogICAgYnl0ZWNfMyAvLyAweDYzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjMyOS0zMzUKICAgIC8vIHNlbGYuY3JlZGVudGlhbHNbYXJjNC5VSW50NjQoYXNzZXRfaWQpXSA9IENyZWRlbnRpYWxSZWNvcmQoCiAgICAvLyAgICAgaG9sZGVyPWhvbGRlciwKICAgIC8vICAgICBkb2N1bWVudF9oYXNoPWRvY3VtZW50X2hhc2guY29weSgpLAogICAgLy8gICAgIGlzc3VlX3JvdW5kPWFyYzQuVUludDY0KEdsb2JhbC5yb3VuZCksCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDgoU1RBVFVTX0FDVElWRSksCiAgICAvLyAgICAgc2VyaWFsPXNlcmlhbCwKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjMzNgogICAgLy8gc2VsZi5uZXh0X3NlcmlhbCArPSAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNiAvLyAibmV4dF9zZXJpYWwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzQ2CiAgICAvLyBmaXJzdF9wYWdlID0gc2VsZi5zdHVkZW50X3BhZ2VzLmJveChzdHVkZW50X2FkZHJlc3MuYnl0ZXMgKyBvcC5pdG9iKDApKQogICAgaW50Y18wIC8vIDAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlYyA1IC8vIDB4NjkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNDcKICAgIC8vIGlmIG5vdCBmaXJzdF9wYWdlOgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogX3JlZ2lzdGVyX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzQ4LTM0OQogICAgLy8gIyBBIHN0dWRlbnQncyBmaXJzdCBjcmVkZW50aWFsOiB0aGUgY291bnQgaGVhZGVyIGFuZCBvbmUgSUQKICAgIC8vIGZpcnN0X3BhZ2UudmFsdWUgPSBvcC5pdG9iKDEpICsgb3AuaXRvYihhc3NldF9pZCkKICAgIGludGNfMSAvLyAxCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgNAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKCl9yZWdpc3Rlcl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5jcmVkZW50aWFsX3ZlcmlmaWVyLmNvbnRyYWN0LkNyZWRlbnRpYWxWZXJpZmllci5faW5kZXhfc3R1ZGVudF9jcmVkZW50aWFsQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzM4LTM0MQogICAgLy8gIyBJbmRleGVycyBhbmQgdGhlIGJsb2NrIGZvbGxvd2VyIHBpY2sgaXNzdWFuY2UgdXAgZnJvbSB0aGlzIG9uZSBsb2cKICAgIC8vICMgZW50cnk7IHRoZSBzZXJpYWwgbGV0cyB0aGVtIGNoZWNrIHRoZSByZXZvY2F0aW9uIGJpdG1hcCB3aXRob3V0CiAgICAvLyAjIHJlYWRpbmcgdGhlIHJlY29yZCBib3gKICAgIC8vIGFyYzQuZW1pdChDcmVkZW50aWFsSXNzdWVkKGFyYzQuVUludDY0KGFzc2V0X2lkKSwgaG9sZGVyLCBkb2N1bWVudF9oYXNoLmNvcHkoKSwgc2VyaWFsKSkKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAzCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweGEzNTUxNDk2IC8vIG1ldGhvZCAiQ3JlZGVudGlhbElzc3VlZCh1aW50NjQsYWRkcmVzcyxieXRlWzMyXSx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCl9yZWdpc3Rlcl9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNTEKICAgIC8vIGNvdW50ID0gb3AuYnRvaShmaXJzdF9wYWdlLmV4dHJhY3QoMCwgU1RVREVOVF9JTkRFWF9IRUFERVJfQllURVMpKQogICAgZnJhbWVfZGlnIDUKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNTIKICAgIC8vIG9mZnNldCA9IChjb3VudCAlIFNUVURFTlRfUEFHRV9JRFMpICogOAogICAgZHVwCiAgICBwdXNoaW50IDEyNgogICAgJQogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzUzCiAgICAvLyBpZiBjb3VudCA8IFNUVURFTlRfUEFHRV9JRFM6CiAgICBwdXNoaW50IDEyNgogICAgPAogICAgYnogX3JlZ2lzdGVyX2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNTQKICAgIC8vIG9mZnNldCArPSBTVFVERU5UX0lOREVYX0hFQURFUl9CWVRFUwogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMiAvLyA4CiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNTUKICAgIC8vIGZpcnN0X3BhZ2UucmVzaXplKG9mZnNldCArIDgpCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICArCiAgICBmcmFtZV9kaWcgNQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXNpemUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjM1NgogICAgLy8gZmlyc3RfcGFnZS5yZXBsYWNlKG9mZnNldCwgb3AuaXRvYihhc3NldF9pZCkpCiAgICBzd2FwCiAgICBmcmFtZV9kaWcgNAogICAgYm94X3JlcGxhY2UKCl9yZWdpc3Rlcl9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY3JlZGVudGlhbF92ZXJpZmllci9jb250cmFjdC5weTozNjQKICAgIC8vIGZpcnN0X3BhZ2UucmVwbGFjZSgwLCBvcC5pdG9iKGNvdW50ICsgMSkpCiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGZyYW1lX2RpZyA1CiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzM3CiAgICAvLyBzZWxmLl9pbmRleF9zdHVkZW50X2NyZWRlbnRpYWwoc3R1ZGVudF9hZGRyZXNzLCBhc3NldF9pZCkKICAgIGIgX3JlZ2lzdGVyX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmNyZWRlbnRpYWxfdmVyaWZpZXIuY29udHJhY3QuQ3JlZGVudGlhbFZlcmlmaWVyLl9pbmRleF9zdHVkZW50X2NyZWRlbnRpYWxAMTAKCl9yZWdpc3Rlcl9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjM1OAogICAgLy8gcGFnZSA9IHNlbGYuc3R1ZGVudF9wYWdlcy5ib3goc3R1ZGVudF9hZGRyZXNzLmJ5dGVzICsgb3AuaXRvYihjb3VudCAvLyBTVFVERU5UX1BBR0VfSURTKSkKICAgIGZyYW1lX2RpZyAxCiAgICBwdXNoaW50IDEyNgogICAgLwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDUgLy8gMHg2OQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjM1OQogICAgLy8gaWYgb2Zmc2V0ID09IDA6CiAgICBmcmFtZV9kaWcgMgogICAgYm56IF9yZWdpc3Rlcl9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzYwCiAgICAvLyBwYWdlLmNyZWF0ZShzaXplPVVJbnQ2NCg4KSkKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2NyZWF0ZQogICAgcG9wCgpfcmVnaXN0ZXJfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NyZWRlbnRpYWxfdmVyaWZpZXIvY29udHJhY3QucHk6MzYzCiAgICAvLyBwYWdlLnJlcGxhY2Uob2Zmc2V0LCBvcC5pdG9iKGFzc2V0X2lkKSkKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDQKICAgIGJveF9yZXBsYWNlCiAgICBiIF9yZWdpc3Rlcl9hZnRlcl9pZl9lbHNlQDkKCl9yZWdpc3Rlcl9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jcmVkZW50aWFsX3ZlcmlmaWVyL2NvbnRyYWN0LnB5OjM2MgogICAgLy8gcGFnZS5yZXNpemUob2Zmc2V0ICsgOCkKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzIgLy8gOAogICAgKwogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGJveF9yZXNpemUKICAgIGIgX3JlZ2lzdGVyX2FmdGVyX2lmX2Vsc2VAOAo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1105], "errorMessage": "Address length is 32 bytes"}, {"pc": [698], "errorMessage": "Array lengths differ"}, {"pc": [705, 865, 1205], "errorMessage": "Batch too large"}, {"pc": [1372], "errorMessage": "Cohort already anchored"}, {"pc": [1098], "errorMessage": "Credential already assigned"}, {"pc": [1929], "errorMessage": "Delegate quota exceeded"}, {"pc": [1360], "errorMessage": "Empty cohort"}, {"pc": [1089], "errorMessage": "Not a pooled credential"}, {"pc": [1359], "errorMessage": "Only the authorized institution can anchor cohorts"}, {"pc": [383, 440], "errorMessage": "Only the authorized institution can manage delegates"}, {"pc": [860], "errorMessage": "Only the authorized institution can mint credentials"}, {"pc": [1201], "errorMessage": "Only the authorized institution can revoke credentials"}, {"pc": [1891], "errorMessage": "Only the authorized institution or a delegate can issue credentials"}, {"pc": [1857], "errorMessage": "Unknown cohort"}, {"pc": [1236, 1658], "errorMessage": "Unknown credential"}, {"pc": [448, 1831], "errorMessage": "Unknown delegate"}, {"pc": [1072, 1081, 1568, 1579], "errorMessage": "asset exists"}, {"pc": [381, 438, 858, 1199, 1357, 1878], "errorMessage": "check self.authorized_institution exists"}, {"pc": [1431, 1542], "errorMessage": "check self.credentials entry exists"}, {"pc": [407, 1903], "errorMessage": "check self.delegates entry exists"}, {"pc": [2014], "errorMessage": "check self.next_serial exists"}, {"pc": [1009, 1154], "errorMessage": "check self.pool_size exists"}, {"pc": [1753], "errorMessage": "check self.student_pages entry exists"}, {"pc": [748, 754, 787, 1227, 1516], "errorMessage": "index access is out of bounds"}, {"pc": [568, 646], "errorMessage": "invalid array encoding"}, {"pc": [467, 483, 520, 538, 582, 608, 660, 1180, 1478], "errorMessage": "invalid array length header"}, {"pc": [602, 680], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.dynamic_array<arc4.uint8>>"}, {"pc": [532], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.static_array<arc4.uint8, 32>>"}, {"pc": [1193, 1489], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint64>"}, {"pc": [474, 490], "errorMessage": "invalid number of bytes for arc4.dynamic_array<arc4.uint8>"}, {"pc": [351, 365, 432, 461, 1045, 1059, 1341, 1678, 1823], "errorMessage": "invalid number of bytes for arc4.static_array<arc4.uint8, 32>"}, {"pc": [375, 850, 1032, 1332, 1349, 1393, 1650, 1686, 1847], "errorMessage": "invalid number of bytes for arc4.uint64"}, {"pc": [576, 654], "errorMessage": "invalid tail pointer for (len+(len+utf8[])[])"}, {"pc": [811, 983, 1608], "errorMessage": "max array length exceeded"}, {"pc": [1793], "errorMessage": "overflow"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,6 +64,54 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class CohortAnchor:
+    """Struct for CohortAnchor"""
+    merkle_root: bytes
+    leaf_count: int
+    anchor_round: int
+
+@dataclasses.dataclass(frozen=True)
+class CredentialRecord:
+    """Struct for CredentialRecord"""
+    holder: str
+    document_hash: bytes
+    issue_round: int
+    status: int
+    serial: int
+
+@dataclasses.dataclass(frozen=True)
+class IssuerDelegate:
+    """Struct for IssuerDelegate"""
+    quota: int
+    issued: int
+
+@dataclasses.dataclass(frozen=True)
+class StudentCredentials:
+    """Struct for StudentCredentials"""
+    total: int
+    asset_ids: list[int]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AddDelegateArgs:
+    """Dataclass for add_delegate arguments"""
+    delegate: str
+    quota: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "add_delegate(address,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RemoveDelegateArgs:
+    """Dataclass for remove_delegate arguments"""
+    delegate: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "remove_delegate(address)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class IssueCredentialArgs:
     """Dataclass for issue_credential arguments"""
@@ -75,6 +123,57 @@ class IssueCredentialArgs:
     def abi_method_signature(self) -> str:
         return "issue_credential(address,string,string)uint64"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class IssueCredentialsBatchArgs:
+    """Dataclass for issue_credentials_batch arguments"""
+    student_addresses: list[str]
+    credential_names: list[str]
+    metadata_urls: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "issue_credentials_batch(address[],string[],string[])uint64[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MintPoolArgs:
+    """Dataclass for mint_pool arguments"""
+    count: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "mint_pool(uint64)uint64[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AssignCredentialArgs:
+    """Dataclass for assign_credential arguments"""
+    asset: int
+    student_address: str
+    metadata_digest: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "assign_credential(uint64,address,byte[32])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RevokeCredentialsArgs:
+    """Dataclass for revoke_credentials arguments"""
+    asset_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "revoke_credentials(uint64[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class AnchorCohortArgs:
+    """Dataclass for anchor_cohort arguments"""
+    cohort_id: int
+    merkle_root: bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+    leaf_count: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "anchor_cohort(uint64,byte[32],uint64)void"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class VerifyCredentialArgs:
     """Dataclass for verify_credential arguments"""
@@ -84,6 +183,52 @@ class VerifyCredentialArgs:
     def abi_method_signature(self) -> str:
         return "verify_credential(uint64)string"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class VerifyCredentialsArgs:
+    """Dataclass for verify_credentials arguments"""
+    asset_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "verify_credentials(uint64[])(uint64,bool,address)[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCredentialArgs:
+    """Dataclass for get_credential arguments"""
+    asset_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_credential(uint64)(address,byte[32],uint64,uint8,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ListCredentialsArgs:
+    """Dataclass for list_credentials arguments"""
+    student_address: str
+    page: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "list_credentials(address,uint64)(uint64,uint64[])"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetDelegateArgs:
+    """Dataclass for get_delegate arguments"""
+    delegate: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_delegate(address)(uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetCohortArgs:
+    """Dataclass for get_cohort arguments"""
+    cohort_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_cohort(uint64)(byte[32],uint64,uint64)"
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateArgs:
     """Dataclass for create arguments"""
@@ -98,6 +243,32 @@ class CredentialVerifierParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    def add_delegate(
+        self,
+        args: tuple[str, int] | AddDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_delegate(address,uint64)void",
+            "args": method_args,
+        }))
+
+    def remove_delegate(
+        self,
+        args: tuple[str] | RemoveDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "remove_delegate(address)void",
+            "args": method_args,
+        }))
+
     def issue_credential(
         self,
         args: tuple[str, str, str] | IssueCredentialArgs,
@@ -111,6 +282,71 @@ class CredentialVerifierParams:
             "args": method_args,
         }))
 
+    def issue_credentials_batch(
+        self,
+        args: tuple[list[str], list[str], list[str]] | IssueCredentialsBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "issue_credentials_batch(address[],string[],string[])uint64[]",
+            "args": method_args,
+        }))
+
+    def mint_pool(
+        self,
+        args: tuple[int] | MintPoolArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mint_pool(uint64)uint64[]",
+            "args": method_args,
+        }))
+
+    def assign_credential(
+        self,
+        args: tuple[int, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | AssignCredentialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "assign_credential(uint64,address,byte[32])void",
+            "args": method_args,
+        }))
+
+    def revoke_credentials(
+        self,
+        args: tuple[list[int]] | RevokeCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "revoke_credentials(uint64[])void",
+            "args": method_args,
+        }))
+
+    def anchor_cohort(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | AnchorCohortArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "anchor_cohort(uint64,byte[32],uint64)void",
+            "args": method_args,
+        }))
+
     def verify_credential(
         self,
         args: tuple[int] | VerifyCredentialArgs,
@@ -124,6 +360,71 @@ class CredentialVerifierParams:
             "args": method_args,
         }))
 
+    def verify_credentials(
+        self,
+        args: tuple[list[int]] | VerifyCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "verify_credentials(uint64[])(uint64,bool,address)[]",
+            "args": method_args,
+        }))
+
+    def get_credential(
+        self,
+        args: tuple[int] | GetCredentialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_credential(uint64)(address,byte[32],uint64,uint8,uint64)",
+            "args": method_args,
+        }))
+
+    def list_credentials(
+        self,
+        args: tuple[str, int] | ListCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "list_credentials(address,uint64)(uint64,uint64[])",
+            "args": method_args,
+        }))
+
+    def get_delegate(
+        self,
+        args: tuple[str] | GetDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_delegate(address)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_cohort(
+        self,
+        args: tuple[int] | GetCohortArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_cohort(uint64)(byte[32],uint64,uint64)",
+            "args": method_args,
+        }))
+
     def get_contract_info(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -163,6 +464,32 @@ class CredentialVerifierCreateTransactionParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    def add_delegate(
+        self,
+        args: tuple[str, int] | AddDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_delegate(address,uint64)void",
+            "args": method_args,
+        }))
+
+    def remove_delegate(
+        self,
+        args: tuple[str] | RemoveDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "remove_delegate(address)void",
+            "args": method_args,
+        }))
+
     def issue_credential(
         self,
         args: tuple[str, str, str] | IssueCredentialArgs,
@@ -176,6 +503,71 @@ class CredentialVerifierCreateTransactionParams:
             "args": method_args,
         }))
 
+    def issue_credentials_batch(
+        self,
+        args: tuple[list[str], list[str], list[str]] | IssueCredentialsBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "issue_credentials_batch(address[],string[],string[])uint64[]",
+            "args": method_args,
+        }))
+
+    def mint_pool(
+        self,
+        args: tuple[int] | MintPoolArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mint_pool(uint64)uint64[]",
+            "args": method_args,
+        }))
+
+    def assign_credential(
+        self,
+        args: tuple[int, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | AssignCredentialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "assign_credential(uint64,address,byte[32])void",
+            "args": method_args,
+        }))
+
+    def revoke_credentials(
+        self,
+        args: tuple[list[int]] | RevokeCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "revoke_credentials(uint64[])void",
+            "args": method_args,
+        }))
+
+    def anchor_cohort(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | AnchorCohortArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "anchor_cohort(uint64,byte[32],uint64)void",
+            "args": method_args,
+        }))
+
     def verify_credential(
         self,
         args: tuple[int] | VerifyCredentialArgs,
@@ -189,6 +581,71 @@ class CredentialVerifierCreateTransactionParams:
             "args": method_args,
         }))
 
+    def verify_credentials(
+        self,
+        args: tuple[list[int]] | VerifyCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "verify_credentials(uint64[])(uint64,bool,address)[]",
+            "args": method_args,
+        }))
+
+    def get_credential(
+        self,
+        args: tuple[int] | GetCredentialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_credential(uint64)(address,byte[32],uint64,uint8,uint64)",
+            "args": method_args,
+        }))
+
+    def list_credentials(
+        self,
+        args: tuple[str, int] | ListCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "list_credentials(address,uint64)(uint64,uint64[])",
+            "args": method_args,
+        }))
+
+    def get_delegate(
+        self,
+        args: tuple[str] | GetDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_delegate(address)(uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def get_cohort(
+        self,
+        args: tuple[int] | GetCohortArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_cohort(uint64)(byte[32],uint64,uint64)",
+            "args": method_args,
+        }))
+
     def get_contract_info(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -228,6 +685,38 @@ class CredentialVerifierSend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    def add_delegate(
+        self,
+        args: tuple[str, int] | AddDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "add_delegate(address,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def remove_delegate(
+        self,
+        args: tuple[str] | RemoveDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "remove_delegate(address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def issue_credential(
         self,
         args: tuple[str, str, str] | IssueCredentialArgs,
@@ -244,6 +733,86 @@ class CredentialVerifierSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def issue_credentials_batch(
+        self,
+        args: tuple[list[str], list[str], list[str]] | IssueCredentialsBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "issue_credentials_batch(address[],string[],string[])uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def mint_pool(
+        self,
+        args: tuple[int] | MintPoolArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "mint_pool(uint64)uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def assign_credential(
+        self,
+        args: tuple[int, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | AssignCredentialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "assign_credential(uint64,address,byte[32])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def revoke_credentials(
+        self,
+        args: tuple[list[int]] | RevokeCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "revoke_credentials(uint64[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def anchor_cohort(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | AnchorCohortArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "anchor_cohort(uint64,byte[32],uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def verify_credential(
         self,
         args: tuple[int] | VerifyCredentialArgs,
@@ -260,6 +829,86 @@ class CredentialVerifierSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
 
+    def verify_credentials(
+        self,
+        args: tuple[list[int]] | VerifyCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[int, bool, str]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "verify_credentials(uint64[])(uint64,bool,address)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[int, bool, str]]], parsed_response)
+
+    def get_credential(
+        self,
+        args: tuple[int] | GetCredentialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[CredentialRecord]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_credential(uint64)(address,byte[32],uint64,uint8,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CredentialRecord, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[CredentialRecord], parsed_response)
+
+    def list_credentials(
+        self,
+        args: tuple[str, int] | ListCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[StudentCredentials]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "list_credentials(address,uint64)(uint64,uint64[])",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(StudentCredentials, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[StudentCredentials], parsed_response)
+
+    def get_delegate(
+        self,
+        args: tuple[str] | GetDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[IssuerDelegate]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_delegate(address)(uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(IssuerDelegate, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[IssuerDelegate], parsed_response)
+
+    def get_cohort(
+        self,
+        args: tuple[int] | GetCohortArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[CohortAnchor]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_cohort(uint64)(byte[32],uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(CohortAnchor, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[CohortAnchor], parsed_response)
+
     def get_contract_info(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -304,6 +953,8 @@ class CredentialVerifierSend:
 class GlobalStateValue(typing.TypedDict):
     """Shape of global_state state key values"""
     authorized_institution: str
+    next_serial: int
+    pool_size: int
 
 class CredentialVerifierState:
     """Methods to access state for the current CredentialVerifier app"""
@@ -318,6 +969,13 @@ class CredentialVerifierState:
             """Methods to access global_state for the current app"""
             return _GlobalState(self.app_client)
 
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
 class _GlobalState:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
@@ -349,6 +1007,129 @@ class _GlobalState:
             return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
         return typing.cast(str, value)
 
+    @property
+    def next_serial(self) -> int:
+        """Get the current value of the next_serial key in global_state state"""
+        value = self.app_client.state.global_state.get_value("next_serial")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def pool_size(self) -> int:
+        """Get the current value of the pool_size key in global_state state"""
+        value = self.app_client.state.global_state.get_value("pool_size")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "CredentialRecord": CredentialRecord,
+            "CohortAnchor": CohortAnchor,
+            "IssuerDelegate": IssuerDelegate
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def credentials(self) -> "_MapState[int, CredentialRecord]":
+        """Get values from the credentials map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "credentials",
+            self._struct_classes.get("CredentialRecord")
+        )
+
+    @property
+    def cohorts(self) -> "_MapState[int, CohortAnchor]":
+        """Get values from the cohorts map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "cohorts",
+            self._struct_classes.get("CohortAnchor")
+        )
+
+    @property
+    def revocations(self) -> "_MapState[int, bytes]":
+        """Get values from the revocations map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "revocations",
+            None
+        )
+
+    @property
+    def delegates(self) -> "_MapState[str, IssuerDelegate]":
+        """Get values from the delegates map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "delegates",
+            self._struct_classes.get("IssuerDelegate")
+        )
+
+    @property
+    def student_pages(self) -> "_MapState[bytes, bytes]":
+        """Get values from the student_pages map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "student_pages",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
 class CredentialVerifierClient:
     """Client for interacting with CredentialVerifier smart contract"""
 
@@ -492,6 +1273,18 @@ class CredentialVerifierClient:
     def new_group(self) -> "CredentialVerifierComposer":
         return CredentialVerifierComposer(self)
 
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["add_delegate(address,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["remove_delegate(address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -499,12 +1292,72 @@ class CredentialVerifierClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["issue_credentials_batch(address[],string[],string[])uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["mint_pool(uint64)uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["assign_credential(uint64,address,byte[32])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["revoke_credentials(uint64[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["anchor_cohort(uint64,byte[32],uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["verify_credential(uint64)string"],
         return_value: algokit_utils.ABIReturn | None
     ) -> str | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["verify_credentials(uint64[])(uint64,bool,address)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[int, bool, str]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_credential(uint64)(address,byte[32],uint64,uint8,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> CredentialRecord | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["list_credentials(address,uint64)(uint64,uint64[])"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> StudentCredentials | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_delegate(address)(uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> IssuerDelegate | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_cohort(uint64)(byte[32],uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> CohortAnchor | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_contract_info()string"],
@@ -527,7 +1380,7 @@ class CredentialVerifierClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | str:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | CohortAnchor | CredentialRecord | IssuerDelegate | None | StudentCredentials | int | list[int] | list[tuple[int, bool, str]] | str:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -662,89 +1515,329 @@ class CredentialVerifierFactory(algokit_utils.TypedAppFactoryProtocol[Credential
             )
         )
 
-    def get_app_client_by_id(
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> CredentialVerifierClient:
+        """Get an app client by app ID"""
+        return CredentialVerifierClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class CredentialVerifierFactoryParams:
+    """Parameters for creating transactions for CredentialVerifier contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CredentialVerifierFactoryCreateParams(app_factory)
+        self.update = CredentialVerifierFactoryUpdateParams(app_factory)
+        self.delete = CredentialVerifierFactoryDeleteParams(app_factory)
+
+class CredentialVerifierFactoryCreateParams:
+    """Parameters for 'create' operations of CredentialVerifier contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def add_delegate(
+        self,
+        args: tuple[str, int] | AddDelegateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the add_delegate(address,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "add_delegate(address,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def remove_delegate(
+        self,
+        args: tuple[str] | RemoveDelegateArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the remove_delegate(address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "remove_delegate(address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def issue_credential(
+        self,
+        args: tuple[str, str, str] | IssueCredentialArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the issue_credential(address,string,string)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "issue_credential(address,string,string)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def issue_credentials_batch(
+        self,
+        args: tuple[list[str], list[str], list[str]] | IssueCredentialsBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the issue_credentials_batch(address[],string[],string[])uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "issue_credentials_batch(address[],string[],string[])uint64[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def mint_pool(
+        self,
+        args: tuple[int] | MintPoolArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the mint_pool(uint64)uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "mint_pool(uint64)uint64[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def assign_credential(
+        self,
+        args: tuple[int, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | AssignCredentialArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the assign_credential(uint64,address,byte[32])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "assign_credential(uint64,address,byte[32])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def revoke_credentials(
+        self,
+        args: tuple[list[int]] | RevokeCredentialsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the revoke_credentials(uint64[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "revoke_credentials(uint64[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def anchor_cohort(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | AnchorCohortArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the anchor_cohort(uint64,byte[32],uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "anchor_cohort(uint64,byte[32],uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def verify_credential(
+        self,
+        args: tuple[int] | VerifyCredentialArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the verify_credential(uint64)string ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "verify_credential(uint64)string",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def verify_credentials(
         self,
-        app_id: int,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> CredentialVerifierClient:
-        """Get an app client by app ID"""
-        return CredentialVerifierClient(
-            self.app_factory.get_app_client_by_id(
-                app_id,
-                app_name,
-                default_sender,
-                default_signer,
-                approval_source_map,
-                clear_source_map,
-            )
+        args: tuple[list[int]] | VerifyCredentialsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the verify_credentials(uint64[])(uint64,bool,address)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "verify_credentials(uint64[])(uint64,bool,address)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
         )
 
+    def get_credential(
+        self,
+        args: tuple[int] | GetCredentialArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_credential(uint64)(address,byte[32],uint64,uint8,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_credential(uint64)(address,byte[32],uint64,uint8,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-class CredentialVerifierFactoryParams:
-    """Parameters for creating transactions for CredentialVerifier contract"""
-
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
-        self.create = CredentialVerifierFactoryCreateParams(app_factory)
-        self.update = CredentialVerifierFactoryUpdateParams(app_factory)
-        self.delete = CredentialVerifierFactoryDeleteParams(app_factory)
-
-class CredentialVerifierFactoryCreateParams:
-    """Parameters for 'create' operations of CredentialVerifier contract"""
-
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
-
-    def bare(
+    def list_credentials(
         self,
+        args: tuple[str, int] | ListCredentialsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateParams:
-        """Creates an instance using a bare call"""
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the list_credentials(address,uint64)(uint64,uint64[]) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            compilation_params=compilation_params)
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "list_credentials(address,uint64)(uint64,uint64[])",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def issue_credential(
+    def get_delegate(
         self,
-        args: tuple[str, str, str] | IssueCredentialArgs,
+        args: tuple[str] | GetDelegateArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the issue_credential(address,string,string)uint64 ABI method"""
+        """Creates a new instance using the get_delegate(address)(uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "issue_credential(address,string,string)uint64",
+                "method": "get_delegate(address)(uint64,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def verify_credential(
+    def get_cohort(
         self,
-        args: tuple[int] | VerifyCredentialArgs,
+        args: tuple[int] | GetCohortArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the verify_credential(uint64)string ABI method"""
+        """Creates a new instance using the get_cohort(uint64)(byte[32],uint64,uint64) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "verify_credential(uint64)string",
+                "method": "get_cohort(uint64)(byte[32],uint64,uint64)",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -929,6 +2022,42 @@ class CredentialVerifierComposer:
         self._composer = client.algorand.new_group()
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
 
+    def add_delegate(
+        self,
+        args: tuple[str, int] | AddDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.add_delegate(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "add_delegate(address,uint64)void", v
+            )
+        )
+        return self
+
+    def remove_delegate(
+        self,
+        args: tuple[str] | RemoveDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.remove_delegate(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "remove_delegate(address)void", v
+            )
+        )
+        return self
+
     def issue_credential(
         self,
         args: tuple[str, str, str] | IssueCredentialArgs,
@@ -947,6 +2076,96 @@ class CredentialVerifierComposer:
         )
         return self
 
+    def issue_credentials_batch(
+        self,
+        args: tuple[list[str], list[str], list[str]] | IssueCredentialsBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.issue_credentials_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "issue_credentials_batch(address[],string[],string[])uint64[]", v
+            )
+        )
+        return self
+
+    def mint_pool(
+        self,
+        args: tuple[int] | MintPoolArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.mint_pool(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "mint_pool(uint64)uint64[]", v
+            )
+        )
+        return self
+
+    def assign_credential(
+        self,
+        args: tuple[int, str, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]] | AssignCredentialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.assign_credential(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "assign_credential(uint64,address,byte[32])void", v
+            )
+        )
+        return self
+
+    def revoke_credentials(
+        self,
+        args: tuple[list[int]] | RevokeCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.revoke_credentials(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "revoke_credentials(uint64[])void", v
+            )
+        )
+        return self
+
+    def anchor_cohort(
+        self,
+        args: tuple[int, bytes | str | tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int], int] | AnchorCohortArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.anchor_cohort(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "anchor_cohort(uint64,byte[32],uint64)void", v
+            )
+        )
+        return self
+
     def verify_credential(
         self,
         args: tuple[int] | VerifyCredentialArgs,
@@ -965,6 +2184,96 @@ class CredentialVerifierComposer:
         )
         return self
 
+    def verify_credentials(
+        self,
+        args: tuple[list[int]] | VerifyCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.verify_credentials(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "verify_credentials(uint64[])(uint64,bool,address)[]", v
+            )
+        )
+        return self
+
+    def get_credential(
+        self,
+        args: tuple[int] | GetCredentialArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_credential(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_credential(uint64)(address,byte[32],uint64,uint8,uint64)", v
+            )
+        )
+        return self
+
+    def list_credentials(
+        self,
+        args: tuple[str, int] | ListCredentialsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.list_credentials(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "list_credentials(address,uint64)(uint64,uint64[])", v
+            )
+        )
+        return self
+
+    def get_delegate(
+        self,
+        args: tuple[str] | GetDelegateArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_delegate(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_delegate(address)(uint64,uint64)", v
+            )
+        )
+        return self
+
+    def get_cohort(
+        self,
+        args: tuple[int] | GetCohortArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CredentialVerifierComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_cohort(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_cohort(uint64)(byte[32],uint64,uint64)", v
+            )
+        )
+        return self
+
     def get_contract_info(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
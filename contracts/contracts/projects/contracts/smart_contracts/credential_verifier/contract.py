@@ -1,29 +1,309 @@
-from algopy import ARC4Contract, Txn, Account, GlobalState, itxn, String, UInt64, Global
+import typing
+
+from algopy import (
+    ARC4Contract,
+    Txn,
+    Account,
+    Asset,
+    BoxMap,
+    Bytes,
+    GlobalState,
+    OpUpFeeSource,
+    ensure_budget,
+    itxn,
+    op,
+    String,
+    UInt64,
+    Global,
+    arc4,
+    subroutine,
+    urange,
+)
 from algopy.arc4 import abimethod
 
+# Credential status values stored in each registry record
+STATUS_ACTIVE = 1
+STATUS_REVOKED = 2
+
+# Revocation bitmap pages: one bit per credential serial, 1KB (8192 serials)
+# per box so touching a page never needs more than one box reference
+REVOCATION_PAGE_BYTES = 1024
+REVOCATION_PAGE_BITS = REVOCATION_PAGE_BYTES * 8
+
+# Opcode budget reserved per credential minted by issue_credentials_batch
+ISSUE_OPCODE_BUDGET = 300
+# An app call may log at most 1KB in total. Each entry of a batch costs an
+# 84-byte event plus 8 bytes of return value, so 11 fit in one call.
+# Box references bound a whole group more tightly: each credential touches
+# its record box and its student's index page, and a group of 16
+# transactions can name at most 128 resources (8 each), so one group mints
+# up to 64 credentials however they are split across calls (students past
+# their first index page need page 0 as well, for the count)
+MAX_BATCH_SIZE = 11
+
+# Pre-minted pool credentials are ARC-19 assets whose metadata CID (CIDv0, as
+# returned by Pinata) is read from the reserve address once they are assigned
+ARC19_TEMPLATE_URL = "template-ipfs://{ipfs:0:dag-pb:reserve:sha2-256}"
+POOL_CREDENTIAL_NAME = "Credential"
+# Opcode budget reserved per blank credential minted by mint_pool
+POOL_MINT_OPCODE_BUDGET = 100
+MAX_POOL_MINT = 64
+
+# Per-student credential index: Asset IDs are appended to pages of at most
+# 126 IDs. list_credentials returns a whole page, and 126 is the most whose
+# ABI return (4-byte prefix, 8-byte total, 2-byte offset, 2-byte length,
+# 8 bytes per ID) fits the 1KB an app call may log. Page 0 starts with the
+# student's total count, so most issues touch a single index box
+STUDENT_PAGE_IDS = 126
+STUDENT_INDEX_HEADER_BYTES = 8
+
+Bytes32: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
+
+class CredentialRecord(arc4.Struct):
+    """Fixed-width registry entry stored in a box keyed by the credential's Asset ID"""
+
+    holder: arc4.Address
+    document_hash: Bytes32
+    issue_round: arc4.UInt64
+    status: arc4.UInt8
+    serial: arc4.UInt64
+
+
+class CredentialIssued(arc4.Struct):
+    """ARC-28 event logged for every credential issued"""
+
+    asset_id: arc4.UInt64
+    holder: arc4.Address
+    document_hash: Bytes32
+    serial: arc4.UInt64  # Bit in the revocation bitmap
+
+
+class CredentialRevoked(arc4.Struct):
+    """ARC-28 event logged for every credential revoked"""
+
+    asset_id: arc4.UInt64
+    holder: arc4.Address
+    document_hash: Bytes32
+
+
+class IssuerDelegate(arc4.Struct):
+    """An account allowed to issue on the institution's behalf"""
+
+    quota: arc4.UInt64  # 0 means unlimited
+    issued: arc4.UInt64
+
+
+class CredentialCheck(arc4.Struct):
+    """Verdict for one credential in a verify_credentials batch"""
+
+    asset_id: arc4.UInt64
+    valid: arc4.Bool
+    holder: arc4.Address  # Zero address for unknown credentials
+
+
+class StudentCredentials(arc4.Struct):
+    """One page of a student's credential index and how many they hold in total"""
+
+    total: arc4.UInt64
+    asset_ids: arc4.DynamicArray[arc4.UInt64]
+
+
+class CohortAnchor(arc4.Struct):
+    """Merkle root of a cohort's certificate hashes, anchored in one box"""
+
+    merkle_root: Bytes32
+    leaf_count: arc4.UInt64
+    anchor_round: arc4.UInt64
+
 
 class CredentialVerifier(ARC4Contract):
     """Algorand Credential Verifier Smart Contract"""
 
     def __init__(self) -> None:
         self.authorized_institution = GlobalState(Account)
+        self.credentials = BoxMap(arc4.UInt64, CredentialRecord, key_prefix=b"c")
+        self.cohorts = BoxMap(arc4.UInt64, CohortAnchor, key_prefix=b"m")
+        self.revocations = BoxMap(arc4.UInt64, Bytes, key_prefix=b"r")
+        self.delegates = BoxMap(Account, IssuerDelegate, key_prefix=b"d")
+        # Keyed by student address + big-endian page number
+        self.student_pages = BoxMap(Bytes, Bytes, key_prefix=b"i")
+        self.next_serial = UInt64(0)
+        self.pool_size = UInt64(0)
 
     @abimethod(create="require")
     def create(self, institution: Account) -> None:
         """Initialize the contract with the authorized institution"""
         self.authorized_institution.value = institution
 
+    @abimethod
+    def add_delegate(self, delegate: Account, quota: UInt64) -> None:
+        """
+        Let `delegate` issue credentials, at most `quota` of them (0 for no limit).
+        Re-adding a delegate changes its quota and keeps its issued count.
+        """
+        assert Txn.sender == self.authorized_institution.value, "Only the authorized institution can manage delegates"
+        issued = arc4.UInt64(0)
+        if delegate in self.delegates:
+            issued = self.delegates[delegate].issued
+        self.delegates[delegate] = IssuerDelegate(quota=arc4.UInt64(quota), issued=issued)
+
+    @abimethod
+    def remove_delegate(self, delegate: Account) -> None:
+        """Revoke a delegate's right to issue"""
+        assert Txn.sender == self.authorized_institution.value, "Only the authorized institution can manage delegates"
+        assert delegate in self.delegates, "Unknown delegate"
+        del self.delegates[delegate]
+
+    @subroutine
+    def _authorize_issuer(self, count: UInt64) -> None:
+        """Allow the institution, or a delegate with `count` issuances left in its quota"""
+        if Txn.sender == self.authorized_institution.value:
+            return
+        assert Txn.sender in self.delegates, "Only the authorized institution or a delegate can issue credentials"
+        delegate = self.delegates[Txn.sender].copy()
+        issued = delegate.issued.as_uint64() + count
+        quota = delegate.quota.as_uint64()
+        assert quota == 0 or issued <= quota, "Delegate quota exceeded"
+        delegate.issued = arc4.UInt64(issued)
+        self.delegates[Txn.sender] = delegate.copy()
+
     @abimethod
     def issue_credential(
         self, student_address: Account, credential_name: String, metadata_url: String
     ) -> UInt64:
         """
         Issue a credential to a student.
-        Mints an NFT and returns the Asset ID.
-        Only the authorized institution can call this.
+        Mints an NFT, records it in the credential registry and returns the Asset ID.
+        Only the authorized institution or one of its delegates can call this.
         """
-        assert Txn.sender == self.authorized_institution.value, "Only the authorized institution can issue credentials"
-        
+        self._authorize_issuer(UInt64(1))
+        return self._issue(student_address, credential_name, metadata_url)
+
+    @abimethod
+    def issue_credentials_batch(
+        self,
+        student_addresses: arc4.DynamicArray[arc4.Address],
+        credential_names: arc4.DynamicArray[arc4.String],
+        metadata_urls: arc4.DynamicArray[arc4.String],
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Issue many credentials in one app call and return their Asset IDs in order.
+        Inner transactions carry no fee, so the outer call pays for every mint
+        (fee pooling), and missing opcode budget is bought with OpUp calls paid
+        from the same group credit.
+        """
+        count = student_addresses.length
+        assert credential_names.length == count and metadata_urls.length == count, "Array lengths differ"
+        assert count <= MAX_BATCH_SIZE, "Batch too large"
+        self._authorize_issuer(count)
+        ensure_budget(count * ISSUE_OPCODE_BUDGET, OpUpFeeSource.GroupCredit)
+
+        asset_ids = arc4.DynamicArray[arc4.UInt64]()
+        for i in urange(count):
+            asset_id = self._issue(
+                student_addresses[i].native,
+                credential_names[i].native,
+                metadata_urls[i].native,
+            )
+            asset_ids.append(arc4.UInt64(asset_id))
+        return asset_ids
+
+    @abimethod
+    def mint_pool(self, count: UInt64) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Pre-mint blank ARC-19 credentials (e.g. off-peak) so issuing one later
+        is a reserve reconfiguration plus a transfer instead of a full mint.
+        Blank credentials have the app account as reserve and hold no record.
+        """
+        assert Txn.sender == self.authorized_institution.value, "Only the authorized institution can mint credentials"
+        assert count <= MAX_POOL_MINT, "Batch too large"
+        ensure_budget(count * POOL_MINT_OPCODE_BUDGET, OpUpFeeSource.GroupCredit)
+
+        asset_ids = arc4.DynamicArray[arc4.UInt64]()
+        for _i in urange(count):
+            asset_create = itxn.AssetConfig(
+                total=1,
+                decimals=0,
+                asset_name=String(POOL_CREDENTIAL_NAME),
+                unit_name=String("CERT"),
+                url=String(ARC19_TEMPLATE_URL),
+                manager=Global.current_application_address,
+                reserve=Global.current_application_address,
+                fee=0,
+            ).submit()
+            asset_ids.append(arc4.UInt64(asset_create.created_asset.id))
+        self.pool_size += count
+        return asset_ids
+
+    @abimethod
+    def assign_credential(self, asset: Asset, student_address: Account, metadata_digest: Bytes32) -> None:
+        """
+        Issue a pre-minted credential: point its reserve at the metadata CID
+        digest and transfer it to the student, who must already be opted in
+        (e.g. earlier in the same group).
+        """
+        self._authorize_issuer(UInt64(1))
+        app_address = Global.current_application_address
+        assert asset.creator == app_address and asset.reserve == app_address, "Not a pooled credential"
+        assert arc4.UInt64(asset.id) not in self.credentials, "Credential already assigned"
+
+        itxn.AssetConfig(
+            config_asset=asset,
+            manager=app_address,
+            reserve=Account(metadata_digest.bytes),
+            fee=0,
+        ).submit()
+        itxn.AssetTransfer(
+            xfer_asset=asset,
+            asset_receiver=student_address,
+            asset_amount=1,
+            fee=0,
+        ).submit()
+        self.pool_size -= 1
+        self._register(asset.id, student_address, metadata_digest.copy())
+
+    @abimethod
+    def revoke_credentials(self, asset_ids: arc4.DynamicArray[arc4.UInt64]) -> None:
+        """
+        Revoke credentials by Asset ID. Each one costs a record update and a
+        single bit flip in its revocation page, regardless of how many exist.
+        """
+        assert Txn.sender == self.authorized_institution.value, "Only the authorized institution can revoke credentials"
+        assert asset_ids.length <= MAX_BATCH_SIZE, "Batch too large"
+        for asset_id in asset_ids:
+            assert asset_id in self.credentials, "Unknown credential"
+            record = self.credentials[asset_id].copy()
+            record.status = arc4.UInt8(STATUS_REVOKED)
+            self.credentials[asset_id] = record.copy()
+
+            serial = record.serial.as_uint64()
+            page = self.revocations.box(arc4.UInt64(serial // REVOCATION_PAGE_BITS))
+            page.create(size=UInt64(REVOCATION_PAGE_BYTES))
+            bit = serial % REVOCATION_PAGE_BITS
+            byte = page.extract(bit // 8, 1)
+            page.replace(bit // 8, op.setbit_bytes(byte, bit % 8, True))
+            arc4.emit(CredentialRevoked(asset_id, record.holder, record.document_hash.copy()))
+
+    @abimethod
+    def anchor_cohort(self, cohort_id: UInt64, merkle_root: Bytes32, leaf_count: UInt64) -> None:
+        """
+        Anchor the Merkle root of a whole cohort's certificates in one transaction.
+        Students prove membership off-chain with an inclusion proof against this root.
+        Anchors are write-once.
+        """
+        assert Txn.sender == self.authorized_institution.value, "Only the authorized institution can anchor cohorts"
+        assert leaf_count > 0, "Empty cohort"
+        key = arc4.UInt64(cohort_id)
+        assert key not in self.cohorts, "Cohort already anchored"
+        self.cohorts[key] = CohortAnchor(
+            merkle_root=merkle_root.copy(),
+            leaf_count=arc4.UInt64(leaf_count),
+            anchor_round=arc4.UInt64(Global.round),
+        )
+
+    @subroutine
+    def _issue(self, student_address: Account, credential_name: String, metadata_url: String) -> UInt64:
         # Mint the NFT using an inner transaction
         asset_create = itxn.AssetConfig(
             total=1,
@@ -33,14 +313,131 @@ class CredentialVerifier(ARC4Contract):
             url=metadata_url,
             manager=Global.current_application_address,  # Contract is the manager
             reserve=student_address, # Reserve is the student
+            fee=0,  # Paid by the outer call
         ).submit()
-        
-        return asset_create.created_asset.id
+        asset_id = asset_create.created_asset.id
+
+        # The box name depends on the new Asset ID, so callers populate box
+        # references by simulating first (algokit-utils does this by default)
+        self._register(asset_id, student_address, Bytes32.from_bytes(op.sha256(metadata_url.bytes)))
+        return asset_id
+
+    @subroutine
+    def _register(self, asset_id: UInt64, student_address: Account, document_hash: Bytes32) -> None:
+        holder = arc4.Address(student_address)
+        serial = arc4.UInt64(self.next_serial)
+        self.credentials[arc4.UInt64(asset_id)] = CredentialRecord(
+            holder=holder,
+            document_hash=document_hash.copy(),
+            issue_round=arc4.UInt64(Global.round),
+            status=arc4.UInt8(STATUS_ACTIVE),
+            serial=serial,
+        )
+        self.next_serial += 1
+        self._index_student_credential(student_address, asset_id)
+        # Indexers and the block follower pick issuance up from this one log
+        # entry; the serial lets them check the revocation bitmap without
+        # reading the record box
+        arc4.emit(CredentialIssued(arc4.UInt64(asset_id), holder, document_hash.copy(), serial))
+
+    @subroutine
+    def _index_student_credential(self, student_address: Account, asset_id: UInt64) -> None:
+        """Append an Asset ID to the student's last index page, opening a new page when it is full"""
+        first_page = self.student_pages.box(student_address.bytes + op.itob(0))
+        if not first_page:
+            # A student's first credential: the count header and one ID
+            first_page.value = op.itob(1) + op.itob(asset_id)
+            return
+        count = op.btoi(first_page.extract(0, STUDENT_INDEX_HEADER_BYTES))
+        offset = (count % STUDENT_PAGE_IDS) * 8
+        if count < STUDENT_PAGE_IDS:
+            offset += STUDENT_INDEX_HEADER_BYTES
+            first_page.resize(offset + 8)
+            first_page.replace(offset, op.itob(asset_id))
+        else:
+            page = self.student_pages.box(student_address.bytes + op.itob(count // STUDENT_PAGE_IDS))
+            if offset == 0:
+                page.create(size=UInt64(8))
+            else:
+                page.resize(offset + 8)
+            page.replace(offset, op.itob(asset_id))
+        first_page.replace(0, op.itob(count + 1))
 
     @abimethod(readonly=True)
     def verify_credential(self, asset_id: UInt64) -> String:
-        """Verify if a credential is valid (dummy for now)"""
-        return String("Verified")
+        """Verify a credential with a single registry box read"""
+        key = arc4.UInt64(asset_id)
+        if key not in self.credentials:
+            return String("Not Found")
+        if self.credentials[key].status.as_uint64() == STATUS_ACTIVE:
+            return String("Verified")
+        return String("Invalid")
+
+    @abimethod(readonly=True)
+    def verify_credentials(
+        self, asset_ids: arc4.DynamicArray[arc4.UInt64]
+    ) -> arc4.DynamicArray[CredentialCheck]:
+        """
+        Verify many credentials in one call, meant to be run through simulate.
+        A credential is valid when its registry record is active and the asset
+        is a CERT created by this app. Unknown IDs cost one box lookup and no
+        asset reference.
+        """
+        checks = arc4.DynamicArray[CredentialCheck]()
+        for asset_id in asset_ids:
+            valid = False
+            holder = arc4.Address()
+            if asset_id in self.credentials:
+                record = self.credentials[asset_id].copy()
+                holder = record.holder
+                asset = Asset(asset_id.as_uint64())
+                valid = (
+                    record.status.as_uint64() == STATUS_ACTIVE
+                    and asset.creator == Global.current_application_address
+                    and asset.unit_name == b"CERT"
+                )
+            checks.append(CredentialCheck(asset_id=asset_id, valid=arc4.Bool(valid), holder=holder))
+        return checks
+
+    @abimethod(readonly=True)
+    def get_credential(self, asset_id: UInt64) -> CredentialRecord:
+        """Return the full registry record for a credential"""
+        key = arc4.UInt64(asset_id)
+        assert key in self.credentials, "Unknown credential"
+        return self.credentials[key].copy()
+
+    @abimethod(readonly=True)
+    def list_credentials(self, student_address: Account, page: UInt64) -> StudentCredentials:
+        """
+        Return one page of the Asset IDs issued to a student, oldest first, and
+        their total count; pages past the end are empty.
+        """
+        total = UInt64(0)
+        first_key = student_address.bytes + op.itob(0)
+        if first_key in self.student_pages:
+            total = op.btoi(self.student_pages[first_key][:STUDENT_INDEX_HEADER_BYTES])
+        ids = Bytes()
+        key = student_address.bytes + op.itob(page)
+        if key in self.student_pages:
+            ids = self.student_pages[key]
+            if page == 0:
+                ids = ids[STUDENT_INDEX_HEADER_BYTES:]
+        # A page is already the packed body of a uint64[]; only the length prefix is missing
+        asset_ids = arc4.DynamicArray[arc4.UInt64].from_bytes(arc4.UInt16(ids.length // 8).bytes + ids)
+        return StudentCredentials(total=arc4.UInt64(total), asset_ids=asset_ids.copy())
+
+    @abimethod(readonly=True)
+    def get_delegate(self, delegate: Account) -> IssuerDelegate:
+        """Return a delegate's quota and how many credentials it has issued"""
+        assert delegate in self.delegates, "Unknown delegate"
+        return self.delegates[delegate].copy()
+
+    @abimethod(readonly=True)
+    def get_cohort(self, cohort_id: UInt64) -> CohortAnchor:
+        """Return the anchored Merkle root of a cohort"""
+        key = arc4.UInt64(cohort_id)
+        assert key in self.cohorts, "Unknown cohort"
+        return self.cohorts[key].copy()
 
     @abimethod(readonly=True)
     def get_contract_info(self) -> String:
@@ -0,0 +1,183 @@
+"""
+Line-level AVM profiler for CredentialVerifier.
+
+Runs one ABI method through simulate with execution tracing enabled, maps
+every executed program counter back to `contract.py` through the
+`*.approval.puya.map` source map written by the build, and prints a per-line
+heatmap of executed opcodes and the budget they consumed.
+
+Usage (needs a running LocalNet: `algokit localnet start`):
+
+    python -m smart_contracts.profiler issue_credential '["<address>", "BSc", "ipfs://cid"]'
+"""
+import json
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ARTIFACT_DIR = Path(__file__).parent / "artifacts" / "credential_verifier"
+SOURCE_MAP_PATH = ARTIFACT_DIR / "CredentialVerifier.approval.puya.map"
+
+# Opcodes costing more than 1 unit of budget (AVM v10); everything else costs 1
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "sumhash512": 150,
+    "mimc": 10,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "bsqrt": 40,
+}
+
+_BASE64 = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")}
+
+
+def _decode_vlq(segment: str) -> list[int]:
+    values, value, shift = [], 0, 0
+    for char in segment:
+        digit = _BASE64[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value, shift = 0, 0
+    return values
+
+
+@dataclass
+class SourceMap:
+    """Program counter -> (source file, 1-based line) plus the opcode at each PC"""
+    sources: list[Path]
+    lines: dict[int, tuple[int, int]]
+    ops: dict[int, str]
+
+    @classmethod
+    def load(cls, path: Path = SOURCE_MAP_PATH) -> "SourceMap":
+        with open(path) as f:
+            raw = json.load(f)
+        sources = [(path.parent / source).resolve() for source in raw["sources"]]
+        offset = raw.get("op_pc_offset", 0)
+
+        # Each ';'-separated group is one PC; source index/line deltas run across the whole map
+        lines = {}
+        source_index = source_line = source_column = 0
+        for pc, group in enumerate(raw["mappings"].split(";")):
+            for segment in filter(None, group.split(",")):
+                fields = _decode_vlq(segment)
+                if len(fields) >= 4:
+                    source_index += fields[1]
+                    source_line += fields[2]
+                    source_column += fields[3]
+                    lines.setdefault(pc + offset, (source_index, source_line + 1))
+
+        ops = {int(pc): event["op"].split()[0] for pc, event in raw.get("pc_events", {}).items() if "op" in event}
+        return cls(sources, lines, ops)
+
+    def cost(self, pc: int) -> int:
+        return OPCODE_COSTS.get(self.ops.get(pc, ""), 1)
+
+
+@dataclass
+class LineProfile:
+    """Executed opcodes and budget per source line"""
+    opcodes: Counter = field(default_factory=Counter)
+    budget: Counter = field(default_factory=Counter)
+    unmapped: int = 0
+
+    @property
+    def total_budget(self) -> int:
+        return sum(self.budget.values())
+
+
+def profile_trace(pcs: list[int], source_map: SourceMap) -> LineProfile:
+    """Attribute every executed PC to its source line"""
+    profile = LineProfile()
+    for pc in pcs:
+        location = source_map.lines.get(pc)
+        if location is None:
+            profile.unmapped += 1
+            continue
+        profile.opcodes[location] += 1
+        profile.budget[location] += source_map.cost(pc)
+    return profile
+
+
+def approval_pcs(simulate_response: dict, txn_index: int = 0) -> list[int]:
+    """Executed PCs of one top-level app call's approval program from a simulate response"""
+    result = simulate_response["txn-groups"][0]["txn-results"][txn_index]
+    return [step["pc"] for step in result.get("exec-trace", {}).get("approval-program-trace", [])]
+
+
+def render_heatmap(profile: LineProfile, source_map: SourceMap, width: int = 30) -> str:
+    """Annotated listing of every source line that executed, hottest shown with the longest bar"""
+    hottest = max(profile.budget.values(), default=1)
+    out = [f"{'ops':>6} {'budget':>7}  {'':<{width}}  source"]
+    for source_index, source in enumerate(source_map.sources):
+        text = source.read_text().splitlines() if source.exists() else []
+        for line_number in sorted(line for index, line in profile.budget if index == source_index):
+            key = (source_index, line_number)
+            bar = "█" * max(1, round(width * profile.budget[key] / hottest))
+            code = text[line_number - 1].strip() if line_number <= len(text) else ""
+            out.append(
+                f"{profile.opcodes[key]:>6} {profile.budget[key]:>7}  {bar:<{width}}  "
+                f"{source.name}:{line_number}  {code}"
+            )
+    out.append(f"{sum(profile.opcodes.values()):>6} {profile.total_budget:>7}  total ({profile.unmapped} ops unmapped)")
+    return "\n".join(out)
+
+
+def simulate_method(method: str, args: list) -> dict:
+    """Deploy a fresh app on LocalNet and simulate `method` with execution tracing"""
+    import algokit_utils
+    from algosdk.v2client.models import SimulateTraceConfig
+
+    from smart_contracts.artifacts.credential_verifier.credential_verifier_client import (
+        CreateArgs,
+        CredentialVerifierFactory,
+    )
+
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    deployer = algorand.account.localnet_dispenser()
+    factory = algorand.client.get_typed_app_factory(CredentialVerifierFactory, default_sender=deployer.address)
+    client, _ = factory.send.create.create(CreateArgs(institution=deployer.address))
+    algorand.send.payment(algokit_utils.PaymentParams(
+        sender=deployer.address,
+        receiver=client.app_address,
+        amount=algokit_utils.AlgoAmount.from_algo(10),
+    ))
+
+    composer = algorand.new_group().add_app_call_method_call(client.app_client.params.call(
+        algokit_utils.AppClientMethodCallParams(
+            method=method,
+            args=args,
+            # Covers the inner transactions, which are sent with a zero fee
+            extra_fee=algokit_utils.AlgoAmount.from_micro_algo(16_000),
+        )
+    ))
+    result = composer.simulate(
+        allow_unnamed_resources=True,
+        exec_trace_config=SimulateTraceConfig(enable=True),
+    )
+    return result.simulate_response
+
+
+if __name__ == "__main__":
+    method_name = sys.argv[1] if len(sys.argv) > 1 else "get_contract_info"
+    method_args = json.loads(sys.argv[2]) if len(sys.argv) > 2 else []
+    source_map = SourceMap.load()
+    response = simulate_method(method_name, method_args)
+    print(render_heatmap(profile_trace(approval_pcs(response), source_map), source_map))
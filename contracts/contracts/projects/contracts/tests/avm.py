@@ -0,0 +1,560 @@
+"""
+Minimal AVM interpreter for the compiled CredentialVerifier approval program.
+
+Runs the TEAL listing written by the build, one top-level app call at a
+time, against an in-memory ledger, and counts the opcode budget every
+executed instruction consumes (costs from smart_contracts.profiler). Only
+the opcodes and fields the contract uses are implemented; anything else
+raises NotImplementedError, so a contract change that needs more fails
+loudly instead of being miscounted.
+
+Inner transactions are recorded rather than executed: asset creations get
+a fresh asset ID and reconfigurations update the asset's params. Inner
+application calls (OpUp) add their budget to the pool but their own
+programs are not run.
+"""
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from algosdk.encoding import decode_address
+from algosdk.logic import get_application_address
+
+from smart_contracts.profiler import ARTIFACT_DIR, OPCODE_COSTS
+
+APPROVAL_PATH = ARTIFACT_DIR / "CredentialVerifier.approval.teal"
+APP_CALL_BUDGET = 700
+MAX_UINT64 = 2**64 - 1
+MAX_BYTES = 4096
+MIN_TXN_FEE = 1_000
+
+TYPE_ACFG = 3
+TYPE_AXFER = 4
+TYPE_APPL = 6
+
+# asset_params_get field -> the itxn_field that sets it on creation
+ASSET_PARAM_FIELDS = {
+    "AssetCreator": None,
+    "AssetName": "ConfigAssetName",
+    "AssetUnitName": "ConfigAssetUnitName",
+    "AssetURL": "ConfigAssetURL",
+    "AssetManager": "ConfigAssetManager",
+    "AssetReserve": "ConfigAssetReserve",
+    "AssetTotal": "ConfigAssetTotal",
+    "AssetDecimals": "ConfigAssetDecimals",
+}
+BYTES_ASSET_PARAMS = {"AssetCreator", "AssetName", "AssetUnitName", "AssetURL", "AssetManager", "AssetReserve"}
+
+
+class AVMError(Exception):
+    """The program failed (err, a failed assert, an overflow, ...)"""
+
+
+@dataclass
+class Instruction:
+    op: str
+    args: list[str]
+    line: int
+
+
+def _tokens(line: str) -> list[str]:
+    """Split one TEAL line into tokens, keeping quoted strings whole and dropping comments"""
+    tokens, i = [], 0
+    while i < len(line):
+        char = line[i]
+        if char.isspace():
+            i += 1
+        elif line.startswith("//", i):
+            break
+        elif char == '"':
+            end = i + 1
+            while line[end] != '"':
+                end += 2 if line[end] == "\\" else 1
+            tokens.append(line[i:end + 1])
+            i = end + 1
+        else:
+            end = i
+            while end < len(line) and not line[end].isspace():
+                end += 1
+            tokens.append(line[i:end])
+            i = end
+    return tokens
+
+
+def parse_bytes(token: str) -> bytes:
+    if token.startswith("0x"):
+        return bytes.fromhex(token[2:])
+    if token.startswith('"'):
+        return token[1:-1].encode().decode("unicode_escape").encode("latin-1")
+    raise NotImplementedError(f"byte constant {token}")
+
+
+def parse_int(token: str) -> int:
+    return int(token, 0)
+
+
+def parse_program(text: str) -> tuple[list[Instruction], dict[str, int]]:
+    program, labels = [], {}
+    for number, line in enumerate(text.splitlines(), start=1):
+        tokens = _tokens(line)
+        if not tokens or tokens[0].startswith("#pragma"):
+            continue
+        if len(tokens) == 1 and tokens[0].endswith(":"):
+            labels[tokens[0][:-1]] = len(program)
+            continue
+        program.append(Instruction(tokens[0], tokens[1:], number))
+    return program, labels
+
+
+@dataclass
+class Ledger:
+    """State the app reads and writes: its globals, boxes and the assets it created"""
+    round: int = 1_000
+    global_state: dict[bytes, int | bytes] = field(default_factory=dict)
+    boxes: dict[bytes, bytearray] = field(default_factory=dict)
+    assets: dict[int, dict[str, int | bytes]] = field(default_factory=dict)
+    next_id: int = 1_001
+
+
+@dataclass
+class Execution:
+    """Outcome of one app call"""
+    cost: int
+    logs: list[bytes]
+    inner_txns: list[dict[str, int | bytes]]
+
+    @property
+    def return_value(self) -> bytes:
+        return self.logs[-1][4:]
+
+
+class ApprovalProgram:
+    def __init__(self, path: Path = APPROVAL_PATH):
+        self.program, self.labels = parse_program(path.read_text())
+
+    def call(self, ledger: Ledger, app_id: int, sender: str, args: list[bytes]) -> Execution:
+        """Run one NoOp app call (a create when `app_id` is 0, which then uses `ledger.next_id`)"""
+        return _Run(self, ledger, app_id, sender, args).execute()
+
+
+class _Run:
+    def __init__(self, program: ApprovalProgram, ledger: Ledger, app_id: int, sender: str, args: list[bytes]):
+        self.program = program
+        self.ledger = ledger
+        self.app_id = app_id
+        self.current_app_id = app_id or ledger.next_id
+        self.sender = decode_address(sender)
+        self.args = args
+        self.stack: list[int | bytes] = []
+        self.frames: list[dict] = []
+        self.intc: list[int] = []
+        self.bytec: list[bytes] = []
+        self.cost = 0
+        self.budget = APP_CALL_BUDGET
+        self.logs: list[bytes] = []
+        self.inner_txns: list[dict] = []
+        self.pending: dict | None = None
+        self.last_inner: dict | None = None
+
+    # ------------------------------ Stack ------------------------------ #
+
+    def pop(self) -> int | bytes:
+        if not self.stack:
+            raise AVMError("stack underflow")
+        return self.stack.pop()
+
+    def pop_int(self) -> int:
+        value = self.pop()
+        if not isinstance(value, int):
+            raise AVMError(f"expected uint64, got bytes {value!r}")
+        return value
+
+    def pop_bytes(self) -> bytes:
+        value = self.pop()
+        if not isinstance(value, bytes):
+            raise AVMError(f"expected bytes, got uint64 {value}")
+        return value
+
+    def push(self, value: int | bytes) -> None:
+        if isinstance(value, int) and not 0 <= value <= MAX_UINT64:
+            raise AVMError(f"uint64 overflow: {value}")
+        if isinstance(value, bytes) and len(value) > MAX_BYTES:
+            raise AVMError("byte value longer than 4096")
+        self.stack.append(value)
+
+    # ------------------------------ Fields ----------------------------- #
+
+    def txn_field(self, name: str, index: str | None = None) -> int | bytes:
+        if name == "ApplicationID":
+            return self.app_id
+        if name == "OnCompletion":
+            return 0
+        if name == "Sender":
+            return self.sender
+        if name == "NumAppArgs":
+            return len(self.args)
+        if name == "ApplicationArgs":
+            return self.args[int(index)]
+        raise NotImplementedError(f"txn {name}")
+
+    def global_field(self, name: str) -> int | bytes:
+        if name == "CurrentApplicationAddress":
+            return decode_address(get_application_address(self.current_app_id))
+        if name == "CurrentApplicationID":
+            return self.current_app_id
+        if name == "Round":
+            return self.ledger.round
+        if name == "ZeroAddress":
+            return bytes(32)
+        if name == "MinTxnFee":
+            return MIN_TXN_FEE
+        if name == "OpcodeBudget":
+            return self.budget - self.cost
+        raise NotImplementedError(f"global {name}")
+
+    def submit_inner(self) -> None:
+        txn = self.pending
+        kind = txn.get("TypeEnum")
+        if kind == TYPE_ACFG and not txn.get("ConfigAsset"):
+            txn["CreatedAssetID"] = asset_id = self.ledger.next_id
+            self.ledger.next_id += 1
+            app_address = self.global_field("CurrentApplicationAddress")
+            params = {"AssetCreator": app_address}
+            for param, setter in ASSET_PARAM_FIELDS.items():
+                if setter is not None:
+                    params[param] = txn.get(setter, b"" if param in BYTES_ASSET_PARAMS else 0)
+            self.ledger.assets[asset_id] = params
+        elif kind == TYPE_ACFG:
+            params = self.ledger.assets[txn["ConfigAsset"]]
+            params["AssetManager"] = txn.get("ConfigAssetManager", bytes(32))
+            params["AssetReserve"] = txn.get("ConfigAssetReserve", bytes(32))
+        elif kind == TYPE_APPL:
+            self.budget += APP_CALL_BUDGET
+        elif kind != TYPE_AXFER:
+            raise NotImplementedError(f"inner transaction type {kind}")
+        self.inner_txns.append(txn)
+        self.last_inner = txn
+        self.pending = None
+
+    # ----------------------------- Execution ---------------------------- #
+
+    def jump(self, label: str) -> int:
+        return self.program.labels[label]
+
+    def execute(self) -> Execution:
+        program = self.program.program
+        pc = 0
+        while True:
+            if pc >= len(program):
+                raise AVMError("program ended without return")
+            instruction = program[pc]
+            self.cost += OPCODE_COSTS.get(instruction.op, 1)
+            if self.cost > self.budget:
+                raise AVMError(f"dynamic cost budget exceeded at line {instruction.line}")
+            try:
+                next_pc = self.step(instruction, pc)
+            except AVMError as e:
+                raise AVMError(f"line {instruction.line} ({instruction.op}): {e}") from e
+            if next_pc is None:
+                break
+            pc = next_pc
+        if not self.app_id:
+            self.ledger.next_id += 1
+        return Execution(self.cost, self.logs, self.inner_txns)
+
+    def step(self, instruction: Instruction, pc: int) -> int | None:
+        op, args = instruction.op, instruction.args
+        next_pc = pc + 1
+
+        # Constants
+        if op == "intcblock":
+            self.intc = [parse_int(a) for a in args]
+        elif op == "bytecblock":
+            self.bytec = [parse_bytes(a) for a in args]
+        elif op.startswith("intc"):
+            self.push(self.intc[int(op[5:] if op.startswith("intc_") else args[0])])
+        elif op.startswith("bytec"):
+            self.push(self.bytec[int(op[6:] if op.startswith("bytec_") else args[0])])
+        elif op == "pushint":
+            self.push(parse_int(args[0]))
+        elif op == "pushints":
+            for a in args:
+                self.push(parse_int(a))
+        elif op == "pushbytes":
+            self.push(parse_bytes(args[0]))
+        elif op == "pushbytess":
+            for a in args:
+                self.push(parse_bytes(a))
+
+        # Transaction and global fields
+        elif op == "txn":
+            self.push(self.txn_field(args[0]))
+        elif op == "txna":
+            self.push(self.txn_field(args[0], args[1]))
+        elif op == "global":
+            self.push(self.global_field(args[0]))
+
+        # Flow control
+        elif op == "b":
+            next_pc = self.jump(args[0])
+        elif op == "bz":
+            if self.pop_int() == 0:
+                next_pc = self.jump(args[0])
+        elif op == "bnz":
+            if self.pop_int() != 0:
+                next_pc = self.jump(args[0])
+        elif op == "match":
+            value = self.pop()
+            candidates = [self.pop() for _ in args][::-1]
+            if value in candidates:
+                next_pc = self.jump(args[candidates.index(value)])
+        elif op == "switch":
+            index = self.pop_int()
+            if index < len(args):
+                next_pc = self.jump(args[index])
+        elif op == "callsub":
+            self.frames.append({"return": next_pc, "base": len(self.stack), "args": 0, "returns": 0})
+            next_pc = self.jump(args[0])
+        elif op == "proto":
+            frame = self.frames[-1]
+            frame["args"], frame["returns"] = int(args[0]), int(args[1])
+        elif op == "retsub":
+            frame = self.frames.pop()
+            results = self.stack[len(self.stack) - frame["returns"]:] if frame["returns"] else []
+            del self.stack[frame["base"] - frame["args"]:]
+            self.stack.extend(results)
+            next_pc = frame["return"]
+        elif op == "frame_dig":
+            self.push(self.stack[self.frames[-1]["base"] + int(args[0])])
+        elif op == "frame_bury":
+            value = self.pop()
+            self.stack[self.frames[-1]["base"] + int(args[0])] = value
+        elif op == "err":
+            raise AVMError("err")
+        elif op == "assert":
+            if self.pop_int() == 0:
+                raise AVMError("assert failed")
+        elif op == "return":
+            if self.pop_int() == 0:
+                raise AVMError("rejected")
+            return None
+
+        # Stack manipulation
+        elif op == "pop":
+            self.pop()
+        elif op == "dup":
+            self.push(self.stack[-1])
+        elif op == "dup2":
+            self.stack.extend(self.stack[-2:])
+        elif op == "dupn":
+            self.stack.extend([self.stack[-1]] * int(args[0]))
+        elif op == "dig":
+            self.push(self.stack[-1 - int(args[0])])
+        elif op == "bury":
+            value = self.pop()
+            self.stack[-int(args[0])] = value
+        elif op == "cover":
+            value = self.pop()
+            self.stack.insert(len(self.stack) - int(args[0]), value)
+        elif op == "uncover":
+            self.push(self.stack.pop(-1 - int(args[0])))
+        elif op == "swap":
+            self.stack[-2], self.stack[-1] = self.stack[-1], self.stack[-2]
+
+        # Arithmetic
+        elif op in ("+", "-", "*", "/", "%", "==", "!=", "<", "<=", ">", ">=", "&&", "||"):
+            b = self.pop()
+            a = self.pop()
+            self.push(_binary(op, a, b))
+        elif op == "!":
+            self.push(int(self.pop_int() == 0))
+
+        # Bytes
+        elif op == "concat":
+            b = self.pop_bytes()
+            self.push(self.pop_bytes() + b)
+        elif op == "len":
+            self.push(len(self.pop_bytes()))
+        elif op == "itob":
+            self.push(self.pop_int().to_bytes(8, "big"))
+        elif op == "btoi":
+            value = self.pop_bytes()
+            if len(value) > 8:
+                raise AVMError("btoi of more than 8 bytes")
+            self.push(int.from_bytes(value, "big"))
+        elif op == "extract":
+            value = self.pop_bytes()
+            start, length = int(args[0]), int(args[1])
+            self.push(_slice(value, start, start + length if length else len(value)))
+        elif op == "extract3":
+            length = self.pop_int()
+            start = self.pop_int()
+            self.push(_slice(self.pop_bytes(), start, start + length))
+        elif op == "substring3":
+            end = self.pop_int()
+            start = self.pop_int()
+            self.push(_slice(self.pop_bytes(), start, end))
+        elif op in ("extract_uint16", "extract_uint32", "extract_uint64"):
+            start = self.pop_int()
+            width = int(op[len("extract_uint"):]) // 8
+            self.push(int.from_bytes(_slice(self.pop_bytes(), start, start + width), "big"))
+        elif op == "replace2":
+            replacement = self.pop_bytes()
+            self.push(_replace(self.pop_bytes(), int(args[0]), replacement))
+        elif op == "replace3":
+            replacement = self.pop_bytes()
+            start = self.pop_int()
+            self.push(_replace(self.pop_bytes(), start, replacement))
+        elif op == "getbyte":
+            index = self.pop_int()
+            self.push(_slice(self.pop_bytes(), index, index + 1)[0])
+        elif op == "setbit":
+            bit = self.pop_int()
+            index = self.pop_int()
+            self.push(_setbit(self.pop(), index, bit))
+        elif op == "bitlen":
+            value = self.pop()
+            self.push((value if isinstance(value, int) else int.from_bytes(value, "big")).bit_length())
+        elif op == "sha256":
+            self.push(hashlib.sha256(self.pop_bytes()).digest())
+        elif op == "log":
+            self.logs.append(self.pop_bytes())
+
+        # State
+        elif op == "app_global_get_ex":
+            key = self.pop_bytes()
+            self.pop_int()
+            value = self.ledger.global_state.get(key)
+            self.push(0 if value is None else value)
+            self.push(int(value is not None))
+        elif op == "app_global_put":
+            value = self.pop()
+            self.ledger.global_state[self.pop_bytes()] = value
+        elif op.startswith("box_"):
+            self.box_op(op)
+        elif op == "asset_params_get":
+            asset = self.ledger.assets.get(self.pop_int())
+            if asset is None:
+                self.push(b"" if args[0] in BYTES_ASSET_PARAMS else 0)
+                self.push(0)
+            else:
+                self.push(asset[args[0]])
+                self.push(1)
+
+        # Inner transactions
+        elif op == "itxn_begin":
+            self.pending = {}
+        elif op == "itxn_field":
+            self.pending[args[0]] = self.pop()
+        elif op == "itxn_submit":
+            self.submit_inner()
+        elif op == "itxn":
+            self.push(self.last_inner[args[0]])
+        else:
+            raise NotImplementedError(f"opcode {op}")
+        return next_pc
+
+    def box_op(self, op: str) -> None:
+        boxes = self.ledger.boxes
+        if op == "box_create":
+            size = self.pop_int()
+            name = self.pop_bytes()
+            if name in boxes:
+                if len(boxes[name]) != size:
+                    raise AVMError("box_create with a different size")
+                self.push(0)
+            else:
+                boxes[name] = bytearray(size)
+                self.push(1)
+        elif op == "box_len":
+            box = boxes.get(self.pop_bytes())
+            self.push(0 if box is None else len(box))
+            self.push(int(box is not None))
+        elif op == "box_get":
+            box = boxes.get(self.pop_bytes())
+            self.push(b"" if box is None else bytes(box))
+            self.push(int(box is not None))
+        elif op == "box_put":
+            value = self.pop_bytes()
+            name = self.pop_bytes()
+            if name in boxes and len(boxes[name]) != len(value):
+                raise AVMError("box_put with a different size")
+            boxes[name] = bytearray(value)
+        elif op == "box_replace":
+            value = self.pop_bytes()
+            start = self.pop_int()
+            box = self._box(self.pop_bytes())
+            if start + len(value) > len(box):
+                raise AVMError("box_replace past the end of the box")
+            box[start:start + len(value)] = value
+        elif op == "box_extract":
+            length = self.pop_int()
+            start = self.pop_int()
+            self.push(_slice(bytes(self._box(self.pop_bytes())), start, start + length))
+        elif op == "box_resize":
+            size = self.pop_int()
+            box = self._box(self.pop_bytes())
+            del box[size:]
+            box.extend(bytes(size - len(box)))
+        elif op == "box_del":
+            self.push(int(boxes.pop(self.pop_bytes(), None) is not None))
+        else:
+            raise NotImplementedError(f"opcode {op}")
+
+    def _box(self, name: bytes) -> bytearray:
+        if name not in self.ledger.boxes:
+            raise AVMError(f"no box {name!r}")
+        return self.ledger.boxes[name]
+
+
+def _binary(op: str, a: int, b: int) -> int:
+    if op in ("==", "!="):
+        if type(a) is not type(b):
+            raise AVMError(f"{op} of mismatched types")
+        return int((a == b) == (op == "=="))
+    if not (isinstance(a, int) and isinstance(b, int)):
+        raise AVMError(f"{op} of bytes")
+    if op in ("/", "%") and b == 0:
+        raise AVMError("division by zero")
+    if op == "-" and b > a:
+        raise AVMError("- would result negative")
+    return {
+        "+": lambda: a + b,
+        "-": lambda: a - b,
+        "*": lambda: a * b,
+        "/": lambda: a // b,
+        "%": lambda: a % b,
+        "<": lambda: int(a < b),
+        "<=": lambda: int(a <= b),
+        ">": lambda: int(a > b),
+        ">=": lambda: int(a >= b),
+        "&&": lambda: int(bool(a and b)),
+        "||": lambda: int(bool(a or b)),
+    }[op]()
+
+
+def _slice(value: bytes, start: int, end: int) -> bytes:
+    if start > end or end > len(value):
+        raise AVMError(f"range {start}:{end} outside {len(value)} bytes")
+    return value[start:end]
+
+
+def _replace(value: bytes, start: int, replacement: bytes) -> bytes:
+    if start + len(replacement) > len(value):
+        raise AVMError("replacement past the end")
+    return value[:start] + replacement + value[start + len(replacement):]
+
+
+def _setbit(target: int | bytes, index: int, bit: int) -> int | bytes:
+    if bit > 1:
+        raise AVMError("setbit value > 1")
+    if isinstance(target, int):
+        if index > 63:
+            raise AVMError("setbit index > 63 with uint64")
+        return target | (1 << index) if bit else target & ~(1 << index)
+    if index // 8 >= len(target):
+        raise AVMError("setbit index beyond byte array")
+    data = bytearray(target)
+    mask = 0x80 >> (index % 8)
+    data[index // 8] = data[index // 8] | mask if bit else data[index // 8] & ~mask
+    return bytes(data)
@@ -0,0 +1,252 @@
+"""
+Cost benchmarks for the CredentialVerifier ABI methods.
+
+`measure()` runs every method under algorand-python-testing and records, per
+case, the inner transactions submitted, the fee the outer call has to cover
+(read from the fees the inner transactions actually carry), the
+minimum-balance increase it causes and the bytes it logs. Opcode cost comes
+from `interpret()`, which runs the same cases through the compiled approval
+program in tests/avm.py; with a LocalNet (`BENCHMARK_LOCALNET=1`)
+`simulate_opcode_costs()` measures it on a real AVM instead.
+
+Results are compared against `benchmark_baseline.json`; any metric above its
+baseline is a regression, and so is a metric missing on either side. After
+an intended change, rewrite the baseline with
+
+    python -m tests.benchmarks --update [--localnet]
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+
+# Protocol constants (microAlgos)
+MIN_FEE = 1_000
+ASSET_MIN_BALANCE = 100_000
+APP_PAGE_MIN_BALANCE = 100_000
+GLOBAL_UINT_MIN_BALANCE = 28_500
+GLOBAL_BYTES_MIN_BALANCE = 50_000
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+
+# ASA names are capped at 32 bytes and URLs at 96
+NAME_LENGTHS = (1, 16, 32)
+URL_LENGTHS = (1, 48, 96)
+
+METRICS = ("inner_txns", "fee", "mbr_delta", "log_bytes", "opcode_cost")
+
+
+def issue_case(name_length: int, url_length: int) -> str:
+    return f"issue_credential[name={name_length},url={url_length}]"
+
+
+def _box_min_balance(key: bytes, value: bytes) -> int:
+    return BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * (len(key) + len(value))
+
+
+def _call_costs(txn, itxn_groups: list, mbr_delta: int) -> dict:
+    itxns = [itxn for group in itxn_groups for itxn in group]
+    return {
+        "inner_txns": len(itxns),
+        # Fee pooling: the outer call covers whatever its inner transactions don't pay themselves
+        "fee": MIN_FEE + sum(max(0, MIN_FEE - int(itxn.fee)) for itxn in itxns),
+        "mbr_delta": mbr_delta,
+        "log_bytes": sum(len(bytes(txn.logs(i))) for i in range(txn.num_logs)),
+    }
+
+
+def measure() -> dict[str, dict]:
+    """Per-case cost of every ABI method, measured with algorand-python-testing"""
+    import algopy
+    from algopy_testing import algopy_testing_context
+
+    from smart_contracts.credential_verifier.contract import CredentialVerifier
+
+    results = {}
+    with algopy_testing_context() as context:
+        institution = context.any.account()
+
+        def call(method, *args):
+            with context.txn.create_group(active_txn_overrides={"sender": institution}):
+                value = method(*args)
+            return value, context.txn.last_active, context.txn.last_group.itxn_groups
+
+        contract = CredentialVerifier()
+        _, txn, itxns = call(contract.create, institution)
+        app = context.ledger.get_app(contract)
+        schema = (
+            APP_PAGE_MIN_BALANCE * (1 + int(app.extra_program_pages))
+            + GLOBAL_UINT_MIN_BALANCE * int(app.global_num_uint)
+            + GLOBAL_BYTES_MIN_BALANCE * int(app.global_num_bytes)
+        )
+        results["create"] = _call_costs(txn, itxns, schema)
+
+        for name_length in NAME_LENGTHS:
+            for url_length in URL_LENGTHS:
+                student = context.any.account()
+                asset_id, txn, itxns = call(
+                    contract.issue_credential,
+                    student,
+                    algopy.String("n" * name_length),
+                    algopy.String("u" * url_length),
+                )
+                # Registry record plus the student's first credential index page
+                keys = [
+                    b"c" + int(asset_id).to_bytes(8, "big"),
+                    b"i" + student.bytes.value + (0).to_bytes(8, "big"),
+                ]
+                created = sum(1 for group in itxns for itxn in group if int(itxn.created_asset.id))
+                mbr = ASSET_MIN_BALANCE * created + sum(
+                    _box_min_balance(key, bytes(context.ledger.get_box(contract, key))) for key in keys
+                )
+                results[issue_case(name_length, url_length)] = _call_costs(txn, itxns, mbr)
+
+        _, txn, itxns = call(contract.verify_credential, asset_id)
+        results["verify_credential[found]"] = _call_costs(txn, itxns, 0)
+        _, txn, itxns = call(contract.verify_credential, algopy.UInt64(2**63))
+        results["verify_credential[missing]"] = _call_costs(txn, itxns, 0)
+        _, txn, itxns = call(contract.get_contract_info)
+        results["get_contract_info"] = _call_costs(txn, itxns, 0)
+    return results
+
+
+def interpret() -> dict:
+    """Per-case execution of the compiled approval program (tests/avm.py), opcode cost included"""
+    from algosdk import abi, account
+
+    from tests.avm import ApprovalProgram, Ledger
+
+    program = ApprovalProgram()
+    ledger = Ledger()
+    institution = account.generate_account()[1]
+
+    def call(app_id: int, signature: str, *args):
+        method = abi.Method.from_signature(signature)
+        encoded = [arg.type.encode(value) for arg, value in zip(method.args, args)]
+        return program.call(ledger, app_id, institution, [method.get_selector(), *encoded])
+
+    app_id = ledger.next_id
+    executions = {"create": call(0, "create(address)void", institution)}
+    for name_length in NAME_LENGTHS:
+        for url_length in URL_LENGTHS:
+            # Each case issues a student's first credential, as simulate does
+            executions[issue_case(name_length, url_length)] = execution = call(
+                app_id,
+                "issue_credential(address,string,string)uint64",
+                account.generate_account()[1],
+                "n" * name_length,
+                "u" * url_length,
+            )
+    asset_id = int.from_bytes(execution.return_value, "big")
+    executions["verify_credential[found]"] = call(app_id, "verify_credential(uint64)string", asset_id)
+    executions["verify_credential[missing]"] = call(app_id, "verify_credential(uint64)string", 2**63)
+    executions["get_contract_info"] = call(app_id, "get_contract_info()string")
+    return executions
+
+
+def simulate_opcode_costs() -> dict[str, int]:
+    """Opcode budget consumed per case, from simulate on a LocalNet"""
+    import algokit_utils
+
+    from smart_contracts.artifacts.credential_verifier.credential_verifier_client import (
+        CreateArgs,
+        CredentialVerifierFactory,
+        IssueCredentialArgs,
+        VerifyCredentialArgs,
+    )
+
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    deployer = algorand.account.localnet_dispenser()
+    factory = algorand.client.get_typed_app_factory(CredentialVerifierFactory, default_sender=deployer.address)
+
+    def budget(composer) -> int:
+        response = composer.simulate(allow_unnamed_resources=True).simulate_response
+        return response["txn-groups"][0]["txn-results"][0]["app-budget-consumed"]
+
+    costs = {
+        "create": budget(algorand.new_group().add_app_create_method_call(
+            factory.params.create.create(CreateArgs(institution=deployer.address))
+        ))
+    }
+    client, _ = factory.send.create.create(CreateArgs(institution=deployer.address))
+    algorand.send.payment(algokit_utils.PaymentParams(
+        sender=deployer.address,
+        receiver=client.app_address,
+        amount=algokit_utils.AlgoAmount.from_algo(10),
+    ))
+
+    for name_length in NAME_LENGTHS:
+        for url_length in URL_LENGTHS:
+            args = IssueCredentialArgs(
+                student_address=deployer.address,
+                credential_name="n" * name_length,
+                metadata_url="u" * url_length,
+            )
+            costs[issue_case(name_length, url_length)] = budget(client.new_group().issue_credential(
+                args, params=algokit_utils.CommonAppCallParams(static_fee=algokit_utils.AlgoAmount.from_micro_algo(2 * MIN_FEE))
+            ))
+
+    asset_id = client.send.issue_credential(args, params=algokit_utils.CommonAppCallParams(
+        static_fee=algokit_utils.AlgoAmount.from_micro_algo(2 * MIN_FEE)
+    ), send_params=algokit_utils.SendParams(populate_app_call_resources=True)).abi_return
+    costs["verify_credential[found]"] = budget(client.new_group().verify_credential(VerifyCredentialArgs(asset_id=asset_id)))
+    costs["verify_credential[missing]"] = budget(client.new_group().verify_credential(VerifyCredentialArgs(asset_id=2**63)))
+    costs["get_contract_info"] = budget(client.new_group().get_contract_info())
+    return costs
+
+
+def collect(localnet: bool = False) -> dict[str, dict]:
+    results = measure()
+    costs = simulate_opcode_costs() if localnet else {case: e.cost for case, e in interpret().items()}
+    for case, cost in costs.items():
+        results[case]["opcode_cost"] = cost
+    return results
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, dict]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def regressions(
+    results: dict[str, dict], baseline: dict[str, dict], metrics: tuple[str, ...] = METRICS
+) -> list[str]:
+    """Every one of `metrics` that got worse than its baseline, or is missing from the results or the baseline"""
+    problems = []
+    for case, costs in sorted(results.items()):
+        expected = baseline.get(case)
+        if expected is None:
+            problems.append(f"{case}: no baseline, rerun with --update")
+            continue
+        for metric in metrics:
+            if metric not in costs:
+                problems.append(f"{case}: {metric} not measured")
+            elif metric not in expected:
+                problems.append(f"{case}: {metric} has no baseline, rerun with --update")
+            elif costs[metric] > expected[metric]:
+                problems.append(f"{case}: {metric} {expected[metric]} -> {costs[metric]}")
+    return problems
+
+
+def format_table(results: dict[str, dict]) -> str:
+    lines = [f"{'case':<40}" + "".join(f"{metric:>13}" for metric in METRICS)]
+    for case, costs in sorted(results.items()):
+        lines.append(f"{case:<40}" + "".join(f"{costs.get(metric, '-'):>13}" for metric in METRICS))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    localnet = "--localnet" in sys.argv or bool(os.getenv("BENCHMARK_LOCALNET"))
+    results = collect(localnet=localnet)
+    print(format_table(results))
+    if "--update" in sys.argv:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+    else:
+        problems = regressions(results, load_baseline())
+        print("\n".join(problems) or "No regressions")
+        sys.exit(1 if problems else 0)
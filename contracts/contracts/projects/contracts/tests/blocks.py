@@ -0,0 +1,56 @@
+"""Block entries encoded the way algod's JSON block endpoint serves them"""
+import base64
+
+from algosdk.encoding import decode_address
+from algosdk.logic import get_application_address
+
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+
+
+def block_address(address: str) -> str:
+    """An address as it appears in block JSON: base64 of the raw 32 bytes"""
+    return base64.b64encode(decode_address(address)).decode()
+
+
+def asset_creation(app_id: int, student: str, name: str, asset_id: int | None = None) -> dict:
+    """Inner AssetConfig creating a credential whose reserve names `student`"""
+    app_address = block_address(get_application_address(app_id))
+    creation = {
+        "txn": {
+            "type": "acfg",
+            "snd": app_address,
+            "apar": {"t": 1, "an": name, "un": "CERT", "au": "ipfs://x", "m": app_address, "r": block_address(student)},
+        }
+    }
+    if asset_id is not None:
+        creation["caid"] = asset_id
+    return creation
+
+
+def issue_call(app_id: int, sender: str, asset_id: int, student: str, name: str) -> dict:
+    """Block entry for an issue_credential app call with its inner asset creation"""
+    return_log = base64.b64encode(ABI_RETURN_PREFIX + asset_id.to_bytes(8, "big")).decode()
+    return {
+        "txn": {"type": "appl", "snd": block_address(sender), "apid": app_id},
+        "dt": {"lg": [return_log], "itx": [asset_creation(app_id, student, name, asset_id)]},
+    }
+
+
+def transfer(asset_id: int, receiver: str, amount: int = 1) -> dict:
+    txn = {"type": "axfer", "xaid": asset_id, "arcv": block_address(receiver)}
+    if amount:
+        # Zero-valued fields are left out of block JSON
+        txn["aamt"] = amount
+    return {"txn": txn}
+
+
+def reconfigure(asset_id: int, manager: str | None = None, reserve: str | None = None) -> dict:
+    params = {}
+    if manager:
+        params["m"] = block_address(manager)
+    if reserve:
+        params["r"] = block_address(reserve)
+    txn = {"type": "acfg", "caid": asset_id}
+    if params:
+        txn["apar"] = params
+    return {"txn": txn}
@@ -0,0 +1,246 @@
+import base64
+import itertools
+
+import pytest
+from algosdk import account
+from algosdk.error import AlgodHTTPError, IndexerHTTPError
+from algosdk.transaction import SuggestedParams
+
+
+class FakeAlgod:
+    """In-memory stand-in for algod.AlgodClient covering the calls the backend makes"""
+
+    def __init__(self, start_round: int = 1000):
+        self.round = start_round
+        self.calls: dict[str, int] = {}
+        self.pending: dict[str, dict] = {}
+        self.blocks: dict[int, list[str]] = {}
+        self.block_bodies: dict[int, dict] = {}
+        self.boxes: dict[tuple[int, bytes], bytes] = {}
+        self.assets: dict[int, dict] = {}
+        self.holdings: dict[tuple[str, int], int] = {}
+        # Nodes may not serve /v2/accounts/{address}/assets; tests opt in to it
+        self.account_assets_endpoint = False
+        self.global_state: dict[int, dict[bytes, int]] = {}
+        # Logs handed, in order, to the app calls that get sent
+        self.app_call_logs: list[list[bytes]] = []
+        # Boxes simulate reports as accessed without a reference
+        self.simulated_boxes: list[tuple[int, bytes]] = []
+        # Returns the logs a simulated transaction would produce
+        self.simulate_logs = lambda txn: []
+        self.simulate_requests: list = []
+        self.sent_groups: list[list] = []
+        self.reject_groups_containing: set[str] = set()
+        # Errors raised, in order, by the next sends
+        self.send_errors: list[Exception] = []
+        self._asset_ids = itertools.count(5000)
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def suggested_params(self) -> SuggestedParams:
+        self._count("suggested_params")
+        return SuggestedParams(
+            1000,
+            self.round,
+            self.round + 1000,
+            base64.b64encode(b"\x01" * 32).decode(),
+            "testnet-v1.0",
+            False,
+            None,
+            1000,
+        )
+
+    def status(self) -> dict:
+        self._count("status")
+        return {"last-round": self.round}
+
+    def status_after_block(self, round_num: int) -> dict:
+        self._count("status_after_block")
+        self.round = max(self.round, round_num + 1)
+        return {"last-round": self.round}
+
+    def send_transaction(self, signed_txn) -> str:
+        return self.send_transactions([signed_txn])
+
+    def send_transactions(self, signed_txns) -> str:
+        self._count("send_transactions")
+        signed_txns = list(signed_txns)
+        if self.send_errors:
+            raise self.send_errors.pop(0)
+        names = {getattr(s.transaction, "asset_name", None) for s in signed_txns}
+        if names & self.reject_groups_containing:
+            raise AlgodHTTPError("transaction rejected", code=400)
+        self.sent_groups.append(signed_txns)
+        confirmed_round = self.round + 1
+        for signed_txn in signed_txns:
+            txid = signed_txn.get_txid()
+            info = {"confirmed-round": confirmed_round, "pool-error": ""}
+            if signed_txn.transaction.type == "acfg":
+                info["asset-index"] = next(self._asset_ids)
+            elif signed_txn.transaction.type == "appl" and self.app_call_logs:
+                info["logs"] = [base64.b64encode(log).decode() for log in self.app_call_logs.pop(0)]
+            self.pending[txid] = info
+            self.blocks.setdefault(confirmed_round, []).append(txid)
+        return signed_txns[0].get_txid()
+
+    def pending_transaction_info(self, txid: str) -> dict:
+        self._count("pending_transaction_info")
+        return self.pending.get(txid, {"pool-error": ""})
+
+    def block_info(self, round_num: int, **kwargs) -> dict:
+        self._count("block_info")
+        return {"block": self.block_bodies.get(round_num, {"rnd": round_num})}
+
+    def asset_info(self, asset_id: int) -> dict:
+        self._count("asset_info")
+        if asset_id not in self.assets:
+            raise AlgodHTTPError("asset does not exist", code=404)
+        return {"index": asset_id, "params": dict(self.assets[asset_id])}
+
+    def account_asset_info(self, address: str, asset_id: int) -> dict:
+        self._count("account_asset_info")
+        if (address, asset_id) not in self.holdings:
+            raise AlgodHTTPError("account asset info not found", code=404)
+        return {"round": self.round, "asset-holding": {"asset-id": asset_id, "amount": self.holdings[(address, asset_id)]}}
+
+    def account_assets_info(self, address: str, limit: int = 0, next_page: str | None = None) -> dict:
+        self._count("account_assets_info")
+        if not self.account_assets_endpoint:
+            raise AlgodHTTPError("Not Found", code=404)
+        holdings = sorted((asset_id, amount) for (holder, asset_id), amount in self.holdings.items() if holder == address)
+        start = int(next_page or 0)
+        end = start + (limit or len(holdings))
+        page = {
+            "round": self.round,
+            "asset-holdings": [
+                {
+                    "asset-holding": {"asset-id": asset_id, "amount": amount, "is-frozen": False},
+                    "asset-params": dict(self.assets[asset_id]) if asset_id in self.assets else None,
+                }
+                for asset_id, amount in holdings[start:end]
+            ],
+        }
+        if end < len(holdings):
+            page["next-token"] = str(end)
+        return page
+
+    def application_box_by_name(self, app_id: int, box_name: bytes) -> dict:
+        self._count("application_box_by_name")
+        if (app_id, box_name) not in self.boxes:
+            raise AlgodHTTPError("box not found", code=404)
+        value = self.boxes[(app_id, box_name)]
+        return {"name": base64.b64encode(box_name).decode(), "value": base64.b64encode(value).decode()}
+
+    def application_info(self, app_id: int) -> dict:
+        self._count("application_info")
+        state = [
+            {"key": base64.b64encode(key).decode(), "value": {"type": 2, "uint": value}}
+            for key, value in self.global_state.get(app_id, {}).items()
+        ]
+        return {"id": app_id, "params": {"global-state": state}}
+
+    def simulate_transactions(self, request) -> dict:
+        self._count("simulate_transactions")
+        self.simulate_requests.append(request)
+        boxes = [{"app": app_id, "name": base64.b64encode(name).decode()} for app_id, name in self.simulated_boxes]
+        results = [
+            {"txn-result": {"logs": [base64.b64encode(log).decode() for log in self.simulate_logs(signed.transaction)]}}
+            for signed in request.txn_groups[0].txns
+        ]
+        return {"txn-groups": [{"txn-results": results, "unnamed-resources-accessed": {"boxes": boxes}}]}
+
+    def get_block_txids(self, round_num: int) -> dict:
+        self._count("get_block_txids")
+        return {"blockTxids": self.blocks.get(round_num, [])}
+
+
+class FakeIndexer:
+    """In-memory stand-in for indexer.IndexerClient"""
+
+    def __init__(self):
+        self.calls: dict[str, int] = {}
+        self.holdings: dict[str, list[dict]] = {}
+        self.assets: dict[int, dict] = {}
+        self.round = 1000
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def add_asset(self, asset_id: int, holder: str | None = None, amount: int = 1, **params) -> None:
+        params.setdefault("unit-name", "CERT")
+        params.setdefault("name", f"Certificate {asset_id}")
+        self.assets[asset_id] = params
+        if holder is not None:
+            self.holdings.setdefault(holder, []).append(
+                {"asset-id": asset_id, "amount": amount, "is-frozen": False}
+            )
+
+    def lookup_account_assets(self, address: str, limit=None, next_page=None, **kwargs) -> dict:
+        self._count("lookup_account_assets")
+        holdings = self.holdings.get(address, [])
+        start = int(next_page or 0)
+        end = start + (limit or len(holdings))
+        page = {"assets": holdings[start:end], "current-round": self.round}
+        if end < len(holdings):
+            page["next-token"] = str(end)
+        return page
+
+    def health(self) -> dict:
+        self._count("health")
+        return {"round": self.round}
+
+    def asset_balances(self, asset_id: int, **kwargs) -> dict:
+        self._count("asset_balances")
+        return {
+            "balances": [
+                {"address": address, "amount": h["amount"]}
+                for address, holdings in self.holdings.items()
+                for h in holdings
+                if h["asset-id"] == asset_id and h["amount"] > 0
+            ]
+        }
+
+    def asset_info(self, asset_id: int, **kwargs) -> dict:
+        self._count("asset_info")
+        if asset_id not in self.assets:
+            raise IndexerHTTPError("no assets found for asset-id")
+        return {"asset": {"index": asset_id, "params": dict(self.assets[asset_id])}, "current-round": self.round}
+
+
+@pytest.fixture
+def fake_indexer() -> FakeIndexer:
+    return FakeIndexer()
+
+
+@pytest.fixture
+def fake_algod() -> FakeAlgod:
+    return FakeAlgod()
+
+
+@pytest.fixture
+def institution() -> tuple[str, str]:
+    private_key, address = account.generate_account()
+    return private_key, address
+
+
+@pytest.fixture
+def chain(monkeypatch, fake_algod, fake_indexer):
+    """Point backend.blockchain at the fake algod and indexer for the duration of a test"""
+    from backend import blockchain
+    from backend.asset_cache import AssetParamsCache
+    from backend.confirmation import ConfirmationTracker
+    from backend.freshness import IndexerRoundTracker
+    from backend.params import SuggestedParamsProvider
+
+    params_provider = SuggestedParamsProvider(fake_algod)
+    tracker = ConfirmationTracker(fake_algod, params_provider)
+    monkeypatch.setattr(blockchain, "client", fake_algod)
+    monkeypatch.setattr(blockchain, "idx_client", fake_indexer)
+    monkeypatch.setattr(blockchain, "params_provider", params_provider)
+    monkeypatch.setattr(blockchain, "confirmation_tracker", tracker)
+    monkeypatch.setattr(blockchain, "credential_cache", AssetParamsCache())
+    monkeypatch.setattr(blockchain, "indexer_round", IndexerRoundTracker(fake_indexer.health))
+    monkeypatch.setattr(blockchain, "credential_index", None)
+    yield fake_algod
+    tracker.stop()
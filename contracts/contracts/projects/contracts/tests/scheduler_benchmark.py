@@ -0,0 +1,39 @@
+"""
+Throughput benchmark for RequestScheduler against a throttling stand-in node.
+
+    python -m tests.scheduler_benchmark [rate_limit]
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.clients import make_indexer_client
+from backend.scheduler import RequestScheduler, ScheduledClient
+from tests.standin import StandinNode
+
+
+def benchmark(requests: int = 500, rate_limit: float = 100.0, latency: float = 0.02, threads: int = 32) -> dict:
+    """Throughput of asset lookups against a stand-in indexer that throttles at `rate_limit` req/s"""
+    with StandinNode(delay=latency, rate_limit=rate_limit) as node:
+        for asset_id in range(requests):
+            node.add_asset(asset_id)
+        scheduler = RequestScheduler()
+        client = ScheduledClient(make_indexer_client([node.address], token=""), scheduler)
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(client.asset_info, range(requests)))
+        seconds = time.monotonic() - started
+    return {
+        "requests": requests,
+        "seconds": round(seconds, 2),
+        "requests_per_second": round(requests / seconds, 1),
+        "throttled": scheduler.throttled,
+        "retries": scheduler.retries,
+        "final_limit": round(scheduler.limiter.limit, 1),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    rate = float(sys.argv[1]) if len(sys.argv) > 1 else 100.0
+    print(benchmark(rate_limit=rate))
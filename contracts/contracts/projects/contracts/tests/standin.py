@@ -0,0 +1,166 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StandinNode:
+    """
+    Minimal local stand-in for an algod or indexer node, served over real HTTP.
+
+    It answers the read endpoints the backend relies on from in-memory
+    blocks and assets, so tools like the backfill can be tested and
+    benchmarked with the real SDK clients and no network access. Start it
+    with `start()` (or as a context manager) and point an AlgodClient or
+    IndexerClient at `address`.
+
+    With `rate_limit` set it throttles like a free public node: a token
+    bucket refilled at `rate_limit` requests per second, holding up to
+    `burst`, answers 429 once it is empty.
+    """
+
+    def __init__(
+        self,
+        last_round: int = 0,
+        delay: float = 0.0,
+        rate_limit: float | None = None,
+        burst: int = 10,
+    ):
+        self.last_round = last_round
+        self.blocks: dict[int, dict] = {}
+        self.assets: dict[int, dict] = {}
+        # Seconds added to every response, to stand in for a slow node
+        self.delay = delay
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self.requests = 0
+        self.throttled = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._routes = [
+            (re.compile(r"^/v2/status$"), self._status),
+            (re.compile(r"^/v2/status/wait-for-block-after/(\d+)$"), self._status_after),
+            (re.compile(r"^/v2/blocks/(\d+)/txids$"), self._block_txids),
+            (re.compile(r"^/v2/blocks/(\d+)$"), self._block),
+            (re.compile(r"^/v2/assets/(\d+)$"), self._asset),
+        ]
+
+    # ----------------------------- Chain state ----------------------------- #
+
+    def add_block(self, round_num: int, txns: list[dict]) -> None:
+        with self._lock:
+            self.blocks[round_num] = {"rnd": round_num, "txns": txns}
+            self.last_round = max(self.last_round, round_num)
+
+    def add_asset(self, asset_id: int, **params) -> None:
+        params.setdefault("unit-name", "CERT")
+        params.setdefault("name", f"Certificate {asset_id}")
+        with self._lock:
+            self.assets[asset_id] = params
+
+    # ------------------------------- Routes -------------------------------- #
+
+    def _status(self, query: dict) -> tuple[int, dict]:
+        return 200, {"last-round": self.last_round}
+
+    def _status_after(self, query: dict, round_num: str) -> tuple[int, dict]:
+        return 200, {"last-round": max(self.last_round, int(round_num))}
+
+    def _block(self, query: dict, round_num: str) -> tuple[int, dict]:
+        round_num = int(round_num)
+        if round_num > self.last_round:
+            return 404, {"message": "ledger does not have entry"}
+        return 200, {"block": self.blocks.get(round_num, {"rnd": round_num})}
+
+    def _block_txids(self, query: dict, round_num: str) -> tuple[int, dict]:
+        block = self.blocks.get(int(round_num), {})
+        return 200, {"blockTxids": [t.get("txid", "") for t in block.get("txns", [])]}
+
+    def _asset(self, query: dict, asset_id: str) -> tuple[int, dict]:
+        params = self.assets.get(int(asset_id))
+        if params is None:
+            return 404, {"message": "no assets found for asset-id"}
+        return 200, {"asset": {"index": int(asset_id), "params": params}, "current-round": self.last_round}
+
+    def _take_token(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate_limit)
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def handle(self, method: str, path: str, query: dict) -> tuple[int, dict]:
+        with self._lock:
+            self.requests += 1
+            if self.rate_limit is not None and not self._take_token():
+                self.throttled += 1
+                return 429, {"message": "Too Many Requests"}
+        if self.delay:
+            time.sleep(self.delay)
+        for pattern, route in self._routes:
+            match = pattern.match(path)
+            if match:
+                return route(query, *match.groups())
+        return 404, {"message": f"{method} {path} not found"}
+
+    # ------------------------------- Server -------------------------------- #
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandinNode":
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections open between requests, like a real node
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                with node._lock:
+                    node.connections += 1
+
+            def do_GET(self) -> None:
+                self._respond("GET")
+
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self._respond("POST")
+
+            def _respond(self, method: str) -> None:
+                url = urlparse(self.path)
+                status, body = node.handle(method, url.path, parse_qs(url.query))
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self) -> "StandinNode":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,53 @@
+from algosdk import account
+from algosdk.logic import get_application_address
+
+from backend.backfill import backfill, partition_checkpoint_name, plan_partitions
+from backend.credential_index import CredentialIndex
+from backend.follower import DEFAULT_CHECKPOINT_NAME, IndexSink
+from tests.standin import StandinNode
+from tests.blocks import asset_creation, block_address, transfer
+
+APP_ID = 1234
+APP_ADDRESS = get_application_address(APP_ID)
+INSTITUTION, NEW_HOLDER = (account.generate_account()[1] for _ in range(2))
+STUDENTS = [account.generate_account()[1] for _ in range(5)]
+
+
+def issuance(asset_id: int, student: str) -> dict:
+    return {
+        "txn": {"type": "appl", "snd": block_address(INSTITUTION), "apid": APP_ID},
+        "dt": {"itx": [asset_creation(APP_ID, student, f"Cert {asset_id}", asset_id)]},
+    }
+
+
+def test_plan_partitions_covers_range_exactly():
+    assert plan_partitions(10, 34, 10) == [(10, 19), (20, 29), (30, 34)]
+
+
+def test_backfill_matches_follower_schema_and_resumes(tmp_path):
+    index = CredentialIndex(str(tmp_path / "credentials.db"))
+    sink = IndexSink(index)
+    with StandinNode() as node:
+        for round_num in range(1, 201):
+            txns = [issuance(round_num, STUDENTS[round_num % 5])] if round_num % 4 == 0 else []
+            if round_num == 150:
+                txns.append(transfer(148, NEW_HOLDER))
+            node.add_block(round_num, txns)
+
+        # Pretend an earlier run already finished the first partition
+        sink.set_checkpoint(partition_checkpoint_name(1, 50), 50)
+        report = backfill(sink, node.address, "", APP_ID, 1, 200, partition_rounds=50, workers=3)
+
+        assert report.skipped_partitions == 1
+        assert report.rounds == 150
+        assert report.credentials == 38
+        assert report.rounds_per_second > 0
+        assert "credentials/sec" in str(report)
+
+        rerun = backfill(sink, node.address, "", APP_ID, 1, 200, partition_rounds=50, workers=3)
+        assert rerun.rounds == 0 and rerun.skipped_partitions == 4
+
+    assert index.count() == 38
+    assert index.get_record(52).reserve == STUDENTS[2]
+    assert index.get_record(148).holder == NEW_HOLDER
+    assert index.get_checkpoint(DEFAULT_CHECKPOINT_NAME) == 200
@@ -0,0 +1,31 @@
+from backend import blockchain
+
+
+def _records(count: int) -> list[tuple[str, str, str]]:
+    return [
+        (f"STUDENT{i}", f"Certificate {i}", f"ipfs://cid-{i}")
+        for i in range(count)
+    ]
+
+
+def test_mint_credentials_batch_packs_groups_of_16(chain, institution):
+    private_key, _ = institution
+
+    results = blockchain.mint_credentials_batch(private_key, _records(40))
+
+    assert sorted(len(group) for group in chain.sent_groups) == [8, 16, 16]
+    assert [r.certificate_name for r in results] == [f"Certificate {i}" for i in range(40)]
+    assert all(r.ok for r in results)
+    assert len({r.asset_id for r in results}) == 40
+
+
+def test_mint_credentials_batch_reports_failed_group(chain, institution):
+    chain.reject_groups_containing = {"Certificate 20"}
+    private_key, _ = institution
+
+    results = blockchain.mint_credentials_batch(private_key, _records(40))
+
+    failed = [i for i, r in enumerate(results) if not r.ok]
+    assert failed == list(range(16, 32))
+    assert all(results[i].error for i in failed)
+    assert results[0].asset_id is not None and results[39].asset_id is not None
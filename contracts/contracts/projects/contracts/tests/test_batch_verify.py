@@ -0,0 +1,54 @@
+from algosdk import abi, account
+
+from backend.batch_verify import VERIFY_CREDENTIALS, simulate_verify_credentials
+from backend.follower import ABI_RETURN_PREFIX
+
+APP_ID = 1234
+IDS_TYPE = abi.ABIType.from_string("uint64[]")
+
+
+def test_packs_ids_into_simulated_groups_and_keeps_order(fake_algod):
+    _, holder = account.generate_account()
+    _, sender = account.generate_account()
+
+    def simulate_logs(txn):
+        asset_ids = IDS_TYPE.decode(txn.app_args[1])
+        checks = [(a, a % 2 == 0, holder) for a in asset_ids]
+        return [ABI_RETURN_PREFIX + VERIFY_CREDENTIALS.returns.type.encode(checks)]
+
+    fake_algod.simulate_logs = simulate_logs
+    checks = simulate_verify_credentials(fake_algod, APP_ID, range(100), sender)
+
+    assert [c.asset_id for c in checks] == list(range(100))
+    assert [c.valid for c in checks] == [a % 2 == 0 for a in range(100)]
+    assert fake_algod.calls["simulate_transactions"] == 2
+    first, second = fake_algod.simulate_requests
+    assert first.allow_empty_signatures and first.allow_unnamed_resources
+    assert [len(g.txns) for g in (first.txn_groups[0], second.txn_groups[0])] == [16, 9]
+    assert not any(signed.signature for signed in first.txn_groups[0].txns)
+
+
+def test_credentials_revoked_in_the_bitmap_are_not_simulated(fake_algod):
+    from backend.credential_index import CredentialIndex, CredentialRecord
+    from backend.revocation import RevocationBitmap
+
+    _, holder = account.generate_account()
+    _, sender = account.generate_account()
+    index = CredentialIndex()
+    index.upsert_credentials([
+        CredentialRecord(asset_id=a, creator="APP", holder=holder, serial=a - 10) for a in (10, 11, 12)
+    ])
+    # Serial 1 (asset 11) is revoked
+    revocations = RevocationBitmap({0: b"\x40" + bytes(1023)}, serial_count=3)
+    fake_algod.simulate_logs = lambda txn: [
+        ABI_RETURN_PREFIX + VERIFY_CREDENTIALS.returns.type.encode([(a, True, holder) for a in IDS_TYPE.decode(txn.app_args[1])])
+    ]
+
+    checks = simulate_verify_credentials(fake_algod, APP_ID, [10, 11, 12, 13], sender, index=index, revocations=revocations)
+
+    assert [(c.asset_id, c.valid, c.holder) for c in checks] == [
+        (10, True, holder), (11, False, None), (12, True, holder), (13, True, holder)
+    ]
+    [request] = fake_algod.simulate_requests
+    [call] = request.txn_groups[0].txns
+    assert IDS_TYPE.decode(call.transaction.app_args[1]) == [10, 12, 13]
@@ -0,0 +1,28 @@
+from tests.benchmarks import interpret, load_baseline, regressions
+
+
+def test_regressions_flag_increases_and_unknown_cases():
+    baseline = {"verify_credential[found]": {"fee": 1000, "log_bytes": 14}}
+    results = {
+        "verify_credential[found]": {"fee": 1000, "log_bytes": 20},
+        "new_method": {"fee": 1000},
+    }
+    assert regressions(results, baseline, ("fee", "log_bytes")) == [
+        "new_method: no baseline, rerun with --update",
+        "verify_credential[found]: log_bytes 14 -> 20",
+    ]
+
+
+def test_regressions_treat_missing_metrics_as_failures():
+    baseline = {"get_contract_info": {"fee": 1000, "log_bytes": 53}}
+    results = {"get_contract_info": {"fee": 1000, "opcode_cost": 40}}
+    assert regressions(results, baseline, ("fee", "log_bytes", "opcode_cost")) == [
+        "get_contract_info: log_bytes not measured",
+        "get_contract_info: opcode_cost has no baseline, rerun with --update",
+    ]
+
+
+def test_opcode_costs_do_not_regress():
+    costs = {case: {"opcode_cost": execution.cost} for case, execution in interpret().items()}
+    problems = regressions(costs, load_baseline(), ("opcode_cost",))
+    assert not problems, "\n".join(problems)
@@ -0,0 +1,23 @@
+import os
+
+import pytest
+
+pytest.importorskip("algopy_testing")
+
+from tests.benchmarks import MIN_FEE, collect, interpret, load_baseline, measure, regressions
+
+
+def test_method_costs_do_not_regress():
+    problems = regressions(collect(localnet=bool(os.getenv("BENCHMARK_LOCALNET"))), load_baseline())
+    assert not problems, "\n".join(problems)
+
+
+def test_measurements_agree_with_the_compiled_program():
+    # measure() reads algopy_testing's transaction context; the compiled
+    # program must log the same bytes and submit the same inner transactions
+    measured = measure()
+    for case, execution in interpret().items():
+        fee = MIN_FEE + sum(max(0, MIN_FEE - itxn.get("Fee", MIN_FEE)) for itxn in execution.inner_txns)
+        assert measured[case]["log_bytes"] == sum(len(log) for log in execution.logs), case
+        assert measured[case]["inner_txns"] == len(execution.inner_txns), case
+        assert measured[case]["fee"] == fee, case
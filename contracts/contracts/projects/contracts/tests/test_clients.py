@@ -0,0 +1,71 @@
+import time
+
+import pytest
+from algosdk.error import AlgodHTTPError
+
+from backend.clients import MIN_LATENCY_SAMPLES, EndpointTransport, endpoints_from_env, make_algod_client
+from tests.standin import StandinNode
+
+
+def test_endpoints_come_from_configuration(monkeypatch):
+    monkeypatch.setenv("ALGOD_URLS", "https://a.example/, https://b.example")
+    assert endpoints_from_env("ALGOD_URLS", "https://default") == ["https://a.example", "https://b.example"]
+    assert endpoints_from_env("UNSET_URLS", "https://default") == ["https://default"]
+
+
+def test_requests_reuse_keep_alive_connections():
+    with StandinNode(last_round=42) as node:
+        client = make_algod_client([node.address], token="")
+        for _ in range(10):
+            assert client.status()["last-round"] == 42
+        with pytest.raises(AlgodHTTPError) as error:
+            client.block_info(round_num=43)
+
+    assert error.value.code == 404
+    assert node.requests == 11
+    assert node.connections == 1
+    assert client.transport.pool.opened == 1
+
+
+def test_slow_endpoint_is_hedged_to_the_other():
+    with StandinNode(last_round=7) as slow, StandinNode(last_round=7) as fast:
+        client = make_algod_client([slow.address, fast.address], token="")
+        for _ in range(MIN_LATENCY_SAMPLES):
+            client.status()
+
+        slow.delay = 1.0
+        started = time.monotonic()
+        for _ in range(2):
+            assert client.status()["last-round"] == 7
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.9
+    assert client.transport.hedged == 1
+    # The hedged request is one latency sample, not one per endpoint
+    assert len(client.transport.latency._samples) == MIN_LATENCY_SAMPLES + 2
+
+
+def test_unreachable_endpoint_fails_over():
+    with StandinNode(last_round=3) as node:
+        client = make_algod_client(["http://127.0.0.1:9", node.address], token="")
+        assert [client.status()["last-round"] for _ in range(2)] == [3, 3]
+
+
+def test_write_is_not_resent_once_it_reached_a_node():
+    with StandinNode() as slow, StandinNode() as other:
+        transport = EndpointTransport([slow.address, other.address])
+        slow.delay = 1.0
+        with pytest.raises(OSError):
+            transport.request("POST", "/v2/transactions", {}, b"signed", timeout=0.2)
+
+    assert slow.requests == 1
+    assert other.requests == 0
+
+
+def test_write_fails_over_when_a_node_is_unreachable():
+    with StandinNode() as node:
+        transport = EndpointTransport(["http://127.0.0.1:9", node.address])
+        status, _ = transport.request("POST", "/v2/transactions", {}, b"signed")
+
+    assert status == 404
+    assert node.requests == 1
@@ -0,0 +1,38 @@
+import pytest
+
+from backend.confirmation import ConfirmationTracker, TransactionExpiredError
+
+
+def test_tracker_resolves_many_txids_from_one_block(fake_algod):
+    tracker = ConfirmationTracker(fake_algod)
+    confirmed_round = fake_algod.round + 1
+    txids = [f"TX{i}" for i in range(1000)]
+    fake_algod.blocks[confirmed_round] = txids
+
+    futures = [tracker.track(txid, last_valid=confirmed_round + 10) for txid in txids]
+    try:
+        assert {f.result(timeout=5) for f in futures} == {confirmed_round}
+        assert fake_algod.calls.get("pending_transaction_info", 0) == 0
+        assert fake_algod.calls["get_block_txids"] < 10
+    finally:
+        tracker.stop()
+
+
+def test_tracker_expires_after_last_valid(fake_algod):
+    tracker = ConfirmationTracker(fake_algod)
+    future = tracker.track("NEVER", last_valid=fake_algod.round + 3)
+    try:
+        with pytest.raises(TransactionExpiredError):
+            future.result(timeout=5)
+        assert tracker.pending_count() == 0
+    finally:
+        tracker.stop()
+
+
+def test_tracker_sees_txids_confirmed_before_tracking(fake_algod):
+    tracker = ConfirmationTracker(fake_algod)
+    fake_algod.blocks[fake_algod.round] = ["EARLY"]
+    try:
+        assert tracker.wait("EARLY", last_valid=fake_algod.round + 10, timeout=5) == fake_algod.round
+    finally:
+        tracker.stop()
@@ -0,0 +1,50 @@
+from backend import blockchain
+from backend.asset_cache import AssetParamsCache
+
+
+def test_get_credentials_details_serves_hot_assets_from_cache(chain, fake_indexer):
+    for asset_id in range(1, 51):
+        fake_indexer.add_asset(asset_id)
+
+    first = blockchain.get_credentials_details(list(range(1, 51)) + [1, 2, 999])
+    assert len(first) == 50 and 999 not in first
+    assert fake_indexer.calls["asset_info"] == 51
+
+    second = blockchain.get_credentials_details(range(1, 51))
+    assert second == first
+    assert blockchain.get_credential_details(7)["name"] == "Certificate 7"
+    assert fake_indexer.calls["asset_info"] == 51
+
+
+def test_invalidate_forces_refetch_after_asset_config(chain, fake_indexer):
+    fake_indexer.add_asset(42, reserve="OLD")
+    assert blockchain.get_credential_details(42)["reserve"] == "OLD"
+
+    fake_indexer.assets[42]["reserve"] = "NEW"
+    blockchain.credential_cache.invalidate(42)
+    assert blockchain.get_credential_details(42)["reserve"] == "NEW"
+
+
+def test_blank_pool_credentials_are_never_cached(chain, fake_indexer):
+    from backend.credential_pool import ARC19_TEMPLATE_URL
+
+    fake_indexer.add_asset(43, creator="APP", reserve="APP", url=ARC19_TEMPLATE_URL)
+    blockchain.get_credential_details(43)
+    assert blockchain.credential_cache.get(43) is None
+
+    # Once assigned, the reserve names the metadata CID and the params are stable
+    fake_indexer.assets[43]["reserve"] = "CID"
+    assert blockchain.get_credential_details(43)["reserve"] == "CID"
+    assert blockchain.credential_cache.get(43)["reserve"] == "CID"
+
+
+def test_cache_is_size_bounded_with_disk_tier(tmp_path):
+    cache = AssetParamsCache(max_entries=2, path=str(tmp_path / "assets.db"))
+    for asset_id in range(5):
+        cache.put(asset_id, {"name": f"Certificate {asset_id}"})
+
+    assert cache.stats()["entries"] == 2
+    reopened = AssetParamsCache(path=str(tmp_path / "assets.db"))
+    assert reopened.get(0) == {"name": "Certificate 0"}
+    reopened.invalidate(0)
+    assert reopened.get(0) is None
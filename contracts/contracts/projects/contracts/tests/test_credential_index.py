@@ -0,0 +1,61 @@
+from backend.credential_index import CredentialIndex, CredentialRecord, sync_from_indexer
+
+
+def test_index_queries_mirror_blockchain_shapes(tmp_path):
+    index = CredentialIndex(str(tmp_path / "credentials.db"))
+    index.upsert_credentials(
+        CredentialRecord(
+            asset_id=asset_id,
+            creator="APP",
+            name="BSc Computer Science",
+            unit_name="CERT",
+            url=f"ipfs://cid-{asset_id}",
+            holder="ALICE" if asset_id % 2 else "BOB",
+            issue_round=100 + asset_id,
+        )
+        for asset_id in range(1, 11)
+    )
+
+    assert [c["asset-id"] for c in index.get_student_credentials("ALICE")] == [1, 3, 5, 7, 9]
+    assert index.get_credential_details(4) == {
+        "creator": "APP",
+        "name": "BSc Computer Science",
+        "unit-name": "CERT",
+        "url": "ipfs://cid-4",
+        "total": 1,
+        "decimals": 0,
+    }
+    assert index.get_credential_details(999) == {}
+    assert len(index.find_by_name("BSc Computer Science")) == 10
+
+
+def test_upsert_is_idempotent_and_keeps_holder():
+    index = CredentialIndex()
+    record = CredentialRecord(asset_id=1, creator="APP", name="Diploma", holder="ALICE")
+    index.upsert_credentials([record])
+    index.upsert_credentials([CredentialRecord(asset_id=1, creator="APP", name="Diploma")])
+
+    assert index.count() == 1
+    assert index.get_record(1).holder == "ALICE"
+
+
+class SearchableIndexer:
+    def search_assets(self, creator=None, unit=None, next_page=None, **kwargs):
+        assets = [
+            {"index": i, "created-at-round": 50 + i,
+             "params": {"creator": creator, "name": f"Cert {i}", "unit-name": unit}}
+            for i in (1, 2, 3)
+        ]
+        if next_page is None:
+            return {"assets": assets[:2], "next-token": "2"}
+        return {"assets": assets[2:]}
+
+    def asset_balances(self, asset_id, **kwargs):
+        return {"balances": [{"address": f"HOLDER{asset_id}", "amount": 1}]}
+
+
+def test_sync_from_indexer_walks_pages():
+    index = CredentialIndex()
+    assert sync_from_indexer(index, SearchableIndexer(), ["INSTITUTION"]) == 3
+    assert index.get_student_credentials("HOLDER3") == [{"asset-id": 3, "amount": 1, "is-frozen": False}]
+    assert index.get_record(2).issue_round == 52
@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+
+import pytest
+from algosdk import abi, account
+from algosdk.error import AlgodHTTPError
+from algosdk.logic import get_application_address
+
+from backend.asset_cache import AssetParamsCache
+from backend.confirmation import ConfirmationTracker
+
+from backend.credential_pool import (
+    ASSET_IDS_TYPE,
+    ASSIGN_CREDENTIAL,
+    MINT_POOL,
+    CredentialPool,
+    cid_digest,
+    cid_for_reserve_address,
+    reserve_address_for_cid,
+)
+from backend.follower import ABI_RETURN_PREFIX
+from backend.registry import credential_box_name, student_page_box_name
+
+APP_ID = 1234
+APP_ADDRESS = get_application_address(APP_ID)
+CID = "QmYwAPJzv5CZsnA625s3Xf2nemtYgPpHdWEz79ojWnPbdG"
+ARC56_SPEC = (
+    Path(__file__).parent.parent / "smart_contracts" / "artifacts" / "credential_verifier" / "CredentialVerifier.arc56.json"
+)
+
+
+def compiled_method(name: str) -> abi.Method:
+    [method] = [m for m in json.loads(ARC56_SPEC.read_text())["methods"] if m["name"] == name]
+    return abi.Method.undictify(method)
+
+
+@pytest.fixture
+def tracker(fake_algod):
+    tracker = ConfirmationTracker(fake_algod)
+    yield tracker
+    tracker.stop()
+
+
+def test_reserve_address_round_trips_the_cid():
+    address = reserve_address_for_cid(f"https://gateway.pinata.cloud/ipfs/{CID}")
+    assert cid_for_reserve_address(address) == CID
+    assert reserve_address_for_cid(f"ipfs://{CID}") == address
+    with pytest.raises(ValueError):
+        cid_digest("bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi")
+
+
+@pytest.mark.parametrize("method", [MINT_POOL, ASSIGN_CREDENTIAL], ids=lambda m: m.name)
+def test_methods_match_the_compiled_contract(method):
+    assert method.get_selector() == compiled_method(method.name).get_selector()
+
+
+def test_top_up_mints_to_target_and_assign_uses_the_pool(fake_algod, institution, tracker):
+    institution_key, _ = institution
+    fake_algod.global_state[APP_ID] = {b"pool_size": 10}
+    minted = list(range(700, 750))
+    fake_algod.app_call_logs.append([ABI_RETURN_PREFIX + ASSET_IDS_TYPE.encode(minted)])
+    pool = CredentialPool(fake_algod, APP_ID, institution_key, low_water=20, target=60, confirmation_tracker=tracker)
+
+    assert pool.top_up() == 50
+    [[mint_call]] = fake_algod.sent_groups
+    assert mint_call.transaction.fee == 1000 * (1 + 50 + 8)
+
+    student_key, student = account.generate_account()
+    asset_id, _ = pool.assign(student_key, f"ipfs://{CID}")
+
+    assert asset_id == 700
+    opt_in, assign_call = fake_algod.sent_groups[-1]
+    assert (opt_in.transaction.sender, opt_in.transaction.index) == (student, 700)
+    assert assign_call.transaction.app_args[0] == compiled_method("assign_credential").get_selector()
+    assert assign_call.transaction.app_args[1] == (700).to_bytes(8, "big")
+    assert assign_call.transaction.foreign_assets == [700]
+    assert assign_call.transaction.app_args[3] == cid_digest(CID)
+    assert [box.name for box in assign_call.transaction.boxes] == [
+        credential_box_name(700),
+        student_page_box_name(student, 0),
+    ]
+    assert pool.status().assigned == 1
+
+
+def test_failed_assignment_requeues_only_credentials_still_blank(fake_algod, institution, tracker):
+    institution_key, _ = institution
+    cache = AssetParamsCache()
+    pool = CredentialPool(fake_algod, APP_ID, institution_key, confirmation_tracker=tracker, asset_cache=cache)
+    pool._available.extend([700, 701])
+    student_key, student = account.generate_account()
+
+    # Rejected while still blank: back at the front of the pool
+    fake_algod.assets[700] = {"creator": APP_ADDRESS, "reserve": APP_ADDRESS}
+    fake_algod.send_errors.append(AlgodHTTPError("transaction rejected", code=400))
+    with pytest.raises(AlgodHTTPError):
+        pool.assign(student_key, f"ipfs://{CID}")
+    assert list(pool._available) == [700, 701]
+
+    # Failed after the reserve moved (assigned elsewhere, or by this very group): dropped
+    fake_algod.assets[700] = {"creator": APP_ADDRESS, "reserve": reserve_address_for_cid(CID)}
+    cache.put(700, {"reserve": APP_ADDRESS})
+    fake_algod.send_errors.append(AlgodHTTPError("Credential already assigned", code=400))
+    with pytest.raises(AlgodHTTPError):
+        pool.assign(student_key, f"ipfs://{CID}")
+    assert list(pool._available) == [701]
+    assert cache.get(700) is None
+
+    assert pool.assign(student_key, f"ipfs://{CID}")[0] == 701
+    assert pool.status().assigned == 1
+
+
+def test_assignment_that_fails_before_sending_requeues_the_credential(fake_algod, institution, tracker, monkeypatch):
+    institution_key, _ = institution
+    pool = CredentialPool(fake_algod, APP_ID, institution_key, confirmation_tracker=tracker)
+    pool._available.extend([700, 701])
+    fake_algod.assets[700] = {"creator": APP_ADDRESS, "reserve": APP_ADDRESS}
+    student_key, _ = account.generate_account()
+
+    def unavailable(app_id, box_name):
+        raise AlgodHTTPError("node is catching up", code=503)
+
+    monkeypatch.setattr(fake_algod, "application_box_by_name", unavailable)
+    with pytest.raises(AlgodHTTPError):
+        pool.assign(student_key, f"ipfs://{CID}")
+    assert list(pool._available) == [700, 701]
+    assert fake_algod.sent_groups == []
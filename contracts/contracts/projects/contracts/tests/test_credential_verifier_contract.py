@@ -0,0 +1,199 @@
+import hashlib
+import typing
+
+import pytest
+
+pytest.importorskip("algopy_testing")
+
+import algopy
+from algopy import arc4, op
+from algopy_testing import algopy_testing_context
+
+from smart_contracts.credential_verifier.contract import CredentialVerifier
+
+
+@pytest.fixture
+def context():
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture
+def deployed(context):
+    contract = CredentialVerifier()
+    institution = context.any.account()
+    contract.create(institution)
+    return contract, institution
+
+
+def issue(context, contract, institution, student, name="BSc Computer Science", url="ipfs://cid"):
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        return contract.issue_credential(student, algopy.String(name), algopy.String(url))
+
+
+def test_issue_credential_writes_registry_record(context, deployed):
+    contract, institution = deployed
+    student = context.any.account()
+    context.ledger.patch_global_fields(round=1234)
+
+    asset_id = issue(context, contract, institution, student)
+
+    record = contract.credentials[arc4.UInt64(asset_id)]
+    assert record.holder == arc4.Address(student)
+    assert record.document_hash.bytes == hashlib.sha256(b"ipfs://cid").digest()
+    assert record.issue_round == 1234
+    assert contract.verify_credential(asset_id) == "Verified"
+    assert contract.get_credential(asset_id).status == 1
+
+
+def test_verify_credential_rejects_unknown_asset(deployed):
+    contract, _ = deployed
+    assert contract.verify_credential(algopy.UInt64(999)) == "Not Found"
+
+
+def test_only_institution_can_issue(context, deployed):
+    contract, _ = deployed
+    with pytest.raises(AssertionError):
+        issue(context, contract, context.any.account(), context.any.account())
+
+
+def test_issue_credentials_batch_mints_in_order(context, deployed):
+    contract, institution = deployed
+    students = [context.any.account() for _ in range(3)]
+    names = [f"Cert {i}" for i in range(3)]
+    urls = [f"ipfs://cid{i}" for i in range(3)]
+
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        asset_ids = contract.issue_credentials_batch(
+            arc4.DynamicArray[arc4.Address](*[arc4.Address(s) for s in students]),
+            arc4.DynamicArray[arc4.String](*[arc4.String(n) for n in names]),
+            arc4.DynamicArray[arc4.String](*[arc4.String(u) for u in urls]),
+        )
+
+    assert asset_ids.length == 3
+    for asset_id, student, url in zip(asset_ids, students, urls):
+        record = contract.credentials[asset_id]
+        assert record.holder == arc4.Address(student)
+        assert record.document_hash.bytes == hashlib.sha256(url.encode()).digest()
+    assert len({a.as_uint64() for a in asset_ids}) == 3
+
+
+def test_issue_credentials_batch_rejects_mismatched_arrays(context, deployed):
+    contract, institution = deployed
+    with pytest.raises(AssertionError), context.txn.create_group(active_txn_overrides={"sender": institution}):
+        contract.issue_credentials_batch(
+            arc4.DynamicArray[arc4.Address](arc4.Address(context.any.account())),
+            arc4.DynamicArray[arc4.String](),
+            arc4.DynamicArray[arc4.String](),
+        )
+
+
+def test_anchor_cohort_is_write_once(context, deployed):
+    contract, institution = deployed
+    root = arc4.StaticArray[arc4.Byte, typing.Literal[32]].from_bytes(b"\x05" * 32)
+
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        contract.anchor_cohort(algopy.UInt64(7), root, algopy.UInt64(100_000))
+    assert contract.get_cohort(algopy.UInt64(7)).merkle_root.bytes == b"\x05" * 32
+    assert contract.get_cohort(algopy.UInt64(7)).leaf_count == 100_000
+
+    with pytest.raises(AssertionError), context.txn.create_group(active_txn_overrides={"sender": institution}):
+        contract.anchor_cohort(algopy.UInt64(7), root, algopy.UInt64(1))
+
+
+def test_revoke_credentials_sets_status_and_bit(context, deployed):
+    contract, institution = deployed
+    asset_ids = [issue(context, contract, institution, context.any.account()) for _ in range(3)]
+    assert [contract.credentials[arc4.UInt64(a)].serial for a in asset_ids] == [0, 1, 2]
+
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        contract.revoke_credentials(arc4.DynamicArray[arc4.UInt64](arc4.UInt64(asset_ids[0]), arc4.UInt64(asset_ids[2])))
+
+    assert [contract.verify_credential(a) for a in asset_ids] == ["Invalid", "Verified", "Invalid"]
+    page = contract.revocations[arc4.UInt64(0)]
+    assert page.length == 1024
+    assert page[:1] == b"\xa0"
+
+
+def test_pooled_credential_is_assigned_by_reserve_reconfiguration(context, deployed):
+    contract, institution = deployed
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        pooled = contract.mint_pool(algopy.UInt64(2))
+    assert contract.pool_size == 2
+
+    asset = context.ledger.get_asset(pooled[0].as_uint64())
+    assert asset.url == algopy.Bytes(b"template-ipfs://{ipfs:0:dag-pb:reserve:sha2-256}")
+    assert contract.verify_credential(asset.id) == "Not Found"
+
+    student = context.any.account(opted_asset_balances={asset.id: algopy.UInt64(0)})
+    digest = arc4.StaticArray[arc4.Byte, typing.Literal[32]].from_bytes(b"\x09" * 32)
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        contract.assign_credential(asset, student, digest)
+
+    [[reconfig], [transfer]] = context.txn.last_group.itxn_groups
+    assert reconfig.reserve.bytes == b"\x09" * 32
+    assert transfer.asset_receiver == student
+    assert contract.pool_size == 1
+    assert contract.verify_credential(asset.id) == "Verified"
+    assert contract.credentials[arc4.UInt64(asset.id)].document_hash.bytes == b"\x09" * 32
+
+
+def test_delegates_issue_within_their_quota(context, deployed):
+    contract, institution = deployed
+    delegate = context.any.account()
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        contract.add_delegate(delegate, algopy.UInt64(1))
+
+    asset_id = issue(context, contract, delegate, context.any.account())
+    assert contract.verify_credential(asset_id) == "Verified"
+    assert contract.get_delegate(delegate).issued == 1
+    with pytest.raises(AssertionError, match="quota"):
+        issue(context, contract, delegate, context.any.account())
+
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        contract.add_delegate(delegate, algopy.UInt64(0))
+    issue(context, contract, delegate, context.any.account())
+    assert contract.get_delegate(delegate).issued == 2
+
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        contract.remove_delegate(delegate)
+    with pytest.raises(AssertionError):
+        issue(context, contract, delegate, context.any.account())
+
+
+def test_list_credentials_pages_a_students_index(context, deployed):
+    contract, institution = deployed
+    student = context.any.account()
+    asset_ids = [issue(context, contract, institution, student) for _ in range(130)]
+    issue(context, contract, institution, context.any.account())
+
+    first = contract.list_credentials(student, algopy.UInt64(0))
+    second = contract.list_credentials(student, algopy.UInt64(1))
+    assert first.total == second.total == 130
+    assert (first.asset_ids.length, second.asset_ids.length) == (126, 4)
+    assert [a.as_uint64() for a in first.asset_ids] + [a.as_uint64() for a in second.asset_ids] == asset_ids
+    # A full page still fits the 1KB log limit once the 4-byte return prefix is added
+    assert 4 + len(first.bytes) <= 1024
+    assert contract.list_credentials(student, algopy.UInt64(2)).asset_ids.length == 0
+    assert contract.list_credentials(context.any.account(), algopy.UInt64(0)).total == 0
+
+    # The count lives in the header of page 0; there is no separate count box
+    first_page = contract.student_pages[student.bytes + op.itob(0)]
+    assert op.btoi(first_page[:8]) == 130
+    assert first_page.length == 8 + 126 * 8
+
+
+def test_verify_credentials_checks_a_whole_batch(context, deployed):
+    contract, institution = deployed
+    student = context.any.account()
+    active, revoked = (issue(context, contract, institution, student) for _ in range(2))
+    with context.txn.create_group(active_txn_overrides={"sender": institution}):
+        contract.revoke_credentials(arc4.DynamicArray[arc4.UInt64](arc4.UInt64(revoked)))
+
+    checks = contract.verify_credentials(
+        arc4.DynamicArray[arc4.UInt64](arc4.UInt64(active), arc4.UInt64(revoked), arc4.UInt64(999))
+    )
+
+    assert [(c.asset_id.as_uint64(), c.valid.native) for c in checks] == [(active, True), (revoked, False), (999, False)]
+    assert checks[0].holder == arc4.Address(student)
+    assert checks[2].holder == arc4.Address()
@@ -0,0 +1,31 @@
+from algosdk import account
+
+from backend import blockchain
+
+
+def test_deliver_credential_sends_one_group_signed_by_both_keys(chain, institution):
+    institution_key, institution_address = institution
+    student_key, student_address = account.generate_account()
+
+    txid = blockchain.deliver_credential(institution_key, student_key, 5000)
+
+    assert len(chain.sent_groups) == 1
+    opt_in, transfer = chain.sent_groups[0]
+    assert opt_in.transaction.sender == opt_in.transaction.receiver == student_address
+    assert transfer.transaction.sender == institution_address
+    assert opt_in.transaction.group == transfer.transaction.group is not None
+    assert transfer.get_txid() == txid
+    assert chain.calls["suggested_params"] == 1
+
+
+def test_deliver_credentials_batch_reports_per_student(chain, institution):
+    institution_key, _ = institution
+    students = [account.generate_account()[0] for _ in range(10)]
+
+    results = blockchain.deliver_credentials_batch(
+        institution_key, [(key, 6000 + i) for i, key in enumerate(students)]
+    )
+
+    assert [r.asset_id for r in results] == list(range(6000, 6010))
+    assert all(r.ok for r in results)
+    assert len(chain.sent_groups) == 10
@@ -0,0 +1,103 @@
+import base64
+
+from algosdk import account
+from algosdk.logic import get_application_address
+
+from backend.credential_index import CredentialIndex
+from backend.events import (
+    CREDENTIAL_ISSUED,
+    CREDENTIAL_REVOKED,
+    EVENT_TYPES,
+    decode_logs,
+    event_selector,
+    issued_asset_ids,
+)
+from backend.follower import IndexSink, extract_changes
+from backend.registry import ARC19_TEMPLATE_URL
+from tests.blocks import asset_creation, block_address, reconfigure, transfer
+
+APP_ID = 1234
+APP_ADDRESS = get_application_address(APP_ID)
+
+
+def event_log(name: str, asset_id: int, holder: str, serial: int = 0) -> str:
+    values = [asset_id, holder, list(b"\x01" * 32)]
+    if name == CREDENTIAL_ISSUED:
+        values.append(serial)
+    raw = event_selector(name) + EVENT_TYPES[name].encode(values)
+    return base64.b64encode(raw).decode()
+
+
+def test_selectors_match_the_contract_spec():
+    assert event_selector(CREDENTIAL_ISSUED).hex() == "a3551496"
+    assert event_selector(CREDENTIAL_REVOKED).hex() == "28676222"
+
+
+def test_decode_logs_skips_return_values():
+    _, holder = account.generate_account()
+    return_log = base64.b64encode(bytes.fromhex("151f7c75") + (5).to_bytes(8, "big")).decode()
+    logs = [event_log(CREDENTIAL_ISSUED, 5, holder, serial=9), return_log]
+
+    [event] = decode_logs(logs)
+
+    assert (event.name, event.asset_id, event.holder, event.document_hash, event.serial) == (
+        CREDENTIAL_ISSUED, 5, holder, b"\x01" * 32, 9
+    )
+    assert issued_asset_ids({"logs": logs}) == [5]
+
+
+def test_follower_reads_batch_issuance_and_revocation_from_events():
+    institution = block_address(account.generate_account()[1])
+    students = [account.generate_account()[1] for _ in range(2)]
+    creations = [asset_creation(APP_ID, s, f"Cert {i}") for i, s in enumerate(students)]
+    block = {
+        "txns": [
+            {
+                "txn": {"type": "appl", "snd": institution, "apid": APP_ID},
+                "dt": {"lg": [event_log(CREDENTIAL_ISSUED, 80 + i, s, serial=i) for i, s in enumerate(students)], "itx": creations},
+            },
+            {
+                "txn": {"type": "appl", "snd": institution, "apid": APP_ID},
+                "dt": {"lg": [event_log(CREDENTIAL_REVOKED, 81, students[1])]},
+            },
+        ]
+    }
+
+    changes = extract_changes(block, 10, APP_ID)
+    assert [(r.asset_id, r.name, r.reserve, r.creator, r.serial) for r in changes.issued] == [
+        (80, "Cert 0", students[0], APP_ADDRESS, 0),
+        (81, "Cert 1", students[1], APP_ADDRESS, 1),
+    ]
+    assert changes.revoked == [81]
+
+    index = CredentialIndex()
+    IndexSink(index).apply_changes(changes)
+    assert [index.get_record(a).revoked for a in (80, 81)] == [False, True]
+    assert index.get_record(81).serial == 1
+
+
+def test_follower_records_pool_credentials_when_assigned_not_when_minted():
+    institution = block_address(account.generate_account()[1])
+    student, metadata_reserve = (account.generate_account()[1] for _ in range(2))
+    blanks = [asset_creation(APP_ID, APP_ADDRESS, "Credential", asset_id=asset_id) for asset_id in (700, 701)]
+    for blank in blanks:
+        blank["txn"]["apar"]["au"] = ARC19_TEMPLATE_URL
+    mint_pool = {"txn": {"type": "appl", "snd": institution, "apid": APP_ID}, "dt": {"itx": blanks}}
+    assign = {
+        "txn": {"type": "appl", "snd": institution, "apid": APP_ID},
+        "dt": {
+            "lg": [event_log(CREDENTIAL_ISSUED, 700, student, serial=5)],
+            "itx": [reconfigure(700, manager=APP_ADDRESS, reserve=metadata_reserve), transfer(700, student)],
+        },
+    }
+
+    assert not extract_changes({"txns": [mint_pool]}, 10, APP_ID)
+
+    changes = extract_changes({"txns": [assign]}, 11, APP_ID)
+    assert [(r.asset_id, r.holder, r.serial, r.issue_round) for r in changes.issued] == [(700, student, 5, 11)]
+
+    index = CredentialIndex()
+    IndexSink(index).apply_changes(changes)
+    record = index.get_record(700)
+    assert (record.holder, record.reserve, record.serial, record.unit_name) == (student, metadata_reserve, 5, "CERT")
+    assert index.get_student_credentials(student) == [{"asset-id": 700, "amount": 1, "is-frozen": False}]
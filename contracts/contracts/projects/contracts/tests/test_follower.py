@@ -0,0 +1,68 @@
+from algosdk import account
+from algosdk.logic import get_application_address
+
+from backend.asset_cache import AssetParamsCache
+from backend.credential_index import CredentialIndex
+from backend.follower import BlockFollower, IndexSink, extract_changes
+from tests.blocks import asset_creation, block_address, issue_call, reconfigure, transfer
+
+APP_ID = 1234
+APP_ADDRESS = get_application_address(APP_ID)
+INSTITUTION, ALICE, BOB, NEW_MANAGER, STRANGER = (account.generate_account()[1] for _ in range(5))
+
+
+def test_extract_changes_finds_issuance_transfers_and_reconfigs():
+    stranger_creation = asset_creation(APP_ID, ALICE, "Fake", asset_id=90)
+    stranger_creation["txn"]["snd"] = block_address(STRANGER)
+    block = {
+        "txns": [
+            issue_call(APP_ID, INSTITUTION, 77, ALICE, "Diploma"),
+            transfer(77, ALICE),
+            transfer(77, BOB, amount=0),
+            reconfigure(55, manager=NEW_MANAGER),
+            stranger_creation,
+        ]
+    }
+
+    changes = extract_changes(block, 10, APP_ID)
+
+    assert [(r.asset_id, r.reserve, r.creator, r.manager) for r in changes.issued] == [
+        (77, ALICE, APP_ADDRESS, APP_ADDRESS)
+    ]
+    assert changes.transfers == [(77, ALICE)]
+    assert changes.reconfigured == {55: (NEW_MANAGER, None)}
+
+
+def test_extract_changes_counts_top_level_creations_by_known_creators():
+    creation = asset_creation(APP_ID, ALICE, "Diploma", asset_id=91)
+    creation["txn"]["snd"] = block_address(INSTITUTION)
+
+    changes = extract_changes({"txns": [creation]}, 10, APP_ID, creators=[INSTITUTION])
+
+    assert [(r.asset_id, r.creator, r.holder) for r in changes.issued] == [(91, INSTITUTION, INSTITUTION)]
+
+
+def test_follower_resumes_from_checkpoint(fake_algod, tmp_path):
+    db_path = str(tmp_path / "credentials.db")
+    start = fake_algod.round - 4
+    fake_algod.block_bodies[start + 1] = {"txns": [issue_call(APP_ID, INSTITUTION, 77, ALICE, "Diploma")]}
+    fake_algod.block_bodies[start + 2] = {"txns": [transfer(77, ALICE)]}
+    fake_algod.block_bodies[start + 3] = {"txns": [reconfigure(77, manager=APP_ADDRESS)]}
+    cache = AssetParamsCache()
+    cache.put(77, {"reserve": ALICE})
+
+    follower = BlockFollower(fake_algod, IndexSink(CredentialIndex(db_path)), APP_ID, start_round=start, asset_cache=cache)
+    assert follower.catch_up(max_rounds=2) == 2
+    assert follower.lag() == 3
+
+    # A new follower over the same database (e.g. after a crash) picks up where it stopped
+    resumed = BlockFollower(fake_algod, IndexSink(CredentialIndex(db_path)), APP_ID, asset_cache=cache)
+    assert resumed.next_round() == start + 2
+    assert resumed.catch_up() == 3
+    assert resumed.lag() == 0
+
+    index = CredentialIndex(db_path)
+    assert index.get_student_credentials(ALICE) == [{"asset-id": 77, "amount": 1, "is-frozen": False}]
+    assert index.get_record(77).reserve is None
+    assert cache.get(77) is None
+    assert fake_algod.calls["block_info"] == 5
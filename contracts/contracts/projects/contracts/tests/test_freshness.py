@@ -0,0 +1,33 @@
+from algosdk import account
+
+from backend import blockchain
+
+
+def test_reads_go_to_algod_while_indexer_is_behind_the_hint(chain, fake_indexer):
+    institution_key, institution = account.generate_account()
+    _, student = account.generate_account()
+    fake_indexer.round = 990
+
+    asset_id = blockchain.mint_credential_nft(institution_key, student, "BSc", "ipfs://cid")
+    minted_round = blockchain.last_write_round()
+    assert minted_round > fake_indexer.round
+    chain.assets[asset_id] = {"name": "BSc", "unit-name": "CERT", "creator": institution, "reserve": student}
+    chain.holdings[(student, asset_id)] = 1
+
+    assert blockchain.get_credential_details(asset_id, min_round=minted_round)["name"] == "BSc"
+    assert blockchain.holds_credential(student, asset_id, min_round=minted_round)
+    assert blockchain.get_credential_holder(asset_id, min_round=minted_round) == student
+    assert "asset_info" not in fake_indexer.calls
+    # The indexer is asked how far it got at most once per round
+    assert fake_indexer.calls["health"] == 1
+
+
+def test_reads_use_indexer_once_it_catches_up(chain, fake_indexer):
+    _, student = account.generate_account()
+    fake_indexer.add_asset(77, holder=student, name="MSc")
+    fake_indexer.round = 1010
+
+    assert blockchain.get_credential_details(77, min_round=1005)["name"] == "MSc"
+    assert blockchain.holds_credential(student, 77, min_round=1005)
+    assert "asset_info" not in chain.calls and "account_asset_info" not in chain.calls
+    assert blockchain.indexer_round.round == 1010
@@ -0,0 +1,72 @@
+import pytest
+from algosdk import account
+from algosdk.error import AlgodHTTPError
+
+from backend.events import CREDENTIAL_ISSUED, EVENT_TYPES, event_selector
+from backend.confirmation import ConfirmationTracker
+from backend.issuer_worker import ISSUE_ATTEMPTS, IssuerWorker, delegate_box_name, shard
+from backend.registry import credential_box_name
+
+APP_ID = 1234
+
+
+@pytest.fixture
+def tracker(fake_algod):
+    tracker = ConfirmationTracker(fake_algod)
+    yield tracker
+    tracker.stop()
+
+
+def issued_log(asset_id: int, holder: str) -> bytes:
+    return event_selector(CREDENTIAL_ISSUED) + EVENT_TYPES[CREDENTIAL_ISSUED].encode([asset_id, holder, b"\x00" * 32, asset_id])
+
+
+def test_shards_cover_every_record_once():
+    records = [(f"student-{i}", "BSc", "ipfs://cid") for i in range(10)]
+    shards = [list(shard(records, index, 3)) for index in range(3)]
+    assert sorted(sum(shards, [])) == sorted(records)
+    assert [len(s) for s in shards] == [4, 3, 3]
+
+
+def test_issue_adds_simulated_box_refs_and_stops_at_fee_budget(fake_algod, tracker):
+    delegate_key, delegate = account.generate_account()
+    _, student = account.generate_account()
+    fake_algod.simulated_boxes = [(APP_ID, credential_box_name(5000))]
+    fake_algod.app_call_logs = [[issued_log(5000, student)], [issued_log(5001, student)]]
+    worker = IssuerWorker(fake_algod, APP_ID, delegate_key, fee_budget=5000, confirmation_tracker=tracker)
+
+    results = worker.issue_many([(student, "BSc", "ipfs://a"), (student, "MSc", "ipfs://b"), (student, "PhD", "ipfs://c")])
+
+    assert [r.asset_id for r in results[:2]] == [5000, 5001]
+    assert "Fee budget exhausted" in results[2].error
+    assert worker.fees_spent == 4000
+    [call] = fake_algod.sent_groups[0]
+    assert call.transaction.sender == delegate
+    assert call.transaction.fee == 2000
+    assert [box.name for box in call.transaction.boxes] == [delegate_box_name(delegate), credential_box_name(5000)]
+    assert fake_algod.calls["simulate_transactions"] == 2
+
+
+def test_issue_simulates_again_when_the_asset_id_was_taken(fake_algod, tracker):
+    delegate_key, _ = account.generate_account()
+    _, student = account.generate_account()
+    stale = AlgodHTTPError(f"logic eval error: invalid Box reference 0x{credential_box_name(5000).hex()}", code=400)
+    fake_algod.send_errors = [stale]
+    fake_algod.simulated_boxes = [(APP_ID, credential_box_name(5001))]
+    fake_algod.app_call_logs = [[issued_log(5001, student)]]
+    worker = IssuerWorker(fake_algod, APP_ID, delegate_key, confirmation_tracker=tracker)
+
+    result = worker.issue(student, "BSc", "ipfs://a")
+
+    assert result.asset_id == 5001
+    assert fake_algod.calls["simulate_transactions"] == 2
+    assert worker.fees_spent == 2000
+
+    # Other rejections, and a race lost on every attempt, are not retried forever
+    fake_algod.send_errors = [AlgodHTTPError("Delegate quota exceeded", code=400)]
+    with pytest.raises(AlgodHTTPError, match="quota"):
+        worker.issue(student, "MSc", "ipfs://b")
+    fake_algod.send_errors = [stale] * ISSUE_ATTEMPTS
+    with pytest.raises(AlgodHTTPError, match="invalid Box reference"):
+        worker.issue(student, "PhD", "ipfs://c")
+    assert fake_algod.calls["simulate_transactions"] == 3 + ISSUE_ATTEMPTS
@@ -0,0 +1,42 @@
+import hashlib
+
+import pytest
+from algosdk import account
+
+from backend.merkle import MerkleTree, build_cohort, certificate_hash, verify_proof
+from backend.registry import COHORT_ANCHOR_TYPE, cohort_box_name, verify_cohort_membership
+
+
+def hashes(count: int) -> list[bytes]:
+    return [hashlib.sha256(str(i).encode()).digest() for i in range(count)]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13])
+def test_every_proof_verifies(count):
+    leaves = hashes(count)
+    tree = MerkleTree.build(leaves, chunk_size=4)
+
+    for index, proof in tree.iter_proofs():
+        assert verify_proof(leaves[index], index, count, proof, tree.root)
+
+
+def test_tampered_proofs_fail():
+    leaves = hashes(7)
+    tree = MerkleTree.build(leaves)
+    proof = tree.proof(6)
+
+    assert not verify_proof(leaves[5], 6, 7, proof, tree.root)
+    assert not verify_proof(leaves[6], 5, 7, proof, tree.root)
+    assert not verify_proof(leaves[6], 6, 7, proof + [leaves[0]], tree.root)
+    assert not verify_proof(leaves[6], 6, 7, proof, hashes(8)[7])
+
+
+def test_membership_is_checked_against_the_anchored_root(fake_algod):
+    roster = [(account.generate_account()[1], "MOOC 101", f"ipfs://cid{i}") for i in range(10)]
+    tree = build_cohort(roster)
+    fake_algod.boxes[(99, cohort_box_name(7))] = COHORT_ANCHOR_TYPE.encode([list(tree.root), tree.leaf_count, 1234])
+
+    cert_hash = certificate_hash(*roster[3])
+    assert verify_cohort_membership(fake_algod, 99, 7, cert_hash, 3, tree.proof(3))
+    assert not verify_cohort_membership(fake_algod, 99, 7, cert_hash, 4, tree.proof(4))
+    assert not verify_cohort_membership(fake_algod, 99, 8, cert_hash, 3, tree.proof(3))
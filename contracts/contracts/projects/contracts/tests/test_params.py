@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.params import SuggestedParamsProvider
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_params_are_reused_within_a_round(fake_algod):
+    clock = FakeClock()
+    provider = SuggestedParamsProvider(fake_algod, clock=clock)
+
+    first = provider.get()
+    first.fee = 99999
+    second = provider.get()
+
+    assert fake_algod.calls["suggested_params"] == 1
+    assert second.fee == 1000
+    assert provider.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_params_refresh_when_round_advances_or_ages_out(fake_algod):
+    clock = FakeClock()
+    provider = SuggestedParamsProvider(fake_algod, clock=clock)
+    provider.get()
+
+    fake_algod.round += 1
+    provider.observe_round(fake_algod.round)
+    assert provider.get().first == fake_algod.round
+
+    clock.now += provider.max_age
+    provider.get()
+    assert fake_algod.calls["suggested_params"] == 3
+
+
+def test_params_refresh_near_last_valid(fake_algod):
+    clock = FakeClock()
+    provider = SuggestedParamsProvider(
+        fake_algod, max_age=10_000, last_valid_margin=100, clock=clock
+    )
+    provider.get()
+
+    clock.now = 2.8 * 950
+    provider.get()
+    assert fake_algod.calls["suggested_params"] == 2
+
+
+def test_params_provider_is_thread_safe(fake_algod):
+    provider = SuggestedParamsProvider(fake_algod, max_age=60)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda _: provider.get(), range(500)))
+
+    assert fake_algod.calls["suggested_params"] == 1
+    assert provider.hits == 499
@@ -0,0 +1,18 @@
+from smart_contracts.profiler import SourceMap, approval_pcs, profile_trace, render_heatmap
+
+
+def test_profile_attributes_pcs_to_contract_lines():
+    source_map = SourceMap.load()
+    sha_pc = next(pc for pc, op in source_map.ops.items() if op == "sha256")
+    source_index, line = source_map.lines[sha_pc]
+    response = {"txn-groups": [{"txn-results": [{"exec-trace": {"approval-program-trace": [
+        {"pc": sha_pc}, {"pc": sha_pc}, {"pc": 10_000},
+    ]}}]}]}
+
+    profile = profile_trace(approval_pcs(response), source_map)
+
+    assert "op.sha256" in source_map.sources[source_index].read_text().splitlines()[line - 1]
+    assert profile.opcodes[(source_index, line)] == 2
+    assert profile.budget[(source_index, line)] == 70
+    assert profile.unmapped == 1
+    assert f"contract.py:{line}" in render_heatmap(profile, source_map)
@@ -0,0 +1,40 @@
+from algosdk import account
+
+from backend.registry import (
+    CREDENTIAL_RECORD_TYPE,
+    STUDENT_PAGE_IDS,
+    credential_box_name,
+    read_credential_record,
+    read_student_credential_count,
+    read_student_credentials,
+    student_page_box_name,
+)
+
+
+def test_read_credential_record_decodes_box(fake_algod):
+    _, holder = account.generate_account()
+    value = CREDENTIAL_RECORD_TYPE.encode([holder, list(b"\x07" * 32), 4321, 1, 0])
+    fake_algod.boxes[(99, credential_box_name(5000))] = value
+
+    record = read_credential_record(fake_algod, 99, 5000)
+
+    assert credential_box_name(5000) == b"c" + (5000).to_bytes(8, "big")
+    assert (record.holder, record.document_hash, record.issue_round) == (holder, b"\x07" * 32, 4321)
+    assert record.active
+    assert read_credential_record(fake_algod, 99, 5001) is None
+
+
+def test_read_student_credentials_reads_first_page_then_the_rest(fake_algod):
+    _, student = account.generate_account()
+    asset_ids = list(range(7000, 7130))
+    for page in range(2):
+        packed = b"".join(a.to_bytes(8, "big") for a in asset_ids[page * STUDENT_PAGE_IDS:(page + 1) * STUDENT_PAGE_IDS])
+        if page == 0:
+            # Page 0 starts with the student's total count
+            packed = len(asset_ids).to_bytes(8, "big") + packed
+        fake_algod.boxes[(99, student_page_box_name(student, page))] = packed
+
+    assert read_student_credentials(fake_algod, 99, student) == asset_ids
+    assert read_student_credential_count(fake_algod, 99, student) == len(asset_ids)
+    assert fake_algod.calls["application_box_by_name"] == 3
+    assert read_student_credentials(fake_algod, 99, account.generate_account()[1]) == []
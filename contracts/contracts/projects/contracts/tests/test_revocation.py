@@ -0,0 +1,17 @@
+from backend.revocation import REVOCATION_PAGE_BITS, REVOCATION_PAGE_BYTES, download_revocations, revocation_box_name
+
+
+def test_download_revocations_reads_each_page_once(fake_algod):
+    fake_algod.global_state[99] = {b"next_serial": 3 * REVOCATION_PAGE_BITS}
+    page = bytearray(REVOCATION_PAGE_BYTES)
+    page[0] = 0b1000_0001  # serials 8192 and 8199
+    fake_algod.boxes[(99, revocation_box_name(1))] = bytes(page)
+
+    bitmap = download_revocations(fake_algod, 99)
+
+    assert fake_algod.calls["application_box_by_name"] == 3
+    assert bitmap.is_revoked(REVOCATION_PAGE_BITS)
+    assert bitmap.is_revoked(REVOCATION_PAGE_BITS + 7)
+    assert not bitmap.is_revoked(REVOCATION_PAGE_BITS + 1)
+    assert not bitmap.is_revoked(5)
+    assert bitmap.revoked_count() == 2
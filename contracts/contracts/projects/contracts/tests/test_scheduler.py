@@ -0,0 +1,77 @@
+import pytest
+from algosdk.error import IndexerHTTPError
+
+from backend.scheduler import AdaptiveLimiter, RequestScheduler, RetryBudget
+from tests.scheduler_benchmark import benchmark
+
+
+def http_error(code: int) -> IndexerHTTPError:
+    error = IndexerHTTPError("error")
+    error.code = code
+    return error
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limiter_grows_additively_and_halves_once_per_round_trip():
+    clock = Clock()
+    limiter = AdaptiveLimiter(initial=4, clock=clock)
+    for _ in range(8):
+        limiter.on_success(0.1)
+    assert 5.5 < limiter.limit < 6
+
+    limit = limiter.limit
+    limiter.on_throttle()
+    limiter.on_throttle()
+    assert limiter.limit == limit / 2
+
+    clock.now += 1
+    limiter.on_throttle()
+    assert limiter.limit == limit / 4
+    limiter.on_success(5.0)
+    assert limiter.limit == limit / 4
+
+
+def test_scheduler_retries_throttled_calls_with_jittered_backoff():
+    sleeps = []
+    responses = [http_error(429), http_error(503), "ok"]
+
+    def flaky():
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    scheduler = RequestScheduler(sleep=sleeps.append, rng=lambda: 0.5)
+    assert scheduler.call(flaky) == "ok"
+    assert sleeps == [0.05, 0.1]
+    assert (scheduler.throttled, scheduler.retries) == (1, 2)
+
+
+def test_scheduler_stops_retrying_when_the_budget_is_spent():
+    clock = Clock()
+    scheduler = RequestScheduler(retry_budget=RetryBudget(reserve=2, clock=clock), sleep=lambda _: None)
+
+    def failing(code: int):
+        raise http_error(code)
+
+    with pytest.raises(IndexerHTTPError):
+        scheduler.call(failing, 429)
+    assert scheduler.retries == 2
+
+    clock.now += 10
+    with pytest.raises(IndexerHTTPError):
+        scheduler.call(failing, 404)
+    assert scheduler.retries == 2
+
+
+def test_throughput_tracks_a_throttling_node():
+    result = benchmark(requests=120, rate_limit=200, latency=0.01)
+    assert result["requests_per_second"] <= 200 * 1.2
+    assert result["throttled"] == result["retries"]
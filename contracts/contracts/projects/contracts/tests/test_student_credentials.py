@@ -0,0 +1,95 @@
+import time
+
+from backend import blockchain
+
+
+def test_student_credentials_walk_every_page(chain, fake_indexer):
+    for asset_id in range(1, 36):
+        fake_indexer.add_asset(asset_id, holder="STUDENT", amount=0 if asset_id % 7 == 0 else 1)
+
+    credentials = blockchain.get_student_credentials("STUDENT", page_size=10)
+
+    assert fake_indexer.calls["lookup_account_assets"] == 4
+    assert len(credentials) == 30
+    assert 7 not in {c["asset-id"] for c in credentials}
+
+
+def test_iter_student_credentials_prefetches_and_filters_unit_name(chain, fake_indexer):
+    for asset_id in range(1, 26):
+        unit = "CERT" if asset_id % 2 else "OTHER"
+        fake_indexer.add_asset(asset_id, holder="STUDENT", **{"unit-name": unit})
+
+    stream = blockchain.iter_student_credentials("STUDENT", unit_name="CERT", page_size=10)
+    first = next(stream)
+    # The second page is fetched while the first is still being consumed
+    deadline = time.monotonic() + 5
+    while fake_indexer.calls["lookup_account_assets"] < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert fake_indexer.calls["lookup_account_assets"] == 2
+
+    ids = [first["asset-id"]] + [h["asset-id"] for h in stream]
+    assert ids == list(range(1, 26, 2))
+    assert fake_indexer.calls["lookup_account_assets"] == 3
+
+
+def test_student_credentials_come_from_algod_with_params_in_one_call(chain, fake_indexer):
+    chain.account_assets_endpoint = True
+    for asset_id in range(1, 21):
+        chain.assets[asset_id] = {"name": f"Certificate {asset_id}", "unit-name": "CERT" if asset_id % 2 else "OTHER"}
+        chain.holdings[("STUDENT", asset_id)] = 0 if asset_id == 5 else 1
+    # Destroyed asset: algod has the holding but no params
+    chain.holdings[("STUDENT", 99)] = 1
+    fake_indexer.add_asset(99, **{"unit-name": "CERT"})
+
+    credentials = blockchain.get_student_credentials("STUDENT", unit_name="CERT")
+
+    assert [c["asset-id"] for c in credentials] == [1, 3, 7, 9, 11, 13, 15, 17, 19, 99]
+    assert credentials[0]["params"]["name"] == "Certificate 1"
+    assert chain.calls["account_assets_info"] == 1
+    assert fake_indexer.calls == {"asset_info": 1}
+    assert blockchain.credential_cache.get(3)["name"] == "Certificate 3"
+
+
+def test_student_credentials_prefer_a_caught_up_local_index(chain, fake_indexer, monkeypatch):
+    from backend.credential_index import CredentialIndex, CredentialRecord
+    from backend.follower import DEFAULT_CHECKPOINT_NAME
+
+    index = CredentialIndex()
+    index.upsert_credentials([
+        CredentialRecord(asset_id=4, creator="APP", name="BSc", unit_name="CERT", holder="STUDENT"),
+    ])
+    index.set_checkpoint(DEFAULT_CHECKPOINT_NAME, 1200)
+    monkeypatch.setattr(blockchain, "credential_index", index)
+    chain.account_assets_endpoint = True
+
+    credentials = blockchain.get_student_credentials("STUDENT", unit_name="CERT", min_round=1100)
+    assert [(c["asset-id"], c["params"]["name"]) for c in credentials] == [(4, "BSc")]
+    assert "account_assets_info" not in chain.calls
+
+    # Behind the hint: fall through to algod
+    assert blockchain.get_student_credentials("STUDENT", unit_name="CERT", min_round=1300) == []
+    assert chain.calls["account_assets_info"] == 1
+
+
+def test_stale_local_index_is_skipped_without_a_hint(chain, fake_indexer, monkeypatch):
+    from backend.credential_index import CredentialIndex, CredentialRecord
+    from backend.follower import DEFAULT_CHECKPOINT_NAME
+
+    index = CredentialIndex()
+    index.upsert_credentials([
+        CredentialRecord(asset_id=4, creator="APP", name="BSc", unit_name="CERT", holder="STUDENT"),
+    ])
+    monkeypatch.setattr(blockchain, "credential_index", index)
+    # No writes from this process to wait for
+    monkeypatch.setattr(blockchain, "_last_write_round", 0)
+    chain.account_assets_endpoint = True
+
+    # Within LOCAL_INDEX_MAX_LAG of the node's round (1000): answered locally
+    index.set_checkpoint(DEFAULT_CHECKPOINT_NAME, 1000 - blockchain.LOCAL_INDEX_MAX_LAG)
+    assert [c["asset-id"] for c in blockchain.get_student_credentials("STUDENT", unit_name="CERT")] == [4]
+    assert "account_assets_info" not in chain.calls
+
+    # The follower stopped long ago: fall through to algod
+    index.set_checkpoint(DEFAULT_CHECKPOINT_NAME, 900)
+    assert blockchain.get_student_credentials("STUDENT", unit_name="CERT") == []
+    assert chain.calls["account_assets_info"] == 1
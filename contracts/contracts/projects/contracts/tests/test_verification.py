@@ -0,0 +1,101 @@
+import threading
+import time
+
+from backend.verification import SingleFlight, VerificationEngine
+
+
+def test_verify_many_checks_creator_and_unit_name(chain, fake_indexer):
+    fake_indexer.add_asset(1, holder="ALICE", creator="APP", url="ipfs://a")
+    fake_indexer.add_asset(2, holder="BOB", creator="MALLORY")
+    fake_indexer.add_asset(3, holder="CAROL", creator="APP", **{"unit-name": "FAKE"})
+    engine = VerificationEngine(["APP", "INSTITUTION"], max_concurrency=4)
+
+    results = engine.verify_many([1, 2, 3, 404, 1])
+
+    assert [r.asset_id for r in results] == [1, 2, 3, 404, 1]
+    assert [r.valid for r in results] == [True, False, False, False, True]
+    assert (results[0].holder, results[0].metadata_url) == ("ALICE", "ipfs://a")
+    assert [r.reason for r in results[1:3]] == ["untrusted creator", "not a credential asset"]
+    assert results[3].reason == "asset not found"
+    assert fake_indexer.calls["asset_info"] == 4
+    engine.close()
+
+
+def test_unknown_asset_is_not_found_but_outages_are_lookup_failures(chain, fake_indexer, monkeypatch):
+    from backend import blockchain
+    from backend.clients import make_indexer_client
+    from tests.standin import StandinNode
+
+    engine = VerificationEngine(["APP"], max_concurrency=2)
+    with StandinNode() as node:
+        # The pooled client's errors carry the HTTP status
+        monkeypatch.setattr(blockchain, "idx_client", make_indexer_client([node.address], token=""))
+        assert engine.verify(404).reason == "asset not found"
+        assert blockchain.credential_cache.get(404) is None
+
+    def unavailable(asset_id, **kwargs):
+        raise ConnectionRefusedError("indexer down")
+
+    monkeypatch.setattr(blockchain.idx_client, "asset_info", unavailable)
+    result = engine.verify(405)
+    assert (result.valid, result.reason) == (None, "lookup failed: indexer down")
+    engine.close()
+
+
+def test_holder_lookup_failure_is_indeterminate(chain, fake_indexer, monkeypatch):
+    from backend import blockchain
+
+    fake_indexer.add_asset(1, holder="ALICE", creator="APP")
+    engine = VerificationEngine(["APP"], max_concurrency=2)
+
+    def unavailable(asset_id, **kwargs):
+        raise TimeoutError("indexer timed out")
+
+    monkeypatch.setattr(blockchain.idx_client, "asset_balances", unavailable)
+    result = engine.verify(1)
+    assert (result.valid, result.reason) == (None, "holder lookup failed: indexer timed out")
+    engine.close()
+
+
+def test_single_flight_coalesces_concurrent_calls():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow_lookup():
+        calls.append(1)
+        release.wait()
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do(7, slow_lookup))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while flight.coalesced < 4:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ["result"] * 5
+
+
+def test_revoked_credentials_fail_without_a_holder_lookup(chain, fake_indexer):
+    from backend.credential_index import CredentialIndex, CredentialRecord
+    from backend.revocation import RevocationBitmap
+
+    for asset_id in (1, 2, 3):
+        fake_indexer.add_asset(asset_id, holder="ALICE", creator="APP")
+    index = CredentialIndex()
+    index.upsert_credentials([CredentialRecord(asset_id=a, creator="APP", serial=a) for a in (1, 2, 3)])
+    # The follower saw asset 3's CredentialRevoked event; serial 2 is set in the bitmap
+    index.mark_revoked([3])
+    revocations = RevocationBitmap({0: b"\x20" + bytes(1023)}, serial_count=4)
+    engine = VerificationEngine(["APP"], index=index, revocations=revocations)
+
+    results = engine.verify_many([1, 2, 3])
+
+    assert [(r.valid, r.reason) for r in results] == [(True, None), (False, "revoked"), (False, "revoked")]
+    assert fake_indexer.calls["asset_balances"] == 1
+    engine.close()
@@ -28,28 +28,94 @@ const methodSelectors = {
   'verify_credential(uint64)string': [0x30, 0x6a, 0x2f, 0x53]
 };
 
+// ARC-28 CredentialIssued(uint64,address,byte[32],uint64) event selector
+const CREDENTIAL_ISSUED_SELECTOR = [0xa3, 0x55, 0x14, 0x96];
+
 const getMethodSelector = (methodSignature) => {
   return new Uint8Array(methodSelectors[methodSignature] || [0, 0, 0, 0]);
 };
 
 const encodeArc4String = (str) => {
   const strBytes = encodeString(str);
-  const length = new Uint8Array(8);
+  // ARC-4 strings carry a uint16 length prefix
   const len = strBytes.length;
-  length[0] = (len >> 56) & 0xff;
-  length[1] = (len >> 48) & 0xff;
-  length[2] = (len >> 40) & 0xff;
-  length[3] = (len >> 32) & 0xff;
-  length[4] = (len >> 24) & 0xff;
-  length[5] = (len >> 16) & 0xff;
-  length[6] = (len >> 8) & 0xff;
-  length[7] = len & 0xff;
-  const result = new Uint8Array(8 + strBytes.length);
-  result.set(length, 0);
-  result.set(strBytes, 8);
+  const result = new Uint8Array(2 + len);
+  result[0] = (len >> 8) & 0xff;
+  result[1] = len & 0xff;
+  result.set(strBytes, 2);
   return result;
 };
 
+const concatBytes = (...parts) => {
+  const result = new Uint8Array(parts.reduce((total, part) => total + part.length, 0));
+  let offset = 0;
+  for (const part of parts) {
+    result.set(part, offset);
+    offset += part.length;
+  }
+  return result;
+};
+
+// Logs arrive base64-encoded from REST responses and as bytes from typed SDK models
+const logBytes = (log) => (
+  typeof log === 'string' ? new Uint8Array(atob(log).split('').map(c => c.charCodeAt(0))) : log
+);
+
+// ARC-4 prefix on the log entry carrying an ABI method's return value
+const ABI_RETURN_PREFIX = [0x15, 0x1f, 0x7c, 0x75];
+
+const abiReturn = (logs) => {
+  for (const log of [...(logs || [])].reverse()) {
+    const decoded = logBytes(log);
+    if (ABI_RETURN_PREFIX.every((byte, i) => decoded[i] === byte)) {
+      return decoded.slice(4);
+    }
+  }
+  return null;
+};
+
+// Registry record boxes are named 'c' + the uint64 asset ID (see contract.py)
+const credentialBoxName = (assetId) => concatBytes(encodeString('c'), algosdk.encodeUint64(assetId));
+
+// An issuance's record box is named after the asset ID the call is about to
+// create; if another creation takes that ID first the call fails on the box
+// reference and is simulated and signed again
+const ISSUE_ATTEMPTS = 3;
+const isStaleBoxReference = (error) => /invalid box reference|unavailable box/i.test(error.message || '');
+
+// The outer call pays the fee of every inner transaction it sends (fee pooling)
+const withInnerFees = (params, innerTxns) => ({
+  ...params,
+  flatFee: true,
+  fee: BigInt(params.minFee) * BigInt(1 + innerTxns),
+});
+
+const simulateUnsigned = async (txn, allowUnnamedResources = false) => {
+  const request = new algosdk.modelsv2.SimulateRequest({
+    txnGroups: [
+      new algosdk.modelsv2.SimulateRequestTransactionGroup({
+        txns: [new algosdk.SignedTransaction({ txn })],
+      }),
+    ],
+    allowEmptySignatures: true,
+    allowUnnamedResources,
+  });
+  const response = await client.simulateTransactions(request).do();
+  const group = response.txnGroups[0];
+  if (group.failureMessage) {
+    throw new Error(group.failureMessage);
+  }
+  return group;
+};
+
+// Box references a simulated group needed but did not declare
+const simulatedBoxes = (group) => {
+  const accessed = [group.unnamedResourcesAccessed, ...group.txnResults.map(r => r.unnamedResourcesAccessed)];
+  return accessed
+    .flatMap(resources => (resources && resources.boxes) || [])
+    .map(box => ({ appIndex: box.app, name: box.name }));
+};
+
 export const getAppAddress = () => APP_ADDRESS;
 
 export const getAppId = () => APP_ID;
@@ -134,66 +200,73 @@ export const issueCredential = async (
       }
     }
 
-    // Create transaction with full error handling
-    let txn;
-    try {
-      txn = algosdk.makeApplicationNoOpTxnFromObject({
-        sender: issuerAddress,
-        appIndex: APP_ID,
-        appArgs: appArgs,
-        suggestedParams: params,
-      });
-    } catch (error) {
-      throw new Error('Failed to construct transaction: ' + error.message);
-    }
+    const buildIssueTxn = (boxes) => algosdk.makeApplicationNoOpTxnFromObject({
+      sender: issuerAddress,
+      appIndex: APP_ID,
+      appArgs: appArgs,
+      suggestedParams: withInnerFees(params, 1),
+      boxes,
+    });
+
+    let txId;
+    for (let attempt = 1; ; attempt++) {
+      // Create transaction with full error handling; its box references
+      // (record, student index and any delegate box) come from simulating it
+      let txn;
+      try {
+        const group = await simulateUnsigned(buildIssueTxn([]), true);
+        txn = buildIssueTxn(simulatedBoxes(group));
+      } catch (error) {
+        throw new Error('Failed to construct transaction: ' + error.message);
+      }
 
-    // Encode transaction
-    let encodedTxn;
-    try {
-      encodedTxn = algosdk.encodeUnsignedTransaction(txn);
-      if (!encodedTxn || !(encodedTxn instanceof Uint8Array)) {
-        throw new Error('Failed to encode transaction properly');
+      // Encode transaction
+      let encodedTxn;
+      try {
+        encodedTxn = algosdk.encodeUnsignedTransaction(txn);
+        if (!encodedTxn || !(encodedTxn instanceof Uint8Array)) {
+          throw new Error('Failed to encode transaction properly');
+        }
+      } catch (error) {
+        throw new Error('Failed to encode transaction: ' + error.message);
       }
-    } catch (error) {
-      throw new Error('Failed to encode transaction: ' + error.message);
-    }
 
-    // Sign and send transaction
-    const signedTxns = await signTransactions([encodedTxn]);
-    if (!signedTxns || signedTxns.length === 0) {
-      throw new Error('Transaction signing failed');
-    }
+      // Sign and send transaction
+      const signedTxns = await signTransactions([encodedTxn]);
+      if (!signedTxns || signedTxns.length === 0) {
+        throw new Error('Transaction signing failed');
+      }
 
-    const { txId } = await client.sendRawTransaction(signedTxns[0]).do();
+      try {
+        const response = await client.sendRawTransaction(signedTxns[0]).do();
+        txId = response.txid || response.txId;
+        break;
+      } catch (error) {
+        if (attempt >= ISSUE_ATTEMPTS || !isStaleBoxReference(error)) {
+          throw error;
+        }
+      }
+    }
 
     const result = await algosdk.waitForConfirmation(client, txId, 4);
 
     let assetId = null;
     
-    if (result['inner-txns']) {
-      for (const innerTxn of result['inner-txns']) {
-        if (innerTxn['asset-index']) {
-          assetId = innerTxn['asset-index'];
-          break;
-        }
+    for (const innerTxn of result.innerTxns || result['inner-txns'] || []) {
+      const assetIndex = innerTxn.assetIndex || innerTxn['asset-index'];
+      if (assetIndex) {
+        assetId = bigIntToNumber(assetIndex);
+        break;
       }
     }
 
     if (!assetId) {
-      const logs = result.logs || [];
-      for (const log of logs) {
-        try {
-          const decoded = new Uint8Array(
-            atob(log).split('').map(c => c.charCodeAt(0))
-          );
-          if (decoded.length >= 8) {
-            assetId = bigIntToNumber(
-              algosdk.bytesToBigInt(decoded.slice(-8))
-            );
-            if (assetId > 0 && assetId < 1e15) break;
-          }
-        } catch (e) {
-          continue;
+      // The CredentialIssued event starts with the asset ID
+      for (const log of result.logs || []) {
+        const decoded = logBytes(log);
+        if (CREDENTIAL_ISSUED_SELECTOR.every((byte, i) => decoded[i] === byte)) {
+          assetId = bigIntToNumber(algosdk.bytesToBigInt(decoded.slice(4, 12)));
+          break;
         }
       }
     }
@@ -263,7 +336,7 @@ export const verifyCredential = async (assetId) => {
       }
     }
 
-    // Create and encode transaction
+    // Create transaction; the registry record box is its only resource
     let txn;
     try {
       txn = algosdk.makeApplicationNoOpTxnFromObject({
@@ -271,33 +344,18 @@ export const verifyCredential = async (assetId) => {
         appIndex: APP_ID,
         appArgs: appArgs,
         suggestedParams: params,
+        boxes: [{ appIndex: APP_ID, name: credentialBoxName(assetId) }],
       });
     } catch (error) {
       throw new Error('Failed to construct transaction: ' + error.message);
     }
 
-    let encodedTxn;
-    try {
-      encodedTxn = algosdk.encodeUnsignedTransaction(txn);
-      if (!encodedTxn || !(encodedTxn instanceof Uint8Array)) {
-        throw new Error('Failed to encode transaction properly');
-      }
-    } catch (error) {
-      throw new Error('Failed to encode transaction: ' + error.message);
-    }
-    
-    const response = await client.pendingTransactionInformation(encodedTxn).do();
-    const logs = response.logs || [];
-    
-    for (const log of logs) {
-      try {
-        const decoded = atob(log);
-        if (decoded.includes('Verified') || decoded.includes('Invalid')) {
-          return decoded;
-        }
-      } catch (e) {
-        continue;
-      }
+    // Read-only: simulated, never signed or sent
+    const group = await simulateUnsigned(txn);
+    const returned = abiReturn(group.txnResults[0].txnResult.logs);
+    if (returned) {
+      // ARC-4 string: uint16 length, then the bytes
+      return decodeString(returned.slice(2, 2 + ((returned[0] << 8) | returned[1])));
     }
     
     return 'Unknown';